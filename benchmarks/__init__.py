@@ -0,0 +1 @@
+# This file can be empty - it just marks the directory as a Python package
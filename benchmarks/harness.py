@@ -0,0 +1,77 @@
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PERCENTILES = (50, 90, 95, 99)
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    rank = max(1, math.ceil(pct / 100 * len(samples)))
+    return samples[rank - 1]
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Timing statistics in milliseconds"""
+    ordered = sorted(s * 1000 for s in samples)
+    summary = {
+        'n': len(ordered),
+        'min_ms': round(ordered[0], 3),
+        'mean_ms': round(sum(ordered) / len(ordered), 3),
+        'max_ms': round(ordered[-1], 3),
+    }
+    for pct in PERCENTILES:
+        summary[f'p{pct}_ms'] = round(percentile(ordered, pct), 3)
+    return summary
+
+def time_case(fn: Callable[[int], Any], repeat: int, warmup: int = 1) -> Dict[str, float]:
+    """Run fn(iteration) `repeat` times after `warmup` untimed runs"""
+    for i in range(warmup):
+        fn(i)
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(warmup + i)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float,
+            metric: str = 'p50_ms', min_delta_ms: float = 0.5) -> List[str]:
+    """Cases slower than the baseline by more than `tolerance` (a fraction).
+
+    Differences under `min_delta_ms` are ignored so sub-millisecond cases do
+    not fail on timer noise. Cases missing from either side are skipped.
+    """
+    regressions = []
+    for size, cases in results['results'].items():
+        for name, stats in cases.items():
+            base = baseline.get('results', {}).get(size, {}).get(name)
+            if not base or metric not in base or metric not in stats:
+                continue
+            current, previous = stats[metric], base[metric]
+            if current > previous * (1 + tolerance) and current - previous > min_delta_ms:
+                regressions.append(
+                    f"{size}/{name}: {metric} {current:.3f} vs baseline {previous:.3f} "
+                    f"(+{(current / previous - 1) * 100 if previous else math.inf:.0f}%)"
+                )
+    return regressions
+
+def check_baseline(results: Dict[str, Any], baseline_path: Optional[Path],
+                   tolerance: float) -> List[str]:
+    """Regressions against the baseline file; none when there is no baseline
+    to check, but a baseline that was asked for has to exist"""
+    if baseline_path is None:
+        return []
+    if not baseline_path.exists():
+        raise FileNotFoundError(f"Baseline {baseline_path} does not exist "
+                                "(create it with --update-baseline)")
+    return compare(results, load_results(baseline_path), tolerance)
@@ -0,0 +1,290 @@
+"""Benchmarks for the DatabaseManager and view-loading hot paths.
+
+    python -m benchmarks.run --sizes 10000,50000 --output bench.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --update-baseline
+
+Each size is a contact count; policies and communications are generated at
+3x and 20x that, the ratio of production books. Databases are generated
+once per size and seed under --data-dir and reused. Writes run against a
+throwaway copy so every run starts from the same data.
+
+Results are JSON with percentiles per case. With --baseline (which must
+exist unless --update-baseline is creating it), any case whose median is
+more than --tolerance slower than the baseline is reported and the run
+exits with status 1.
+"""
+import argparse
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from database.connection_pool import init_pool, shutdown
+from database.db_manager import DatabaseManager, connect
+from database.generate_data import DATA_VERSION, generate
+from .harness import check_baseline, save_results, time_case
+
+DEFAULT_DATA_DIR = Path(__file__).parent / "data"
+SEARCH_TERMS = ["smith", "nguyen", "global logistics", "olga", "3434", "(555) 1"]
+
+def ensure_database(data_dir: Path, size: int, seed: int) -> Path:
+    """Path of the generated database for `size` contacts, generating it if needed"""
+    path = data_dir / f"crm_{size}_seed{seed}_v{DATA_VERSION}.db"
+    if path.exists():
+        return path
+    data_dir.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{partial}{suffix}").unlink(missing_ok=True)
+    print(f"Generating {path.name}...", file=sys.stderr)
+    conn = connect(partial)
+    db = DatabaseManager(conn)
+    try:
+        db.create_tables()
+        generate(db, size, size * 3, size * 20, seed=seed, workers=os.cpu_count() or 1)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        db.close()
+        conn.close()
+    partial.rename(path)
+    return path
+
+def copy_database(path: Path, target_dir: str) -> Path:
+    target = Path(target_dir) / path.name
+    source = sqlite3.connect(str(path))
+    destination = sqlite3.connect(str(target))
+    try:
+        source.backup(destination)
+    finally:
+        source.close()
+        destination.close()
+    return target
+
+def read_cases(db: DatabaseManager, contact_ids: List[int]) -> Dict[str, Callable[[int], Any]]:
+    def pick(i: int) -> int:
+        return contact_ids[i % len(contact_ids)]
+
+    return {
+        'get_contacts': lambda i: db.get_contacts(),
+        'get_contacts_search': lambda i: db.get_contacts(search_term=SEARCH_TERMS[i % len(SEARCH_TERMS)]),
+        'get_contacts_by_id': lambda i: db.get_contacts(contact_id=pick(i)),
+        'get_contacts_page': lambda i: db.get_contacts_page(),
+        'get_policies': lambda i: db.get_policies(),
+        'get_policies_by_contact': lambda i: db.get_policies(contact_id=pick(i)),
+        'get_communications': lambda i: db.get_communications(pick(i)),
+        # Contact 1 is the largest commercial account
+        'get_communications_largest': lambda i: db.get_communications(1),
+    }
+
+def write_cases(db: DatabaseManager, contact_ids: List[int]) -> Dict[str, Callable[[int], Any]]:
+    contacts = [db.get_contacts(contact_id=cid)[0] for cid in contact_ids]
+    policies = [p for cid in contact_ids for p in db.get_policies(contact_id=cid)][:len(contact_ids)]
+
+    def add_contact(i: int):
+        db.add_contact({
+            'contact_type': 'Individual', 'first_name': 'Bench', 'last_name': f"Mark{i}",
+            'email': f"bench{i}@example.com", 'phone': '(555) 010-0000'
+        })
+
+    def update_contact(i: int):
+        contact = dict(contacts[i % len(contacts)])
+        contact['notes'] = f"Benchmark update {i}"
+        db.update_contact(contact['id'], contact)
+
+    def add_policy(i: int):
+        db.add_policy({
+            'contact_id': contact_ids[i % len(contact_ids)], 'policy_type': 'Auto',
+            'policy_number': f"BENCH-{i}", 'carrier': 'GEICO', 'premium': 1000.0,
+            'start_date': '2024-01-01', 'renewal_date': '2025-01-01'
+        })
+
+    def update_policy(i: int):
+        policy = dict(policies[i % len(policies)])
+        policy['premium'] = 1000.0 + i
+        db.update_policy(policy['id'], policy)
+
+    def add_communication(i: int):
+        db.add_communication({
+            'contact_id': contact_ids[i % len(contact_ids)], 'comm_type': 'Email',
+            'comm_date': datetime.now(timezone.utc).isoformat(), 'details': f"Benchmark {i}"
+        })
+
+    return {
+        'add_contact': add_contact,
+        'update_contact': update_contact,
+        'add_policy': add_policy,
+        'update_policy': update_policy,
+        'add_communication': add_communication,
+    }
+
+def format_cases(db: DatabaseManager) -> Dict[str, Callable[[int], Any]]:
+    """Date formatting of the largest communication history, as the dialogs do it"""
+    try:
+        import pytz
+        from utils import datetime_helpers
+        from utils.config import ConfigManager
+    except ImportError as e:
+        print(f"Skipping formatting benchmarks: {e}", file=sys.stderr)
+        return {}
+
+    comm_dates = [comm['comm_date'] for comm in db.get_communications(1)]
+    config = ConfigManager()
+    local_tz = pytz.timezone(config.get('ui', 'timezone'))
+
+    def legacy_format_datetime(dt_str: str) -> str:
+        # The uncached per-row path the dialogs and models used to take
+        if not dt_str:
+            return ""
+        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+        if dt.tzinfo is None:
+            dt = pytz.UTC.localize(dt)
+        return dt.astimezone(local_tz).strftime(config.get('ui', 'datetime_format'))
+
+    def batch_cold(i: int):
+        datetime_helpers.reload_settings()
+        return datetime_helpers.format_datetimes(comm_dates)
+
+    return {
+        'format_datetime_legacy': lambda i: [legacy_format_datetime(value) for value in comm_dates],
+        'format_datetimes_cold': batch_cold,
+        'format_datetimes_warm': lambda i: datetime_helpers.format_datetimes(comm_dates),
+    }
+
+def view_cases(db_path: Path, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Time view loads on the offscreen Qt platform; skipped without PyQt6"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtCore import QEventLoop
+        from PyQt6.QtWidgets import QApplication
+        from ui.contacts_view import ContactsView
+        from ui.policies_view import PoliciesView
+        from ui.query_executor import get_executor, shutdown_executor
+    except ImportError as e:
+        print(f"Skipping view benchmarks: {e}", file=sys.stderr)
+        return {}
+
+    app = QApplication.instance() or QApplication([])
+    init_pool(db_path)
+    executor = get_executor()
+
+    def wait_until_loaded():
+        while executor.is_busy():
+            app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 50)
+        # Let the view lay out and paint what arrived
+        app.processEvents()
+
+    contacts_view = ContactsView()
+    policies_view = PoliciesView()
+    try:
+        contacts_view.show()
+        policies_view.show()
+        wait_until_loaded()
+        return {
+            'contacts_view_load': time_case(
+                lambda i: (contacts_view.load_contacts(), wait_until_loaded()), repeat),
+            'policies_view_load': time_case(
+                lambda i: (policies_view.load_policies(), wait_until_loaded()), repeat),
+        }
+    finally:
+        contacts_view.close()
+        policies_view.close()
+        contacts_view.deleteLater()
+        policies_view.deleteLater()
+        app.processEvents()
+        shutdown_executor()
+        shutdown()
+
+def run_size(path: Path, size: int, seed: int, repeat: int, include_views: bool) -> Dict[str, Dict[str, float]]:
+    contact_ids = random.Random(seed).sample(range(1, size + 1), min(size, 50))
+    results = {}
+    conn = connect(path)
+    db = DatabaseManager(conn)
+    try:
+        for name, fn in read_cases(db, contact_ids).items():
+            results[name] = time_case(fn, repeat)
+        for name, fn in format_cases(db).items():
+            results[name] = time_case(fn, repeat)
+    finally:
+        db.close()
+        conn.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = connect(copy_database(path, tmp))
+        db = DatabaseManager(conn)
+        try:
+            for name, fn in write_cases(db, contact_ids).items():
+                results[name] = time_case(fn, repeat)
+        finally:
+            db.close()
+            conn.close()
+
+    if include_views:
+        results.update(view_cases(path, repeat))
+    return results
+
+def print_summary(results: Dict[str, Any]) -> None:
+    for size, cases in results['results'].items():
+        print(f"\n{size} contacts")
+        for name, stats in cases.items():
+            print(f"  {name:<30} p50 {stats['p50_ms']:>10.3f} ms   p95 {stats['p95_ms']:>10.3f} ms")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark database and view hot paths")
+    parser.add_argument("--sizes", default="10000,50000",
+                        help="comma-separated contact counts of the generated databases")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="baseline results JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the new baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown of a case's median, as a fraction")
+    parser.add_argument("--no-views", action="store_true", help="skip the Qt view benchmarks")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    if args.update_baseline and args.baseline is None:
+        parser.error("--update-baseline needs --baseline")
+    # Checked before the run, which takes minutes, rather than after it
+    if args.baseline is not None and not args.update_baseline and not args.baseline.exists():
+        parser.error(f"baseline {args.baseline} does not exist (create it with --update-baseline)")
+
+    results = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'results': {},
+    }
+    for size in sizes:
+        path = ensure_database(args.data_dir, size, args.seed)
+        results['results'][str(size)] = run_size(path, size, args.seed, args.repeat, not args.no_views)
+
+    print_summary(results)
+    if args.output:
+        save_results(results, args.output)
+    if args.update_baseline:
+        save_results(results, args.baseline)
+        return 0
+
+    regressions = check_baseline(results, args.baseline, args.tolerance)
+    if regressions:
+        print("\nPERFORMANCE REGRESSION against " + str(args.baseline), file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
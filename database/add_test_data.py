@@ -1,13 +1,8 @@
 import random
 from datetime import datetime, timedelta
-from .db_manager import DatabaseManager
+from .db_manager import DatabaseManager, database_settings
 import os
 
-# Remove existing database if it exists
-db_path = os.path.join(os.path.dirname(__file__), "..", "insurance_crm.db")
-if os.path.exists(db_path):
-    os.remove(db_path)
-
 # Sample data
 INDIVIDUAL_NAMES = [
     ("John", "Smith"), ("Mary", "Johnson"), ("Robert", "Williams"),
@@ -76,104 +71,119 @@ def random_date(start_date, end_date):
     random_days = random.randrange(days_between)
     return start_date + timedelta(days=random_days)
 
+def remove_database():
+    """Remove the existing database if it exists, along with its WAL files"""
+    db_path = database_settings()['path']
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
 def main():
+    remove_database()
     db = DatabaseManager()
-    
-    # Generate individual contacts
-    for first_name, last_name in INDIVIDUAL_NAMES:
-        contact_data = {
-            'contact_type': 'Individual',
-            'first_name': first_name,
-            'last_name': last_name,
-            'email': generate_email(first_name, last_name),
-            'phone': generate_phone(),
-            'mobile_phone': generate_phone() if random.random() > 0.5 else '',
-            'address': generate_address(),
-            'status': random.choice(['Active', 'Active', 'Active', 'Inactive', 'Lead']),
-            'notes': "Individual client"
-        }
-        contact_id = db.add_contact(contact_data)
-        
-        # Add 1-3 policies for each individual
-        for _ in range(random.randint(1, 3)):
-            carrier = random.choice(CARRIERS)
-            start_date = random_date(
-                datetime.now() - timedelta(days=365*2),
-                datetime.now() - timedelta(days=30)
-            )
-            renewal_date = start_date + timedelta(days=365)
-            
-            policy_data = {
-                'contact_id': contact_id,
-                'policy_type': random.choice(['Auto', 'Home', 'Life', 'Umbrella']),
-                'policy_number': generate_policy_number(carrier),
-                'carrier': carrier,
-                'premium': round(random.uniform(500, 5000), 2),
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'renewal_date': renewal_date.strftime('%Y-%m-%d'),
-                'notes': "Sample policy"
-            }
-            db.add_policy(policy_data)
-    
-    # Generate company contacts
-    for idx, company in enumerate(COMPANIES):
-        first_name, last_name = COMPANY_CONTACTS[idx]
-        contact_data = {
-            'contact_type': 'Company',
-            'company_name': company,
-            'first_name': first_name,
-            'last_name': last_name,
-            'title': random.choice(TITLES),
-            'email': generate_email(first_name, last_name),
-            'phone': generate_phone(),
-            'mobile_phone': generate_phone(),
-            'address': generate_address(),
-            'status': random.choice(['Active', 'Active', 'Active', 'Inactive']),
-            'notes': "Corporate client"
-        }
-        contact_id = db.add_contact(contact_data)
-        
-        # Add 2-5 policies for each company
-        for _ in range(random.randint(2, 5)):
-            carrier = random.choice(CARRIERS)
-            start_date = random_date(
-                datetime.now() - timedelta(days=365*2),
-                datetime.now() - timedelta(days=30)
-            )
-            renewal_date = start_date + timedelta(days=365)
-            
-            policy_data = {
-                'contact_id': contact_id,
-                'policy_type': random.choice(['Business', 'Liability', 'Workers Comp', 'Property']),
-                'policy_number': generate_policy_number(carrier),
-                'carrier': carrier,
-                'premium': round(random.uniform(2000, 50000), 2),
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'renewal_date': renewal_date.strftime('%Y-%m-%d'),
-                'notes': "Corporate policy"
+    policies = []
+    communications = []
+
+    # One transaction for the whole data set instead of a commit per row
+    with db.transaction():
+        # Generate individual contacts
+        for first_name, last_name in INDIVIDUAL_NAMES:
+            contact_data = {
+                'contact_type': 'Individual',
+                'first_name': first_name,
+                'last_name': last_name,
+                'email': generate_email(first_name, last_name),
+                'phone': generate_phone(),
+                'mobile_phone': generate_phone() if random.random() > 0.5 else '',
+                'address': generate_address(),
+                'status': random.choice(['Active', 'Active', 'Active', 'Inactive', 'Lead']),
+                'notes': "Individual client"
             }
-            db.add_policy(policy_data)
-    
-    # Generate communications for all contacts
-    contacts = db.get_contacts()
-    for contact in contacts:
-        # Add 3-8 communications per contact
-        for _ in range(random.randint(3, 8)):
-            comm_date = random_date(
-                datetime.now() - timedelta(days=365),
-                datetime.now()
-            )
-            
-            comm_data = {
-                'contact_id': contact['id'],
-                'comm_type': random.choice([
-                    'Phone Call', 'Email', 'Face to Face',
-                    'Video Call', 'Text Message'
-                ]),
-                'comm_date': comm_date.isoformat(),
-                'details': random.choice(COMM_DETAILS)
+            contact_id = db.add_contact(contact_data)
+
+            # Add 1-3 policies for each individual
+            for _ in range(random.randint(1, 3)):
+                carrier = random.choice(CARRIERS)
+                start_date = random_date(
+                    datetime.now() - timedelta(days=365*2),
+                    datetime.now() - timedelta(days=30)
+                )
+                renewal_date = start_date + timedelta(days=365)
+
+                policy_data = {
+                    'contact_id': contact_id,
+                    'policy_type': random.choice(['Auto', 'Home', 'Life', 'Umbrella']),
+                    'policy_number': generate_policy_number(carrier),
+                    'carrier': carrier,
+                    'premium': round(random.uniform(500, 5000), 2),
+                    'start_date': start_date.strftime('%Y-%m-%d'),
+                    'renewal_date': renewal_date.strftime('%Y-%m-%d'),
+                    'notes': "Sample policy"
+                }
+                policies.append(policy_data)
+
+        # Generate company contacts
+        for idx, company in enumerate(COMPANIES):
+            first_name, last_name = COMPANY_CONTACTS[idx]
+            contact_data = {
+                'contact_type': 'Company',
+                'company_name': company,
+                'first_name': first_name,
+                'last_name': last_name,
+                'title': random.choice(TITLES),
+                'email': generate_email(first_name, last_name),
+                'phone': generate_phone(),
+                'mobile_phone': generate_phone(),
+                'address': generate_address(),
+                'status': random.choice(['Active', 'Active', 'Active', 'Inactive']),
+                'notes': "Corporate client"
             }
-            db.add_communication(comm_data)
+            contact_id = db.add_contact(contact_data)
+
+            # Add 2-5 policies for each company
+            for _ in range(random.randint(2, 5)):
+                carrier = random.choice(CARRIERS)
+                start_date = random_date(
+                    datetime.now() - timedelta(days=365*2),
+                    datetime.now() - timedelta(days=30)
+                )
+                renewal_date = start_date + timedelta(days=365)
+
+                policy_data = {
+                    'contact_id': contact_id,
+                    'policy_type': random.choice(['Business', 'Liability', 'Workers Comp', 'Property']),
+                    'policy_number': generate_policy_number(carrier),
+                    'carrier': carrier,
+                    'premium': round(random.uniform(2000, 50000), 2),
+                    'start_date': start_date.strftime('%Y-%m-%d'),
+                    'renewal_date': renewal_date.strftime('%Y-%m-%d'),
+                    'notes': "Corporate policy"
+                }
+                policies.append(policy_data)
+
+        # Generate communications for all contacts
+        contacts = db.get_contacts()
+        for contact in contacts:
+            # Add 3-8 communications per contact
+            for _ in range(random.randint(3, 8)):
+                comm_date = random_date(
+                    datetime.now() - timedelta(days=365),
+                    datetime.now()
+                )
+
+                comm_data = {
+                    'contact_id': contact['id'],
+                    'comm_type': random.choice([
+                        'Phone Call', 'Email', 'Face to Face',
+                        'Video Call', 'Text Message'
+                    ]),
+                    'comm_date': comm_date.isoformat(),
+                    'details': random.choice(COMM_DETAILS)
+                }
+                communications.append(comm_data)
+
+        db.add_policies_many(policies)
+        db.add_communications_many(communications)
 
 if __name__ == "__main__":
     main()
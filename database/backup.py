@@ -0,0 +1,182 @@
+"""Online backups with SQLite's backup API.
+
+A backup copies the database a few megabytes at a time from a connection
+holding a read transaction, so in WAL mode it reads one consistent
+snapshot while the GUI and writers carry on. Each copy is written as
+<name>.partial, checked with PRAGMA integrity_check and only then renamed
+to <db name>-<YYYYmmdd-HHMMSS>.db in database.backup_dir; the oldest are
+removed beyond database.backup_keep.
+"""
+import shutil
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from .db_manager import connect, database_settings
+from utils.exceptions import DatabaseError
+
+BACKUP_PAGES_PER_STEP = 1024
+# Pause between steps so other connections get the disk and the GIL
+BACKUP_STEP_PAUSE = 0.002
+TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+ProgressCallback = Callable[[int, int], None]
+
+def backup_time(path: Path, db_path: Path) -> Optional[datetime]:
+    """When a backup of db_path was taken, from its name; None if path is
+    not one"""
+    prefix = f"{db_path.stem}-"
+    if path.suffix != ".db" or not path.stem.startswith(prefix):
+        return None
+    try:
+        return datetime.strptime(path.stem[len(prefix):], TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+def list_backups(backup_dir: Path, db_path: Path) -> List[Path]:
+    """Completed backups of db_path in backup_dir, newest first"""
+    backups = [path for path in Path(backup_dir).glob(f"{db_path.stem}-*.db")
+               if backup_time(path, db_path) is not None]
+    return sorted(backups, reverse=True)
+
+def backup_due(settings: Optional[Dict[str, Any]] = None, now: Optional[datetime] = None) -> bool:
+    """Whether the newest backup is older than database.backup_interval_hours"""
+    settings = settings or database_settings()
+    hours = settings['backup_interval_hours']
+    if not hours:
+        return False
+    db_path = Path(settings['path'])
+    backups = list_backups(Path(settings['backup_dir']), db_path)
+    if not backups:
+        return True
+    newest = backup_time(backups[0], db_path)
+    return (now or datetime.now()) - newest >= timedelta(hours=hours)
+
+def verify_backup(path: Path) -> None:
+    """Raise DatabaseError unless path passes PRAGMA integrity_check"""
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            problems = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Could not check {path.name}: {str(e)}")
+    if problems != ['ok']:
+        raise DatabaseError(f"{path.name} failed its integrity check", "\n".join(problems[:20]))
+
+def _copy(source: sqlite3.Connection, target_path: Path,
+          progress: Optional[ProgressCallback]) -> None:
+    """Copy source into a new database at target_path, in page steps"""
+    def step(status: int, remaining: int, total: int):
+        if progress:
+            progress(total - remaining, total)
+        time.sleep(BACKUP_STEP_PAUSE)
+
+    target = sqlite3.connect(target_path)
+    try:
+        # A read transaction pins one snapshot; without it every commit by
+        # another connection would restart the copy
+        source.execute("BEGIN")
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        try:
+            source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=step)
+        finally:
+            source.rollback()
+        # The copy inherits WAL mode; a backup should be one self-contained file
+        target.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        target.close()
+
+def rotate_backups(backup_dir: Path, db_path: Path, keep: int) -> List[Path]:
+    """Delete all but the newest keep backups; returns the deleted files"""
+    removed = list_backups(backup_dir, db_path)[max(keep, 1):]
+    for path in removed:
+        path.unlink()
+    return removed
+
+def create_backup(db_path: Optional[Path] = None, backup_dir: Optional[Path] = None,
+                  settings: Optional[Dict[str, Any]] = None,
+                  progress: Optional[ProgressCallback] = None,
+                  prefix: Optional[str] = None) -> Path:
+    """Back up the database, verify the copy and rotate old backups.
+
+    progress(pages_done, pages_total) is called after every step. Returns
+    the new backup. prefix replaces the usual <db name>- file prefix; such
+    backups are left out of rotation.
+    """
+    settings = settings or database_settings()
+    db_path = Path(db_path or settings['path'])
+    backup_dir = Path(backup_dir or settings['backup_dir'])
+    if not db_path.exists():
+        raise DatabaseError(f"No database at {db_path}")
+
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    if shutil.disk_usage(backup_dir).free < db_path.stat().st_size:
+        raise DatabaseError(f"Not enough free space in {backup_dir} for a backup")
+    name = f"{prefix or db_path.stem + '-'}{datetime.now().strftime(TIMESTAMP_FORMAT)}.db"
+    final_path = backup_dir / name
+    partial_path = backup_dir / (name + ".partial")
+    partial_path.unlink(missing_ok=True)
+
+    try:
+        source = connect(db_path, settings)
+        try:
+            _copy(source, partial_path, progress)
+        finally:
+            source.close()
+        verify_backup(partial_path)
+    except sqlite3.Error as e:
+        partial_path.unlink(missing_ok=True)
+        raise DatabaseError(f"Backup failed: {str(e)}")
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    partial_path.replace(final_path)
+
+    if prefix is None:
+        rotate_backups(backup_dir, db_path, settings['backup_keep'])
+    return final_path
+
+def restore_backup(backup_path: Path, db_path: Optional[Path] = None,
+                   settings: Optional[Dict[str, Any]] = None,
+                   progress: Optional[ProgressCallback] = None) -> Optional[Path]:
+    """Replace the database's contents with a verified backup.
+
+    The current database is first saved as pre-restore-<timestamp>.db in
+    backup_dir, which is returned (None if there was no database yet). Run
+    it while the CRM is closed: other connections would block the restore
+    or keep reading stale data.
+    """
+    settings = settings or database_settings()
+    db_path = Path(db_path or settings['path'])
+    backup_path = Path(backup_path)
+    verify_backup(backup_path)
+
+    saved = None
+    if db_path.exists():
+        saved = create_backup(db_path, settings=settings, prefix="pre-restore-")
+    else:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def step(status: int, remaining: int, total: int):
+        if progress:
+            progress(total - remaining, total)
+
+    try:
+        source = sqlite3.connect(f"file:{backup_path}?mode=ro", uri=True)
+        try:
+            target = connect(db_path, settings)
+            try:
+                # Copied through the target's own pager, so its WAL and
+                # -shm file stay consistent
+                source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=step)
+            finally:
+                target.close()
+        finally:
+            source.close()
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Restore failed: {str(e)}"
+                            + (f"; the previous database is saved as {saved}" if saved else ""))
+    return saved
@@ -0,0 +1,178 @@
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from .db_manager import DatabaseManager, connect, database_settings
+from .instrumentation import query_stats
+from utils.exceptions import DatabaseError
+
+class ConnectionPool:
+    """Process-wide owner of the CRM's SQLite connections.
+
+    Hands out a single writer connection for the GUI thread and a small pool
+    of read-only connections that can be borrowed from any thread. The schema
+    is created once, on a short-lived connection of its own, the first time a
+    connection is needed; the writer is bound to the thread that opens it, so
+    it is only ever opened by writer() and never on behalf of a reader.
+
+    Path and pragmas come from config.json and are read once per pool.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, max_readers: int = 3):
+        self.settings = database_settings()
+        self.db_path = Path(db_path or self.settings['path'])
+        query_stats.configure(bool(self.settings['query_stats']), self.settings['slow_query_ms'])
+        self.max_readers = max_readers
+        self._lock = threading.Lock()
+        self._reader_available = threading.Condition(self._lock)
+        self._writer: Optional[sqlite3.Connection] = None
+        self._idle_readers: List[sqlite3.Connection] = []
+        self._reader_count = 0
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+        self._closed = False
+        self._stats = {'opened': 0, 'reused': 0, 'closed': 0}
+
+    def _open(self, **kwargs) -> sqlite3.Connection:
+        try:
+            conn = connect(self.db_path, self.settings, **kwargs)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to open database: {str(e)}")
+        self._stats['opened'] += 1
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            conn = self._open()
+            try:
+                DatabaseManager(conn).create_tables()
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to initialize database: {str(e)}")
+            finally:
+                conn.close()
+                self._stats['closed'] += 1
+            self._schema_ready = True
+
+    def writer(self) -> sqlite3.Connection:
+        """Return the shared writer connection, opening it on first use.
+        Only call this from the GUI thread."""
+        self._ensure_schema()
+        with self._lock:
+            if self._closed:
+                raise DatabaseError("Connection pool has been shut down")
+            if self._writer is None:
+                self._writer = self._open()
+            else:
+                self._stats['reused'] += 1
+            return self._writer
+
+    def acquire_reader(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """Borrow a read-only connection, blocking while all are in use"""
+        self._ensure_schema()
+        with self._reader_available:
+            while True:
+                if self._closed:
+                    raise DatabaseError("Connection pool has been shut down")
+                if self._idle_readers:
+                    self._stats['reused'] += 1
+                    return self._idle_readers.pop()
+                if self._reader_count < self.max_readers:
+                    conn = self._open(check_same_thread=False)
+                    conn.execute("PRAGMA query_only = ON")
+                    self._reader_count += 1
+                    return conn
+                if not self._reader_available.wait(timeout):
+                    raise DatabaseError("Timed out waiting for a database connection")
+
+    def release_reader(self, conn: sqlite3.Connection) -> None:
+        with self._reader_available:
+            if self._closed:
+                conn.close()
+                self._stats['closed'] += 1
+                return
+            # Never hand out a connection with a read transaction still open
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle_readers.append(conn)
+            self._reader_available.notify()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire_reader()
+        try:
+            yield conn
+        finally:
+            self.release_reader(conn)
+
+    def session(self) -> DatabaseManager:
+        """A DatabaseManager bound to the shared writer connection"""
+        return DatabaseManager(self.writer())
+
+    @contextmanager
+    def read_session(self) -> Iterator[DatabaseManager]:
+        """A DatabaseManager bound to a pooled reader for the duration of the block"""
+        with self.reader() as conn:
+            db = DatabaseManager(conn)
+            try:
+                yield db
+            finally:
+                db.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['readers_open'] = self._reader_count
+            stats['readers_idle'] = len(self._idle_readers)
+            return stats
+
+    def close(self) -> None:
+        """Close every connection; borrowed readers are closed on release"""
+        with self._reader_available:
+            if self._closed:
+                return
+            self._closed = True
+            for conn in self._idle_readers:
+                conn.close()
+                self._stats['closed'] += 1
+            self._idle_readers.clear()
+            if self._writer is not None:
+                self._writer.close()
+                self._stats['closed'] += 1
+                self._writer = None
+            self._reader_available.notify_all()
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+            atexit.register(_pool.close)
+        return _pool
+
+def init_pool(db_path: Optional[Path] = None, max_readers: int = 3) -> ConnectionPool:
+    """Replace the process-wide pool, e.g. to point tools at another database"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = ConnectionPool(db_path, max_readers)
+        atexit.register(_pool.close)
+        return _pool
+
+def get_session() -> DatabaseManager:
+    """Shortcut used by the UI: a session on the process-wide writer"""
+    return get_pool().session()
+
+def shutdown() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
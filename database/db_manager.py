@@ -1,20 +1,231 @@
+import re
 import sqlite3
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+from datetime import date, datetime, timedelta
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Sequence, Tuple
+from utils.config import get_config
 from utils.exceptions import DatabaseError
+from .instrumentation import InstrumentedCursor
+from .pagination import Page, encode_token, decode_token, iter_pages
+from .search import (build_match_query, ensure_contact_search_index, fts5_available,
+                     phone_digits, phone_search_params, contact_phones_insert_sql,
+                     contact_fts_insert_sql, CONTACT_PHONE_SEARCH, CONTACT_PHONES_TRIGGERS,
+                     CONTACT_PHONES_INSERT_TRIGGER, CONTACT_FTS_INSERT_TRIGGER,
+                     PHONE_SUFFIX_DIGITS)
+from .summaries import (add_policies_sql, POLICY_SUMMARY_DIMENSIONS, SUMMARY_TABLES,
+                        POLICY_SUMMARY_TRIGGERS, POLICY_SUMMARY_INSERT_TRIGGER,
+                        SUMMARY_DIFFERENCES)
+
+# Connection pragmas tunable from the "database" section of config.json
+# (busy_timeout first, so switching the journal mode waits out other writers)
+PRAGMA_SETTINGS = ('busy_timeout', 'synchronous', 'cache_size', 'mmap_size', 'temp_store')
+
+# Keyset ordering for paged contact listings; the contact id is always
+# appended as the final tie-breaker. NULLs are folded to '' so row-value
+# comparisons never see them.
+CONTACT_SORT_KEYS = {
+    'name': ("c.last_name", "c.first_name"),
+    'company': ("COALESCE(c.company_name, '')",),
+    'phone': ("COALESCE(NULLIF(c.mobile_phone, ''), c.phone, '')",),
+    'email': ("COALESCE(c.email, '')",),
+    'status': ("c.status",),
+    'last_contacted': ("COALESCE(c.last_contacted_at, '')",),
+}
+
+# Keyset ordering for paged policy listings, p.id appended as tie-breaker.
+# Each matches an index on policies, except 'contact' which walks the
+# joined contacts by name (c.id keeps each contact's policies together).
+POLICY_SORT_KEYS = {
+    'contact': ("c.last_name", "c.first_name", "c.id"),
+    'policy_number': ("p.policy_number",),
+    'policy_type': ("p.policy_type", "p.renewal_date"),
+    'carrier': ("p.carrier", "p.renewal_date"),
+    'premium': ("p.premium",),
+    'start_date': ("p.start_date",),
+    'renewal_date': ("p.renewal_date",),
+    'status': ("p.status", "p.renewal_date"),
+}
+
+# Substring fallback used when FTS5 is unavailable or the term has no words
+CONTACT_LIKE_SEARCH = """(
+    c.first_name LIKE ? OR
+    c.last_name LIKE ? OR
+    c.company_name LIKE ? OR
+    c.email LIKE ? OR
+    c.phone LIKE ? OR
+    c.mobile_phone LIKE ?
+)"""
+
+# Day windows of the renewal pipeline summary
+RENEWAL_WINDOWS = (30, 60, 90)
+
+# Sections of get_contact_profile and how much history it returns
+PROFILE_PARTS = ('contact', 'policies', 'communications')
+PROFILE_COMMUNICATIONS = 50
+# Characters of communications.details kept in history lists
+COMMUNICATION_PREVIEW_CHARS = 200
+
+POLICY_COLUMNS = """p.*,
+    c.first_name || ' ' || c.last_name as contact_name,
+    c.company_name"""
+
+# Bumped whenever _upgrade_schema gains a migration step
+SCHEMA_VERSION = 3
+
+CONTACT_INSERT = """
+    INSERT INTO contacts (
+        contact_type, company_name, first_name, last_name, 
+        title, email, phone, mobile_phone, address, 
+        notes, status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+POLICY_INSERT = """
+    INSERT INTO policies (
+        contact_id, policy_type, policy_number, carrier,
+        premium, start_date, renewal_date, notes, status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+COMMUNICATION_INSERT = """
+    INSERT INTO communications (
+        contact_id, comm_type, comm_date, details
+    ) VALUES (?, ?, ?, ?)
+"""
+
+COMMUNICATIONS_INSERT_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS trg_communications_insert
+    AFTER INSERT ON communications
+    BEGIN
+        UPDATE contacts
+        SET last_contacted_at = NEW.comm_date
+        WHERE id = NEW.contact_id
+          AND (last_contacted_at IS NULL OR last_contacted_at < NEW.comm_date);
+    END
+"""
+
+def _like_prefix(word: str) -> str:
+    """LIKE pattern (ESCAPE '\\') matching strings that start with `word`"""
+    return re.sub(r"([\\%_])", r"\\\1", word) + "%"
+
+def _contact_row(contact_data: Dict[str, Any]) -> Tuple:
+    return (
+        contact_data['contact_type'],
+        contact_data.get('company_name'),
+        contact_data['first_name'],
+        contact_data['last_name'],
+        contact_data.get('title'),
+        contact_data.get('email'),
+        contact_data.get('phone'),
+        contact_data.get('mobile_phone'),
+        contact_data.get('address'),
+        contact_data.get('notes'),
+        contact_data.get('status', 'Active')
+    )
+
+def _policy_row(policy_data: Dict[str, Any]) -> Tuple:
+    return (
+        policy_data['contact_id'],
+        policy_data['policy_type'],
+        policy_data['policy_number'],
+        policy_data['carrier'],
+        policy_data['premium'],
+        policy_data['start_date'],
+        policy_data['renewal_date'],
+        policy_data.get('notes'),
+        policy_data.get('status', 'Active')
+    )
+
+def _communication_row(comm_data: Dict[str, Any]) -> Tuple:
+    return (
+        comm_data['contact_id'],
+        comm_data['comm_type'],
+        comm_data['comm_date'],
+        comm_data['details']
+    )
+
+class CRMConnection(sqlite3.Connection):
+    """sqlite3 connection carrying state shared by every DatabaseManager using it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Nesting level of DatabaseManager.transaction() blocks
+        self.transaction_depth = 0
+
+    # Every statement goes through an InstrumentedCursor so query_stats sees
+    # it; the C shortcuts below would otherwise use a plain cursor
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+def database_settings() -> Dict[str, Any]:
+    """Database path, journal mode, pragma and backup settings from config.json"""
+    config = get_config()
+    keys = ('path', 'journal_mode', 'query_stats', 'slow_query_ms', 'backup_dir',
+            'backup_interval_hours', 'backup_keep') + PRAGMA_SETTINGS
+    return {key: config.get('database', key) for key in keys}
+
+def _pragma_value(name: str, value: Any) -> str:
+    # Pragma values cannot be bound as parameters, so only accept plain
+    # numbers and keywords
+    value = str(value)
+    if not re.fullmatch(r"-?\w+", value):
+        raise DatabaseError(f"Invalid value for database setting '{name}': {value}")
+    return value
+
+def connect(db_path: Optional[Path] = None, settings: Optional[Dict[str, Any]] = None,
+            **kwargs) -> CRMConnection:
+    """Open a connection configured the way every CRM connection expects.
+
+    Path and pragmas default to the "database" section of config.json.
+    """
+    if settings is None:
+        settings = database_settings()
+    if db_path is None:
+        db_path = Path(settings['path'])
+    conn = sqlite3.connect(str(db_path), factory=CRMConnection, **kwargs)
+    for name in PRAGMA_SETTINGS:
+        value = settings.get(name)
+        if value is not None:
+            conn.execute(f"PRAGMA {name} = {_pragma_value(name, value)}")
+    # WAL lets readers and the writer work without blocking each other; the
+    # mode is stored in the database file, so this is a no-op after the first time
+    if settings.get('journal_mode'):
+        conn.execute(f"PRAGMA journal_mode = {_pragma_value('journal_mode', settings['journal_mode'])}")
+    # Enable foreign key support
+    conn.execute("PRAGMA foreign_keys = ON")
+    # Return rows as dictionaries
+    conn.row_factory = sqlite3.Row
+    return conn
 
 class DatabaseManager:
-    def __init__(self):
+    def __init__(self, connection: Optional[CRMConnection] = None):
         try:
-            db_path = Path("insurance_crm.db")
-            self.conn = sqlite3.connect(str(db_path))
-            # Enable foreign key support
-            self.conn.execute("PRAGMA foreign_keys = ON")
-            # Return rows as dictionaries
-            self.conn.row_factory = sqlite3.Row
-            self.cursor = self.conn.cursor()
-            self.create_tables()
+            if connection is None:
+                # Standalone use (scripts): own the connection and make sure
+                # the schema exists
+                self.conn = connect()
+                self._owns_connection = True
+                self.cursor = self.conn.cursor()
+                self.create_tables()
+            else:
+                # Borrowed from the connection pool, which already created
+                # the schema and is responsible for closing it
+                self.conn = connection
+                self._owns_connection = False
+                self.cursor = self.conn.cursor()
+                self.fts_enabled = fts5_available(self.conn) and self.cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'contacts_fts'"
+                ).fetchone() is not None
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to initialize database: {str(e)}")
     
@@ -25,7 +236,10 @@ class DatabaseManager:
         self.close()
     
     def close(self):
-        self.conn.close()
+        if self._owns_connection:
+            self.conn.close()
+        else:
+            self.cursor.close()
 
     def create_tables(self):
         self.cursor.executescript("""
@@ -42,18 +256,36 @@ class DatabaseManager:
                 mobile_phone TEXT,
                 address TEXT,
                 notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                -- Denormalized MAX(communications.comm_date), kept current
+                -- by the trg_communications_* triggers below
+                last_contacted_at TIMESTAMP
             );
 
             -- Add indexes for search fields
             CREATE INDEX IF NOT EXISTS idx_contacts_name 
                 ON contacts(last_name, first_name);
-            CREATE INDEX IF NOT EXISTS idx_contacts_email 
-                ON contacts(email);
-            CREATE INDEX IF NOT EXISTS idx_contacts_phone 
-                ON contacts(phone, mobile_phone);
-            CREATE INDEX IF NOT EXISTS idx_contacts_company 
-                ON contacts(company_name);
+            -- CONTACT_SORT_KEYS expressions over the non-deleted contacts
+            -- every listing filters to; these replace the plain email,
+            -- phone and company indexes, which no query could use
+            CREATE INDEX IF NOT EXISTS idx_contacts_company_sort
+                ON contacts(COALESCE(company_name, '')) WHERE status != 'Deleted';
+            CREATE INDEX IF NOT EXISTS idx_contacts_email_sort
+                ON contacts(COALESCE(email, '')) WHERE status != 'Deleted';
+            CREATE INDEX IF NOT EXISTS idx_contacts_phone_sort
+                ON contacts(COALESCE(NULLIF(mobile_phone, ''), phone, '')) WHERE status != 'Deleted';
+            CREATE INDEX IF NOT EXISTS idx_contacts_status_sort
+                ON contacts(status) WHERE status != 'Deleted';
+            DROP INDEX IF EXISTS idx_contacts_email;
+            DROP INDEX IF EXISTS idx_contacts_phone;
+            DROP INDEX IF EXISTS idx_contacts_company;
+            -- Type-ahead name prefixes (find_contacts_by_prefix)
+            CREATE INDEX IF NOT EXISTS idx_contacts_last_name_nocase
+                ON contacts(last_name COLLATE NOCASE, first_name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_contacts_first_name_nocase
+                ON contacts(first_name COLLATE NOCASE, last_name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_contacts_company_nocase
+                ON contacts(company_name COLLATE NOCASE);
 
             CREATE TABLE IF NOT EXISTS policies (
                 id INTEGER PRIMARY KEY,
@@ -82,74 +314,423 @@ class DatabaseManager:
                     ON DELETE CASCADE
             );
 
-            CREATE INDEX IF NOT EXISTS idx_policies_contact 
-                ON policies(contact_id);
+            -- A contact's policies come back in renewal order without a
+            -- sort; replaces the contact_id-only idx_policies_contact
+            CREATE INDEX IF NOT EXISTS idx_policies_contact_renewal
+                ON policies(contact_id, renewal_date);
+            DROP INDEX IF EXISTS idx_policies_contact;
             CREATE INDEX IF NOT EXISTS idx_policies_renewal 
                 ON policies(renewal_date);
-            CREATE INDEX IF NOT EXISTS idx_communications_contact 
-                ON communications(contact_id);
+            -- Renewal windows for one status are a single range scan
+            CREATE INDEX IF NOT EXISTS idx_policies_status_renewal
+                ON policies(status, renewal_date);
+            -- Policies tab filters and POLICY_SORT_KEYS
+            CREATE INDEX IF NOT EXISTS idx_policies_carrier
+                ON policies(carrier, renewal_date);
+            CREATE INDEX IF NOT EXISTS idx_policies_type
+                ON policies(policy_type, renewal_date);
+            CREATE INDEX IF NOT EXISTS idx_policies_premium
+                ON policies(premium);
+            CREATE INDEX IF NOT EXISTS idx_policies_start
+                ON policies(start_date);
+            -- A contact's history newest first is one backwards range scan
+            -- (the rowid breaks comm_date ties); replaces the contact_id-only
+            -- idx_communications_contact
+            CREATE INDEX IF NOT EXISTS idx_communications_contact_date
+                ON communications(contact_id, comm_date);
+            DROP INDEX IF EXISTS idx_communications_contact;
             CREATE INDEX IF NOT EXISTS idx_communications_date 
                 ON communications(comm_date);
+
+            -- Digits-only copies of contacts.phone / mobile_phone, one row
+            -- per number, maintained by the trg_contacts_phones_* triggers.
+            -- digits_reversed turns "ends with" lookups into prefix ranges.
+            CREATE TABLE IF NOT EXISTS contact_phones (
+                contact_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                digits TEXT NOT NULL,
+                digits_reversed TEXT NOT NULL,
+                PRIMARY KEY (contact_id, kind),
+                FOREIGN KEY (contact_id) REFERENCES contacts (id)
+                    ON DELETE CASCADE
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_contact_phones_digits
+                ON contact_phones(digits);
+            CREATE INDEX IF NOT EXISTS idx_contact_phones_reversed
+                ON contact_phones(digits_reversed);
         """)
+        self.cursor.executescript(SUMMARY_TABLES)
+        self._upgrade_schema()
+        self.cursor.executescript(f"""
+            -- Matches the 'last_contacted' sort key expression
+            CREATE INDEX IF NOT EXISTS idx_contacts_last_contacted
+                ON contacts(COALESCE(last_contacted_at, ''));
+
+            -- Keep contacts.last_contacted_at equal to the newest comm_date
+            {COMMUNICATIONS_INSERT_TRIGGER};
+
+            CREATE TRIGGER IF NOT EXISTS trg_communications_update
+            AFTER UPDATE OF contact_id, comm_date ON communications
+            BEGIN
+                UPDATE contacts
+                SET last_contacted_at = (
+                    SELECT MAX(comm_date)
+                    FROM communications
+                    WHERE communications.contact_id = contacts.id
+                )
+                WHERE id IN (OLD.contact_id, NEW.contact_id);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_communications_delete
+            AFTER DELETE ON communications
+            BEGIN
+                UPDATE contacts
+                SET last_contacted_at = (
+                    SELECT MAX(comm_date)
+                    FROM communications
+                    WHERE communications.contact_id = contacts.id
+                )
+                WHERE id = OLD.contact_id;
+            END;
+        """)
+        self.cursor.executescript(CONTACT_PHONES_TRIGGERS)
+        self.cursor.executescript(POLICY_SUMMARY_TRIGGERS)
+        self.fts_enabled = ensure_contact_search_index(self.cursor)
+        self.conn.commit()
+
+    def _upgrade_schema(self):
+        """Bring databases created by older versions up to SCHEMA_VERSION"""
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        if version < 1:
+            # v1: materialized contacts.last_contacted_at
+            columns = {row['name'] for row in self.cursor.execute("PRAGMA table_info(contacts)")}
+            if 'last_contacted_at' not in columns:
+                self.cursor.execute("ALTER TABLE contacts ADD COLUMN last_contacted_at TIMESTAMP")
+            self.fix_last_contacted_dates()
+
+        if version < 2:
+            # v2: contact_phones lookup table
+            self.cursor.execute("DELETE FROM contact_phones")
+            self.cursor.execute(contact_phones_insert_sql("c", "FROM contacts c"))
+
+        if version < 3:
+            # v3: policy_summary / contact_policy_summary
+            self._rebuild_summaries()
+
+        self.cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         self.conn.commit()
 
+    # Transactions
+    @contextmanager
+    def transaction(self) -> Iterator['DatabaseManager']:
+        """Group writes into a single commit.
+
+        Mutations inside the block do not commit individually; everything is
+        committed when the block exits and rolled back if it raises. Blocks
+        nest (inner ones become savepoints) and span every DatabaseManager
+        sharing this connection.
+        """
+        depth = self.conn.transaction_depth
+        savepoint = f"crm_tx_{depth}"
+        try:
+            if depth == 0:
+                if self.conn.in_transaction:
+                    self.conn.commit()
+                self.cursor.execute("BEGIN")
+            else:
+                self.cursor.execute(f"SAVEPOINT {savepoint}")
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Could not start transaction: {str(e)}")
+
+        self.conn.transaction_depth = depth + 1
+        try:
+            yield self
+        except BaseException:
+            self.conn.transaction_depth = depth
+            if depth == 0:
+                self.conn.rollback()
+            else:
+                self.cursor.execute(f"ROLLBACK TO {savepoint}")
+                self.cursor.execute(f"RELEASE {savepoint}")
+            raise
+        self.conn.transaction_depth = depth
+        try:
+            if depth == 0:
+                self.conn.commit()
+            else:
+                self.cursor.execute(f"RELEASE {savepoint}")
+        except sqlite3.Error as e:
+            if depth == 0:
+                self.conn.rollback()
+            raise DatabaseError(f"Could not commit transaction: {str(e)}")
+
+    @contextmanager
+    def bulk_load(self) -> Iterator['DatabaseManager']:
+        """Transaction for inserting many contacts, policies and communications at once.
+
+        The per-row insert triggers maintaining contact_phones, contacts_fts,
+        the policy summaries and contacts.last_contacted_at are suspended
+        inside the block. On exit
+        the same data is derived for the new rows (ids above the previous
+        maximum) with a few set-based statements and the triggers restored,
+        all in the same transaction. Updates and deletes keep their triggers.
+        """
+        with self.transaction():
+            first_contact_id, first_policy_id, first_comm_id = self.cursor.execute("""
+                SELECT (SELECT COALESCE(MAX(id), 0) + 1 FROM contacts),
+                       (SELECT COALESCE(MAX(id), 0) + 1 FROM policies),
+                       (SELECT COALESCE(MAX(id), 0) + 1 FROM communications)
+            """).fetchone()
+            for trigger in ('trg_contacts_phones_insert', 'trg_contacts_fts_insert',
+                            'trg_policy_summary_insert', 'trg_communications_insert'):
+                self.cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+            yield self
+
+            source = "FROM contacts c WHERE c.id >= ?"
+            self.cursor.execute(contact_phones_insert_sql("c", source),
+                                (first_contact_id, first_contact_id))
+            self.cursor.execute(CONTACT_PHONES_INSERT_TRIGGER)
+            if self.fts_enabled:
+                self.cursor.execute(contact_fts_insert_sql(source), (first_contact_id,))
+                self.cursor.execute(CONTACT_FTS_INSERT_TRIGGER)
+            # NOT INDEXED: read just the new rowid range rather than let
+            # GROUP BY walk a whole index
+            for statement in add_policies_sql("FROM policies p NOT INDEXED WHERE p.id >= ?1"):
+                self.cursor.execute(statement, (first_policy_id,))
+            self.cursor.execute(POLICY_SUMMARY_INSERT_TRIGGER)
+            self.cursor.execute("""
+                UPDATE contacts
+                SET last_contacted_at = MAX(COALESCE(last_contacted_at, ''), (
+                    SELECT MAX(comm_date) FROM communications
+                    WHERE contact_id = contacts.id AND id >= ?
+                ))
+                WHERE id IN (SELECT contact_id FROM communications WHERE id >= ?)
+            """, (first_comm_id, first_comm_id))
+            self.cursor.execute(COMMUNICATIONS_INSERT_TRIGGER)
+
+    def _commit(self):
+        """Commit unless an enclosing transaction() will do it"""
+        if self.conn.transaction_depth == 0:
+            self.conn.commit()
+
+    def executemany(self, query: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Run a bulk statement atomically and return the number of rows written.
+
+        rows are parameter tuples for query, e.g. CONTACT_INSERT; the
+        add_*_many methods build them from dicts.
+        """
+        try:
+            with self.transaction():
+                self.cursor.executemany(query, rows)
+                return self.cursor.rowcount
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Bulk write failed: {str(e)}")
+
     # Contact methods
     def add_contact(self, contact_data: Dict[str, Any]) -> int:
-        query = """
-            INSERT INTO contacts (
-                contact_type, company_name, first_name, last_name, 
-                title, email, phone, mobile_phone, address, 
-                notes, status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        self.cursor.execute(query, (
-            contact_data['contact_type'],
-            contact_data.get('company_name'),
-            contact_data['first_name'],
-            contact_data['last_name'],
-            contact_data.get('title'),
-            contact_data.get('email'),
-            contact_data.get('phone'),
-            contact_data.get('mobile_phone'),
-            contact_data.get('address'),
-            contact_data.get('notes'),
-            contact_data.get('status', 'Active')
-        ))
-        self.conn.commit()
+        self.cursor.execute(CONTACT_INSERT, _contact_row(contact_data))
+        self._commit()
         return self.cursor.lastrowid
 
+    def add_contacts_many(self, contacts: Iterable[Dict[str, Any]]) -> int:
+        """Insert many contacts in one transaction; returns how many were added"""
+        return self.executemany(CONTACT_INSERT, (_contact_row(c) for c in contacts))
+
     def get_contacts(self, contact_id: Optional[int] = None, search_term: Optional[str] = None) -> List[Dict]:
+        """Contacts by id, or matching `search_term` (best matches first), or all by name"""
         query = """
-            SELECT c.*,
-                   (SELECT MAX(comm_date)
-                    FROM communications
-                    WHERE contact_id = c.id) as last_contacted_at
+            SELECT c.*
             FROM contacts c
             WHERE c.status != 'Deleted'
         """
         params = []
+        order_by = "c.last_name, c.first_name"
         
         if contact_id is not None:
             query += " AND c.id = ?"
             params.append(contact_id)
         elif search_term:  # Only use search term if no specific ID is provided
-            query += """ 
-                AND (
-                    c.first_name LIKE ? OR 
-                    c.last_name LIKE ? OR 
-                    c.company_name LIKE ? OR
-                    c.email LIKE ? OR 
-                    c.phone LIKE ? OR
-                    c.mobile_phone LIKE ?
-                )
-            """
-            search_pattern = f"%{search_term}%"
-            params.extend([search_pattern] * 6)
+            match_query = self._match_query(search_term)
+            if match_query is not None:
+                query = """
+                    SELECT c.*
+                    FROM contacts c
+                    JOIN contacts_fts ON contacts_fts.rowid = c.id
+                    WHERE c.status != 'Deleted' AND contacts_fts MATCH ?
+                """
+                params.append(match_query)
+                order_by = "contacts_fts.rank, " + order_by
+            else:
+                condition, search_params = self._contact_search_filter(search_term)
+                query += " AND " + condition
+                params.extend(search_params)
         
-        query += " ORDER BY c.last_name, c.first_name"
+        query += f" ORDER BY {order_by}"
         self.cursor.execute(query, params)
         return [dict(row) for row in self.cursor.fetchall()]
 
+    def _match_query(self, search_term: str) -> Optional[str]:
+        """FTS5 MATCH expression for a rankable search, or None"""
+        if not self.fts_enabled or phone_digits(search_term):
+            return None
+        return build_match_query(search_term)
+
+    def _contact_search_filter(self, search_term: str) -> Tuple[str, List[Any]]:
+        """WHERE condition and parameters restricting contacts to a search"""
+        digits = phone_digits(search_term)
+        if digits:
+            return CONTACT_PHONE_SEARCH, phone_search_params(digits)
+        match_query = self._match_query(search_term)
+        if match_query is not None:
+            return "c.id IN (SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ?)", [match_query]
+        return CONTACT_LIKE_SEARCH, [f"%{search_term}%"] * 6
+
+    def find_contacts_by_phone(self, number: str, match: str = 'suffix', limit: int = 20) -> List[Dict]:
+        """Look contacts up by phone digits, ignoring how the number was typed.
+
+        `match` is 'exact', 'prefix' or 'suffix' (caller-ID style: the last N
+        digits). Every variant is a range scan on a contact_phones index.
+        """
+        digits = re.sub(r"\D", "", number)
+        if not digits:
+            return []
+        if match == 'exact':
+            condition, params = "digits = ?", [digits]
+        elif match == 'prefix':
+            condition, params = "digits >= ? AND digits < ?", [digits, digits + ":"]
+        elif match == 'suffix':
+            reversed_digits = digits[::-1][:PHONE_SUFFIX_DIGITS]
+            condition = "digits_reversed >= ? AND digits_reversed < ?"
+            params = [reversed_digits, reversed_digits + ":"]
+        else:
+            raise DatabaseError(f"Unknown phone match type: {match}")
+
+        query = f"""
+            SELECT c.*
+            FROM contacts c
+            WHERE c.status != 'Deleted'
+              AND c.id IN (SELECT contact_id FROM contact_phones WHERE {condition})
+            ORDER BY c.last_name, c.first_name
+            LIMIT ?
+        """
+        self.cursor.execute(query, params + [limit])
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def find_contacts_by_prefix(self, text: str, limit: int = 20) -> List[Dict]:
+        """Contacts whose last, first or company name starts with the first
+        word of `text`, ignoring case; every further word must start one of
+        those names too. For type-ahead pickers: each name is a range scan
+        on a NOCASE index that stops after `limit` rows.
+        """
+        words = [_like_prefix(word) for word in text.split()]
+        if not words:
+            return []
+        others = " AND ".join(
+            "(c.last_name LIKE ? ESCAPE '\\' OR c.first_name LIKE ? ESCAPE '\\'"
+            " OR c.company_name LIKE ? ESCAPE '\\')"
+            for _ in words[1:]
+        ) or "1"
+        other_params = [word for word in words[1:] for _ in range(3)]
+        branches = []
+        params: List[Any] = []
+        for column, order_by in (('c.last_name', 'c.last_name COLLATE NOCASE, c.first_name COLLATE NOCASE'),
+                                 ('c.first_name', 'c.first_name COLLATE NOCASE, c.last_name COLLATE NOCASE'),
+                                 ('c.company_name', 'c.company_name COLLATE NOCASE')):
+            branches.append(f"""
+                SELECT * FROM (
+                    SELECT c.* FROM contacts c
+                    WHERE {column} LIKE ? ESCAPE '\\' AND c.status != 'Deleted' AND {others}
+                    ORDER BY {order_by}
+                    LIMIT ?
+                )
+            """)
+            params += [words[0]] + other_params + [limit]
+        self.cursor.execute(
+            " UNION ".join(branches)
+            + " ORDER BY last_name COLLATE NOCASE, first_name COLLATE NOCASE, id LIMIT ?",
+            params + [limit]
+        )
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def _keyset_page(self, scope: str, columns: str, from_clause: str,
+                     conditions: List[str], params: List[Any], key_exprs: Sequence[str],
+                     descending: bool, limit: int, page_token: Optional[str]) -> Page:
+        """Run a keyset-paginated SELECT ordered by `key_exprs`.
+
+        The last key expression must be unique (the row id) so pages never
+        overlap or skip rows. One extra row is fetched to tell whether a
+        further page exists.
+        """
+        key_exprs = list(key_exprs)
+        conditions = list(conditions)
+        params = list(params)
+        if page_token is not None:
+            after = decode_token(page_token, scope, len(key_exprs))
+            comparison = "<" if descending else ">"
+            placeholders = ", ".join("?" * len(key_exprs))
+            conditions.append(f"({', '.join(key_exprs)}) {comparison} ({placeholders})")
+            params.extend(after)
+
+        direction = "DESC" if descending else "ASC"
+        key_columns = ", ".join(f"{expr} AS _key{i}" for i, expr in enumerate(key_exprs))
+        query = f"SELECT {columns}, {key_columns} FROM {from_clause}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {', '.join(f'{expr} {direction}' for expr in key_exprs)} LIMIT ?"
+        params.append(limit + 1)
+
+        self.cursor.execute(query, params)
+        rows = [dict(row) for row in self.cursor.fetchall()]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        last_key = None
+        for row in rows:
+            last_key = [row.pop(f"_key{i}") for i in range(len(key_exprs))]
+        next_token = encode_token(scope, last_key) if has_more else None
+        return Page(rows, next_token)
+
+    def get_contacts_page(self, limit: int = 200, page_token: Optional[str] = None,
+                          search_term: Optional[str] = None, sort_by: str = 'name',
+                          descending: bool = False) -> Page:
+        """Return one page of contacts ordered by the CONTACT_SORT_KEYS for `sort_by`"""
+        if sort_by not in CONTACT_SORT_KEYS and sort_by != 'relevance':
+            raise DatabaseError(f"Unknown contact sort key: {sort_by}")
+        from_clause = "contacts c"
+        conditions = ["c.status != 'Deleted'"]
+        params: List[Any] = []
+        match_query = self._match_query(search_term) if search_term else None
+
+        if sort_by == 'relevance' and match_query is None:
+            # Nothing to rank by; relevance only exists for full-text searches
+            sort_by = 'name'
+
+        if sort_by == 'relevance':
+            from_clause += " JOIN contacts_fts ON contacts_fts.rowid = c.id"
+            conditions.append("contacts_fts MATCH ?")
+            params.append(match_query)
+            key_exprs = ["contacts_fts.rank", "c.id"]
+        else:
+            if search_term:
+                condition, search_params = self._contact_search_filter(search_term)
+                conditions.append(condition)
+                params.extend(search_params)
+            key_exprs = list(CONTACT_SORT_KEYS[sort_by]) + ["c.id"]
+
+        return self._keyset_page(
+            f"contacts:{sort_by}:{'desc' if descending else 'asc'}",
+            "c.*", from_clause, conditions, params,
+            key_exprs, descending, limit, page_token
+        )
+
+    def iter_contacts(self, search_term: Optional[str] = None, page_size: int = 500) -> Iterator[Dict]:
+        """Stream every matching contact in name order, one page in memory at a time"""
+        return iter_pages(self.get_contacts_page, page_size, search_term=search_term)
+
     def update_contact(self, contact_id: int, contact_data: Dict[str, Any]) -> bool:
         query = """
             UPDATE contacts 
@@ -172,31 +753,19 @@ class DatabaseManager:
             contact_data.get('status', 'Active'),
             contact_id
         ))
-        self.conn.commit()
+        self._commit()
         return self.cursor.rowcount > 0
 
     # Policy methods
     def add_policy(self, policy_data: Dict[str, Any]) -> int:
-        query = """
-            INSERT INTO policies (
-                contact_id, policy_type, policy_number, carrier,
-                premium, start_date, renewal_date, notes, status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        self.cursor.execute(query, (
-            policy_data['contact_id'],
-            policy_data['policy_type'],
-            policy_data['policy_number'],
-            policy_data['carrier'],
-            policy_data['premium'],
-            policy_data['start_date'],
-            policy_data['renewal_date'],
-            policy_data.get('notes'),
-            policy_data.get('status', 'Active')
-        ))
-        self.conn.commit()
+        self.cursor.execute(POLICY_INSERT, _policy_row(policy_data))
+        self._commit()
         return self.cursor.lastrowid
 
+    def add_policies_many(self, policies: Iterable[Dict[str, Any]]) -> int:
+        """Insert many policies in one transaction; returns how many were added"""
+        return self.executemany(POLICY_INSERT, (_policy_row(p) for p in policies))
+
     def get_policies(self, policy_id: Optional[int] = None, contact_id: Optional[int] = None) -> List[Dict]:
         query = """
             SELECT p.*, 
@@ -219,6 +788,218 @@ class DatabaseManager:
         self.cursor.execute(query, params)
         return [dict(row) for row in self.cursor.fetchall()]
 
+    def get_policies_page(self, limit: int = 200, page_token: Optional[str] = None,
+                          contact_id: Optional[int] = None, carrier: Optional[str] = None,
+                          policy_type: Optional[str] = None, status: Optional[str] = None,
+                          min_premium: Optional[float] = None, max_premium: Optional[float] = None,
+                          renewal_from: Optional[str] = None, renewal_to: Optional[str] = None,
+                          contact_search: Optional[str] = None, sort_by: str = 'renewal_date',
+                          descending: bool = False) -> Page:
+        """Return one page of policies matching every given filter, ordered by
+        the POLICY_SORT_KEYS for `sort_by`; status None means any but Deleted"""
+        if sort_by not in POLICY_SORT_KEYS:
+            raise DatabaseError(f"Unknown policy sort key: {sort_by}")
+        conditions = ["p.status != 'Deleted'" if status is None else "p.status = ?"]
+        params: List[Any] = [] if status is None else [status]
+        for condition, value in (("p.contact_id = ?", contact_id),
+                                 ("p.carrier = ?", carrier),
+                                 ("p.policy_type = ?", policy_type),
+                                 ("p.premium >= ?", min_premium),
+                                 ("p.premium <= ?", max_premium),
+                                 ("p.renewal_date >= ?", renewal_from),
+                                 ("p.renewal_date <= ?", renewal_to)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        if contact_search:
+            condition, search_params = self._contact_search_filter(contact_search)
+            conditions.append(f"p.contact_id IN (SELECT c.id FROM contacts c WHERE {condition})")
+            params.extend(search_params)
+
+        tables = "policies p JOIN contacts c ON p.contact_id = c.id"
+        if sort_by == 'contact' and not (contact_id or carrier or policy_type or contact_search):
+            # Left to itself the planner sorts every policy; walking
+            # idx_contacts_name and each contact's policies stops after a page
+            tables = "contacts c CROSS JOIN policies p ON p.contact_id = c.id"
+
+        return self._keyset_page(
+            f"policies:{sort_by}:{'desc' if descending else 'asc'}", POLICY_COLUMNS,
+            tables,
+            conditions, params, list(POLICY_SORT_KEYS[sort_by]) + ["p.id"],
+            descending, limit, page_token
+        )
+
+    def iter_policies(self, contact_id: Optional[int] = None, page_size: int = 500) -> Iterator[Dict]:
+        return iter_pages(self.get_policies_page, page_size, contact_id=contact_id)
+
+    # Renewal methods
+    def _renewal_filters(self, days: Optional[int], carrier: Optional[str],
+                         policy_type: Optional[str], status: Optional[str],
+                         contact_id: Optional[int], start_date: Optional[str]) -> Tuple[List[str], List[Any]]:
+        """WHERE conditions for policies renewing from start_date (default today)
+        up to `days` later; status None means any status but Deleted"""
+        start = date.fromisoformat(start_date) if start_date else date.today()
+        conditions = ["p.renewal_date >= ?"]
+        params: List[Any] = [start.isoformat()]
+        if days is not None:
+            conditions.append("p.renewal_date <= ?")
+            params.append((start + timedelta(days=days)).isoformat())
+        if status is None:
+            conditions.append("p.status != 'Deleted'")
+        else:
+            conditions.append("p.status = ?")
+            params.append(status)
+        for column, value in (('p.carrier', carrier), ('p.policy_type', policy_type),
+                              ('p.contact_id', contact_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        return conditions, params
+
+    def get_renewals(self, days: Optional[int] = None, carrier: Optional[str] = None,
+                     policy_type: Optional[str] = None, status: Optional[str] = 'Active',
+                     contact_id: Optional[int] = None, start_date: Optional[str] = None) -> List[Dict]:
+        """Policies renewing in the next `days` days (no limit if None), soonest first"""
+        conditions, params = self._renewal_filters(days, carrier, policy_type, status,
+                                                   contact_id, start_date)
+        self.cursor.execute(f"""
+            SELECT {POLICY_COLUMNS}
+            FROM policies p
+            JOIN contacts c ON p.contact_id = c.id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY p.renewal_date, p.id
+        """, params)
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def get_renewals_page(self, days: Optional[int] = 30, limit: int = 200,
+                          page_token: Optional[str] = None, carrier: Optional[str] = None,
+                          policy_type: Optional[str] = None, status: Optional[str] = 'Active',
+                          contact_id: Optional[int] = None, start_date: Optional[str] = None) -> Page:
+        """One page of get_renewals"""
+        conditions, params = self._renewal_filters(days, carrier, policy_type, status,
+                                                   contact_id, start_date)
+        return self._keyset_page(
+            "renewals", POLICY_COLUMNS, "policies p JOIN contacts c ON p.contact_id = c.id",
+            conditions, params, ["p.renewal_date", "p.id"], False, limit, page_token
+        )
+
+    def get_renewal_summary(self, windows: Sequence[int] = RENEWAL_WINDOWS,
+                            carrier: Optional[str] = None, policy_type: Optional[str] = None,
+                            status: Optional[str] = 'Active',
+                            start_date: Optional[str] = None) -> List[Dict]:
+        """Policy count and premium renewing within each window, in one range scan"""
+        conditions, params = self._renewal_filters(max(windows), carrier, policy_type, status,
+                                                   None, start_date)
+        start = date.fromisoformat(params[0])
+        columns = []
+        window_params: List[Any] = []
+        for i, days in enumerate(windows):
+            columns.append(f"COUNT(CASE WHEN p.renewal_date <= ? THEN 1 END) AS count_{i}")
+            columns.append(f"TOTAL(CASE WHEN p.renewal_date <= ? THEN p.premium END) AS premium_{i}")
+            end = (start + timedelta(days=days)).isoformat()
+            window_params.extend([end, end])
+        row = self.cursor.execute(f"""
+            SELECT {', '.join(columns)}
+            FROM policies p
+            WHERE {' AND '.join(conditions)}
+        """, window_params + params).fetchone()
+        return [
+            {'days': days, 'count': row[f"count_{i}"], 'premium': row[f"premium_{i}"]}
+            for i, days in enumerate(windows)
+        ]
+
+    def get_policy_carriers(self) -> List[str]:
+        """Distinct carriers of all policies, in order"""
+        # Skip scan: one idx_policies_carrier seek per carrier instead of
+        # reading every policy
+        self.cursor.execute("""
+            WITH RECURSIVE carriers(carrier) AS (
+                SELECT MIN(carrier) FROM policies
+                UNION ALL
+                SELECT (SELECT MIN(carrier) FROM policies WHERE carrier > carriers.carrier)
+                FROM carriers WHERE carrier IS NOT NULL
+            )
+            SELECT carrier FROM carriers WHERE carrier IS NOT NULL
+        """)
+        return [row['carrier'] for row in self.cursor.fetchall()]
+
+    # Summaries
+    def get_policy_totals(self, dimension: str, status: Optional[str] = 'Active',
+                          key_from: Optional[str] = None,
+                          key_to: Optional[str] = None) -> List[Dict]:
+        """Policy count and premium per carrier, policy_type or renewal_month
+        (YYYY-MM), read from policy_summary. Keys are filtered to the
+        inclusive range key_from..key_to; status None totals every status
+        except 'Deleted'."""
+        if dimension not in POLICY_SUMMARY_DIMENSIONS:
+            raise DatabaseError(f"Unknown summary dimension: {dimension}")
+        conditions = ["dimension = ?"]
+        params: List[Any] = [dimension]
+        if status is None:
+            conditions.append("status != 'Deleted'")
+        else:
+            conditions.append("status = ?")
+            params.append(status)
+        if key_from is not None:
+            conditions.append("key >= ?")
+            params.append(key_from)
+        if key_to is not None:
+            conditions.append("key <= ?")
+            params.append(key_to)
+        self.cursor.execute(f"""
+            SELECT key, SUM(policy_count) AS policy_count,
+                   SUM(premium_cents) / 100.0 AS premium
+            FROM policy_summary
+            WHERE {' AND '.join(conditions)}
+            GROUP BY key
+            HAVING SUM(policy_count) > 0
+            ORDER BY key
+        """, params)
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def get_top_contacts_by_policies(self, limit: int = 20) -> List[Dict]:
+        """Contacts with the most Active policies, read from contact_policy_summary"""
+        self.cursor.execute("""
+            SELECT c.id, c.first_name || ' ' || c.last_name AS contact_name,
+                   c.company_name, s.active_policies,
+                   s.active_premium_cents / 100.0 AS active_premium
+            FROM contact_policy_summary s
+            JOIN contacts c ON c.id = s.contact_id
+            WHERE s.active_policies > 0
+            ORDER BY s.active_policies DESC, s.contact_id DESC
+            LIMIT ?
+        """, (limit,))
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def _rebuild_summaries(self):
+        self.cursor.execute("DELETE FROM policy_summary")
+        self.cursor.execute("DELETE FROM contact_policy_summary")
+        for statement in add_policies_sql("FROM policies p"):
+            self.cursor.execute(statement)
+
+    def rebuild_summaries(self):
+        """Recompute the policy summaries from scratch.
+
+        The triggers keep them current; this is the recovery tool if
+        check_summaries() ever reports a difference.
+        """
+        try:
+            with self.transaction():
+                self._rebuild_summaries()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Could not rebuild summaries: {str(e)}")
+
+    def check_summaries(self) -> Dict[str, List[Dict]]:
+        """Differences between each summary table and a recomputation from
+        policies, keyed by table. 'side' says whether a row is only in the
+        stored summary or only in the recomputation; all lists are empty
+        when the summaries are consistent."""
+        differences = {}
+        for table, query in SUMMARY_DIFFERENCES.items():
+            self.cursor.execute(query)
+            differences[table] = [dict(row) for row in self.cursor.fetchall()]
+        return differences
+
     def update_policy(self, policy_id: int, policy_data: Dict[str, Any]) -> bool:
         query = """
             UPDATE policies 
@@ -238,25 +1019,25 @@ class DatabaseManager:
             policy_data.get('status', 'Active'),
             policy_id
         ))
-        self.conn.commit()
+        self._commit()
+        return self.cursor.rowcount > 0
+
+    def delete_policy(self, policy_id: int) -> bool:
+        """Soft-delete a policy; it disappears from every listing"""
+        self.cursor.execute("UPDATE policies SET status = 'Deleted' WHERE id = ?", (policy_id,))
+        self._commit()
         return self.cursor.rowcount > 0
 
     # Communication methods
     def add_communication(self, comm_data: Dict[str, Any]) -> int:
-        query = """
-            INSERT INTO communications (
-                contact_id, comm_type, comm_date, details
-            ) VALUES (?, ?, ?, ?)
-        """
-        self.cursor.execute(query, (
-            comm_data['contact_id'],
-            comm_data['comm_type'],
-            comm_data['comm_date'],
-            comm_data['details']
-        ))
-        self.conn.commit()
+        self.cursor.execute(COMMUNICATION_INSERT, _communication_row(comm_data))
+        self._commit()
         return self.cursor.lastrowid
 
+    def add_communications_many(self, communications: Iterable[Dict[str, Any]]) -> int:
+        """Insert many communications in one transaction; returns how many were added"""
+        return self.executemany(COMMUNICATION_INSERT, (_communication_row(c) for c in communications))
+
     def get_communications(self, contact_id: int) -> List[Dict]:
         query = """
             SELECT c.*, 
@@ -274,8 +1055,147 @@ class DatabaseManager:
         self.cursor.execute(query, (contact_id,))
         return [dict(row) for row in self.cursor.fetchall()]
 
+    def get_communications_page(self, contact_id: int, limit: int = 200,
+                                page_token: Optional[str] = None,
+                                preview_chars: Optional[int] = None) -> Page:
+        """Return one page of a contact's communications, newest first.
+
+        With `preview_chars`, details is cut to that many characters and
+        details_truncated says whether anything was cut; get_communication
+        returns the full row.
+        """
+        if preview_chars is None:
+            details = "c.details"
+        else:
+            preview_chars = int(preview_chars)
+            details = (f"substr(c.details, 1, {preview_chars}) AS details, "
+                       f"length(c.details) > {preview_chars} AS details_truncated")
+        return self._keyset_page(
+            "communications:comm_date",
+            f"""c.id, c.contact_id, c.comm_type, c.comm_date, c.created_at, {details},
+               ct.first_name || ' ' || ct.last_name as contact_name,
+               CASE
+                   WHEN ct.contact_type = 'Company'
+                   THEN ct.company_name
+                   ELSE NULL
+               END as company_name""",
+            "communications c JOIN contacts ct ON c.contact_id = ct.id",
+            ["c.contact_id = ?"], [contact_id], ["c.comm_date", "c.id"], True,
+            limit, page_token
+        )
+
+    def get_communication(self, comm_id: int) -> Optional[Dict]:
+        """One communication with its full details, or None"""
+        self.cursor.execute("SELECT * FROM communications WHERE id = ?", (comm_id,))
+        row = self.cursor.fetchone()
+        return dict(row) if row else None
+
+    def iter_communications(self, contact_id: int, page_size: int = 500) -> Iterator[Dict]:
+        return iter_pages(self.get_communications_page, page_size, contact_id=contact_id)
+
+    def get_contact_profile(self, contact_id: int, parts: Sequence[str] = PROFILE_PARTS,
+                            communications_limit: int = PROFILE_COMMUNICATIONS) -> Dict[str, Any]:
+        """The contact view's data, read in one transaction so the parts agree.
+
+        'contact' is the contact row (None if missing or deleted), 'policies'
+        its active policies not yet past renewal, soonest first, and
+        'communications' the first Page of its history (details cut to
+        COMMUNICATION_PREVIEW_CHARS) with the total count and the contact's
+        last_contacted_at. `parts` limits which are read.
+        """
+        unknown = set(parts) - set(PROFILE_PARTS)
+        if unknown:
+            raise DatabaseError(f"Unknown contact profile parts: {', '.join(sorted(unknown))}")
+        profile: Dict[str, Any] = {'contact_id': contact_id}
+        with self.transaction():
+            if 'contact' in parts:
+                self.cursor.execute(
+                    "SELECT * FROM contacts WHERE id = ? AND status != 'Deleted'", (contact_id,))
+                row = self.cursor.fetchone()
+                profile['contact'] = dict(row) if row else None
+            if 'policies' in parts:
+                profile['policies'] = self.get_renewals(contact_id=contact_id)
+            if 'communications' in parts:
+                profile['communications'] = self.get_communications_page(
+                    contact_id, communications_limit, preview_chars=COMMUNICATION_PREVIEW_CHARS)
+                self.cursor.execute("""
+                    SELECT last_contacted_at,
+                           (SELECT COUNT(*) FROM communications WHERE contact_id = ?1)
+                    FROM contacts WHERE id = ?1
+                """, (contact_id,))
+                row = self.cursor.fetchone()
+                profile['last_contacted_at'], profile['communication_count'] = row if row else (None, 0)
+        return profile
+
+    # Export
+    def export_cursor(self, table: str, status: Optional[str] = None,
+                      carrier: Optional[str] = None,
+                      renewal_days: Optional[int] = None) -> sqlite3.Cursor:
+        """Open cursor over every row of contacts, policies or communications,
+        in id order, for streaming to a file.
+
+        Rows are plain tuples (column names are in cursor.description) and
+        are read as the caller iterates, so nothing is held in memory.
+        status filters contacts and policies; carrier and renewal_days
+        (policies renewing within that many days from today) filter
+        policies. Deleted contacts and policies are only exported when asked
+        for by status, and communications of deleted contacts never are.
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        if table == 'contacts':
+            query = "SELECT c.* FROM contacts c"
+            if status is None:
+                conditions.append("c.status != 'Deleted'")
+            else:
+                conditions.append("c.status = ?")
+                params.append(status)
+            order = "c.id"
+        elif table == 'policies':
+            query = f"SELECT {POLICY_COLUMNS} FROM policies p JOIN contacts c ON p.contact_id = c.id"
+            if renewal_days is not None:
+                conditions, params = self._renewal_filters(renewal_days, carrier, None,
+                                                           status, None, None)
+            else:
+                if status is None:
+                    conditions.append("p.status != 'Deleted'")
+                else:
+                    conditions.append("p.status = ?")
+                    params.append(status)
+                if carrier is not None:
+                    conditions.append("p.carrier = ?")
+                    params.append(carrier)
+            order = "p.id"
+        elif table == 'communications':
+            if status is not None or carrier is not None or renewal_days is not None:
+                raise DatabaseError("Communications exports take no filters")
+            query = """
+                SELECT m.*, c.first_name || ' ' || c.last_name AS contact_name
+                FROM communications m JOIN contacts c ON m.contact_id = c.id
+            """
+            conditions.append("c.status != 'Deleted'")
+            order = "m.id"
+        else:
+            raise DatabaseError(f"Cannot export {table}")
+        if table != 'policies' and carrier is not None:
+            raise DatabaseError("Carrier filters apply to policies only")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(f"{query} {where} ORDER BY {order}", params)
+        except sqlite3.Error as e:
+            cursor.close()
+            raise DatabaseError(f"Could not export {table}: {str(e)}")
+        return cursor
+
     def fix_last_contacted_dates(self):
-        """One-time fix to update all contacts' last_contacted_at fields"""
+        """Recompute every contact's last_contacted_at from its communications.
+
+        The triggers keep the column current; this is the backfill used by the
+        schema migration and a repair tool if the column is ever suspect.
+        """
         self.cursor.execute("""
             UPDATE contacts
             SET last_contacted_at = (
@@ -283,10 +1203,5 @@ class DatabaseManager:
                 FROM communications
                 WHERE communications.contact_id = contacts.id
             )
-            WHERE EXISTS (
-                SELECT 1
-                FROM communications
-                WHERE communications.contact_id = contacts.id
-            )
         """)
-        self.conn.commit()
\ No newline at end of file
+        self._commit()
\ No newline at end of file
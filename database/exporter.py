@@ -0,0 +1,192 @@
+"""Streaming export of contacts, policies and communications.
+
+    python -m database.exporter policies book.csv.gz --status Active --renewal-days 90
+    python -m database.exporter communications comms.jsonl --compress xz
+    python -m database.exporter contacts contacts.parquet
+
+Rows go straight from a SQLite cursor to the file in fixed-size batches,
+so memory use does not depend on the size of the export, and the whole
+export reads one consistent snapshot. CSV and JSONL can be compressed with
+gzip, bz2 or xz; Parquet needs the optional pyarrow package and compresses
+with its own codecs (snappy by default).
+"""
+import argparse
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from .db_manager import DatabaseManager, connect
+from utils.exceptions import CRMError, DatabaseError, ValidationError
+
+EXPORT_TABLES = ('contacts', 'policies', 'communications')
+FORMATS = ('csv', 'jsonl', 'parquet')
+COMPRESSORS = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+BATCH_SIZE = 5000
+
+# Exported columns that are not text
+INTEGER_COLUMNS = {'id', 'contact_id'}
+REAL_COLUMNS = {'premium'}
+
+ProgressCallback = Callable[[int, float], None]
+
+def guess_format(path: Path) -> Optional[str]:
+    """Format and compression implied by a file name like book.csv.gz"""
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes.pop()
+    fmt = suffixes[-1].lstrip('.') if suffixes else None
+    return fmt if fmt in FORMATS else None
+
+def guess_compression(path: Path) -> Optional[str]:
+    return COMPRESSION_SUFFIXES.get(path.suffix.lower())
+
+def _batches(cursor) -> Iterator[List[Sequence[Any]]]:
+    while True:
+        rows = cursor.fetchmany(BATCH_SIZE)
+        if not rows:
+            return
+        yield rows
+
+def _open_text(path: Path, compression: Optional[str]):
+    if compression is None:
+        return open(path, 'w', newline='', encoding='utf-8')
+    return COMPRESSORS[compression](path, 'wt', newline='', encoding='utf-8')
+
+def _write_csv(f, columns: List[str], batches: Iterator[List[Sequence[Any]]],
+               progress: Callable[[int], None]):
+    writer = csv.writer(f)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        progress(len(rows))
+
+def _write_jsonl(f, columns: List[str], batches: Iterator[List[Sequence[Any]]],
+                 progress: Callable[[int], None]):
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    for rows in batches:
+        f.write("".join(encode(dict(zip(columns, row))) + "\n" for row in rows))
+        progress(len(rows))
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValidationError("Parquet export needs the pyarrow package (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+def _write_parquet(path: Path, columns: List[str], batches: Iterator[List[Sequence[Any]]],
+                   progress: Callable[[int], None], compression: Optional[str]):
+    pa, pq = _import_pyarrow()
+
+    schema = pa.schema([
+        (column, pa.int64() if column in INTEGER_COLUMNS
+         else pa.float64() if column in REAL_COLUMNS else pa.string())
+        for column in columns
+    ])
+    with pq.ParquetWriter(str(path), schema, compression=compression or 'snappy') as writer:
+        for rows in batches:
+            arrays = [pa.array([row[i] for row in rows], type=field.type)
+                      for i, field in enumerate(schema)]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            progress(len(rows))
+
+def export_table(db: DatabaseManager, table: str, path: Path, fmt: Optional[str] = None,
+                 compression: Optional[str] = None, status: Optional[str] = None,
+                 carrier: Optional[str] = None, renewal_days: Optional[int] = None,
+                 progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """Write table to path; returns the row count, elapsed seconds and rows/s.
+
+    fmt defaults to the file extension. compression is gzip, bz2 or xz for
+    CSV/JSONL and any pyarrow codec for Parquet. progress(rows, elapsed) is
+    called after every batch.
+    """
+    path = Path(path)
+    fmt = fmt or guess_format(path)
+    if fmt not in FORMATS:
+        raise ValidationError(f"Unknown export format for {path.name}; use one of {', '.join(FORMATS)}")
+    if fmt == 'parquet':
+        _import_pyarrow()
+    elif compression is not None and compression not in COMPRESSORS:
+        raise ValidationError(f"Unknown compression: {compression}")
+
+    written = 0
+    started = time.perf_counter()
+
+    def count(rows: int):
+        nonlocal written
+        written += rows
+        if progress:
+            progress(written, time.perf_counter() - started)
+
+    # One read transaction, so every batch sees the same snapshot
+    with db.transaction():
+        cursor = db.export_cursor(table, status=status, carrier=carrier,
+                                  renewal_days=renewal_days)
+        try:
+            columns = [column[0] for column in cursor.description]
+            if fmt == 'parquet':
+                _write_parquet(path, columns, _batches(cursor), count, compression)
+            else:
+                with _open_text(path, compression) as f:
+                    writer = _write_csv if fmt == 'csv' else _write_jsonl
+                    writer(f, columns, _batches(cursor), count)
+        except BaseException as e:
+            # Never leave a truncated export behind
+            path.unlink(missing_ok=True)
+            if isinstance(e, sqlite3.Error):
+                raise DatabaseError(f"Could not export {table}: {str(e)}")
+            raise
+        finally:
+            cursor.close()
+
+    elapsed = time.perf_counter() - started
+    return {'rows': written, 'seconds': elapsed, 'rows_per_sec': written / max(elapsed, 1e-9)}
+
+def _print_progress(rows: int, elapsed: float) -> None:
+    print(f"\r{rows:,} rows ({rows / max(elapsed, 1e-9):,.0f} rows/s)",
+          end="", file=sys.stderr, flush=True)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Export contacts, policies or communications")
+    parser.add_argument("table", choices=EXPORT_TABLES)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--db", type=Path, help="database file (default: database.path from config.json)")
+    parser.add_argument("--format", choices=FORMATS, help="default: from the output file name")
+    parser.add_argument("--compress", help="gzip, bz2 or xz (default: from the output file name); "
+                                           "a pyarrow codec such as zstd for parquet")
+    parser.add_argument("--status", help="contact or policy status")
+    parser.add_argument("--carrier", help="policies from this carrier only")
+    parser.add_argument("--renewal-days", type=int,
+                        help="policies renewing within this many days from today")
+    args = parser.parse_args(argv)
+
+    compression = args.compress
+    if compression is None and (args.format or guess_format(args.output)) != 'parquet':
+        compression = guess_compression(args.output)
+
+    conn = connect(args.db)
+    db = DatabaseManager(conn)
+    try:
+        result = export_table(db, args.table, args.output, args.format, compression,
+                              status=args.status, carrier=args.carrier,
+                              renewal_days=args.renewal_days, progress=_print_progress)
+    except (OSError, CRMError) as e:
+        print(f"\nError: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+        conn.close()
+    print(file=sys.stderr)
+    print(f"{result['rows']:,} rows exported to {args.output} "
+          f"in {result['seconds']:.1f}s ({result['rows_per_sec']:,.0f} rows/s)")
+
+if __name__ == "__main__":
+    main()
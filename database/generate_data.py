@@ -0,0 +1,271 @@
+"""Synthetic data generator for benchmarking at production volumes.
+
+    python -m database.generate_data --contacts 1000000 --policies 3000000 \\
+        --communications 20000000 --seed 42 --workers 4
+
+Rows are generated in fixed-size chunks by worker processes and written by
+this process (SQLite has a single writer), one DatabaseManager.bulk_load()
+transaction per chunk. Every chunk draws from its own RNG seeded by
+(seed, table, chunk), so the same arguments always produce the same data
+whatever --workers is.
+
+Ownership is skewed the way real books are: a handful of huge commercial
+accounts (--whales) hold --whale-share of all policies and communications,
+and the remaining rows favour lower contact ids over higher ones.
+Communications are dated in UTC with an explicit offset, as the app
+stores them.
+"""
+import argparse
+import multiprocessing
+import random
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .db_manager import (DatabaseManager, connect, CONTACT_INSERT, POLICY_INSERT,
+                         COMMUNICATION_INSERT)
+from .add_test_data import (INDIVIDUAL_NAMES, COMPANIES, COMPANY_CONTACTS, TITLES,
+                            CARRIERS, COMM_DETAILS)
+
+FIRST_NAMES = [first for first, _ in INDIVIDUAL_NAMES + COMPANY_CONTACTS] + [
+    "Aaliyah", "Carlos", "Chen", "Fatima", "Hiroshi", "Ingrid", "Kwame",
+    "Lucia", "Mohammed", "Olga", "Priya", "Rafael", "Siobhan", "Thanh", "Zoe"
+]
+
+LAST_NAMES = [last for _, last in INDIVIDUAL_NAMES + COMPANY_CONTACTS] + [
+    "Nguyen", "Patel", "Kim", "O'Brien", "Kowalski", "Okafor", "Rossi",
+    "Schmidt", "Tanaka", "Ivanova", "Haddad", "Silva", "Murphy", "Cohen"
+]
+
+# Bumped whenever the same arguments start producing different data, so
+# cached generated databases (see benchmarks.run) are not reused
+DATA_VERSION = 2
+
+COMPANY_WORDS = [
+    "Summit", "Valley", "Metro", "Premier", "Global", "Reliable", "Sunshine",
+    "Pioneer", "Harbor", "Keystone", "Cardinal", "Evergreen", "Northstar"
+]
+
+COMPANY_KINDS = [
+    "Manufacturing", "Logistics", "Restaurants", "Properties", "Construction",
+    "Healthcare", "Transport", "Energy", "Financial", "Dental", "Farms"
+]
+
+COMPANY_SUFFIXES = ["Inc.", "LLC", "Co.", "Corp.", "Group"]
+
+INDIVIDUAL_POLICY_TYPES = ['Auto', 'Home', 'Life', 'Umbrella']
+COMPANY_POLICY_TYPES = ['Business', 'Liability', 'Workers Comp', 'Property']
+COMM_TYPES = ['Phone Call', 'Email', 'Face to Face', 'Video Call', 'Text Message']
+STREETS = ["Main St", "Oak Ave", "Maple Dr", "Washington Blvd", "Park Rd"]
+CITIES = ["Springfield", "Franklin", "Clinton", "Georgetown", "Salem"]
+STATES = ["IL", "OH", "MI", "IN", "WI"]
+EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "aol.com", "hotmail.com"]
+
+# Share of contacts that are companies, and status mixes
+COMPANY_SHARE = 0.2
+CONTACT_STATUSES = ['Active'] * 7 + ['Inactive'] * 2 + ['Lead']
+POLICY_STATUSES = ['Active'] * 8 + ['Cancelled', 'Expired']
+
+class GenerationPlan:
+    """Everything a worker needs to build any chunk of any table"""
+
+    def __init__(self, seed: int, first_contact_id: int, contacts: int,
+                 first_policy_number: int, whales: int, whale_share: float,
+                 now: datetime):
+        self.seed = seed
+        self.first_contact_id = first_contact_id
+        self.contacts = contacts
+        self.first_policy_number = first_policy_number
+        self.whales = min(whales, contacts)
+        self.whale_share = whale_share if self.whales else 0.0
+        self.now = now
+
+    def rng(self, table: str, chunk: int) -> random.Random:
+        return random.Random(f"{self.seed}:{table}:{chunk}")
+
+    def is_company(self, index: int) -> bool:
+        # The first contacts are the whale accounts, always companies
+        return index < self.whales or (index * 2654435761 + self.seed) % 1000 < COMPANY_SHARE * 1000
+
+    def owner(self, rng: random.Random) -> Tuple[int, int]:
+        """Pick (contact id, contact index) for a policy or communication"""
+        if rng.random() < self.whale_share:
+            index = rng.randrange(self.whales)
+        else:
+            others = self.contacts - self.whales
+            index = self.whales + int(others * rng.random() ** 2) if others else 0
+        return self.first_contact_id + index, index
+
+def _phone(rng: random.Random) -> str:
+    return f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+
+def _contact_rows(plan: GenerationPlan, rng: random.Random, start: int, count: int) -> List[Tuple]:
+    rows = []
+    for index in range(start, start + count):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        company = plan.is_company(index)
+        if index < plan.whales:
+            company_name = COMPANIES[index % len(COMPANIES)]
+        elif company:
+            company_name = (f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_KINDS)} "
+                            f"{rng.choice(COMPANY_SUFFIXES)}")
+        else:
+            company_name = None
+        address = (f"{rng.randint(100, 9999)} {rng.choice(STREETS)}\n{rng.choice(CITIES)}, "
+                   f"{rng.choice(STATES)} {rng.randint(10000, 99999)}")
+        rows.append((
+            'Company' if company else 'Individual',
+            company_name,
+            first_name,
+            last_name,
+            rng.choice(TITLES) if company else None,
+            f"{first_name.lower()}.{last_name.lower()}{index}@{rng.choice(EMAIL_DOMAINS)}",
+            _phone(rng),
+            _phone(rng) if rng.random() < 0.5 else None,
+            address,
+            "Corporate client" if company else "Individual client",
+            'Active' if index < plan.whales else rng.choice(CONTACT_STATUSES)
+        ))
+    return rows
+
+def _policy_rows(plan: GenerationPlan, rng: random.Random, start: int, count: int) -> List[Tuple]:
+    rows = []
+    for number in range(start, start + count):
+        contact_id, index = plan.owner(rng)
+        company = plan.is_company(index)
+        carrier = rng.choice(CARRIERS)
+        start_date = plan.now - timedelta(days=rng.randrange(30, 365 * 3))
+        renewal_date = start_date + timedelta(days=365)
+        premium = rng.uniform(2000, 50000) if company else rng.uniform(500, 5000)
+        rows.append((
+            contact_id,
+            rng.choice(COMPANY_POLICY_TYPES if company else INDIVIDUAL_POLICY_TYPES),
+            # Wider than the 6 digits used by add_test_data, so never clashes
+            f"{carrier[:3].upper()}-{plan.first_policy_number + number:09d}",
+            carrier,
+            round(premium, 2),
+            start_date.strftime('%Y-%m-%d'),
+            renewal_date.strftime('%Y-%m-%d'),
+            "Generated policy",
+            rng.choice(POLICY_STATUSES)
+        ))
+    return rows
+
+def _communication_rows(plan: GenerationPlan, rng: random.Random, start: int, count: int) -> List[Tuple]:
+    rows = []
+    for _ in range(count):
+        contact_id, _index = plan.owner(rng)
+        comm_date = plan.now - timedelta(seconds=rng.randrange(365 * 3 * 86400))
+        rows.append((
+            contact_id,
+            rng.choice(COMM_TYPES),
+            comm_date.isoformat(timespec='seconds'),
+            rng.choice(COMM_DETAILS)
+        ))
+    return rows
+
+TABLES: Dict[str, Tuple[str, Callable[..., List[Tuple]]]] = {
+    'contacts': (CONTACT_INSERT, _contact_rows),
+    'policies': (POLICY_INSERT, _policy_rows),
+    'communications': (COMMUNICATION_INSERT, _communication_rows),
+}
+
+def _generate_chunk(args: Tuple[GenerationPlan, str, int, int, int]) -> List[Tuple]:
+    plan, table, chunk, start, count = args
+    return TABLES[table][1](plan, plan.rng(table, chunk), start, count)
+
+def _chunks(plan: GenerationPlan, table: str, total: int, chunk_size: int) -> Iterator[Tuple]:
+    for chunk, start in enumerate(range(0, total, chunk_size)):
+        yield plan, table, chunk, start, min(chunk_size, total - start)
+
+def _generated(pool: Optional[Any], tasks: Iterator[Tuple], workers: int) -> Iterator[List[Tuple]]:
+    """Chunks in order, with at most two per worker generated ahead of the writer"""
+    if pool is None:
+        for task in tasks:
+            yield _generate_chunk(task)
+        return
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(_generate_chunk, (task,)))
+        if len(pending) >= workers * 2:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+def generate(db: DatabaseManager, contacts: int, policies: int, communications: int,
+             seed: int = 0, workers: int = 1, chunk_size: int = 50000, whales: int = 5,
+             whale_share: float = 0.2, progress: Optional[Callable[[str, int, float], None]] = None
+             ) -> Dict[str, float]:
+    """Append generated rows to the database; returns rows/sec per table"""
+    first_contact_id = db.cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM contacts").fetchone()[0]
+    first_policy_number = db.cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM policies").fetchone()[0]
+    plan = GenerationPlan(seed, first_contact_id, contacts, first_policy_number,
+                          whales, whale_share, datetime.now(timezone.utc).replace(microsecond=0))
+
+    rates = {}
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        for table, total in (('contacts', contacts), ('policies', policies),
+                             ('communications', communications)):
+            if total <= 0:
+                continue
+            query = TABLES[table][0]
+            written = 0
+            started = time.perf_counter()
+            for rows in _generated(pool, _chunks(plan, table, total, chunk_size), workers):
+                with db.bulk_load():
+                    written += db.executemany(query, rows)
+                if progress:
+                    progress(table, written, time.perf_counter() - started)
+            rates[table] = written / max(time.perf_counter() - started, 1e-9)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    return rates
+
+def _print_progress(table: str, written: int, elapsed: float) -> None:
+    print(f"\r{table}: {written:,} rows ({written / max(elapsed, 1e-9):,.0f} rows/s)",
+          end="", file=sys.stderr, flush=True)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Append synthetic CRM data for benchmarking")
+    parser.add_argument("--db", type=Path, help="database file (default: database.path from config.json)")
+    parser.add_argument("--contacts", type=int, default=10000)
+    parser.add_argument("--policies", type=int, default=30000)
+    parser.add_argument("--communications", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes generating rows (writes stay in this process)")
+    parser.add_argument("--chunk-size", type=int, default=50000,
+                        help="rows per generated chunk and per transaction")
+    parser.add_argument("--whales", type=int, default=5,
+                        help="number of huge commercial accounts")
+    parser.add_argument("--whale-share", type=float, default=0.2,
+                        help="fraction of policies and communications owned by the whales")
+    args = parser.parse_args(argv)
+    if args.contacts <= 0 and (args.policies > 0 or args.communications > 0):
+        parser.error("policies and communications are attached to generated contacts; pass --contacts")
+    if args.chunk_size <= 0 or args.workers <= 0:
+        parser.error("--chunk-size and --workers must be positive")
+
+    conn = connect(args.db)
+    db = DatabaseManager(conn)
+    try:
+        db.create_tables()
+        rates = generate(db, args.contacts, args.policies, args.communications,
+                         seed=args.seed, workers=args.workers, chunk_size=args.chunk_size,
+                         whales=args.whales, whale_share=args.whale_share,
+                         progress=_print_progress)
+    finally:
+        db.close()
+        conn.close()
+    print(file=sys.stderr)
+    for table, rate in rates.items():
+        print(f"{table}: {rate:,.0f} rows/s")
+
+if __name__ == "__main__":
+    main()
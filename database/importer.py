@@ -0,0 +1,269 @@
+"""Streaming CSV import of contacts, policies and communications.
+
+    python -m database.importer contacts contacts.csv
+    python -m database.importer policies policies.csv --batch-size 20000
+
+The file is read one row at a time and written in batches, each batch in
+its own DatabaseManager.bulk_load() transaction, so memory use does not
+grow with the file. Rows are checked against the same rules as the entry
+dialogs (utils.validation) plus type and reference checks; rows that fail
+are written with their line number and the reason to a rejects file
+(default: <file>.rejects.csv) and everything else is imported.
+
+Column names match the table columns. Policies and communications refer
+to existing contacts by contact_id. Dates are ISO 8601; a comm_date
+without a UTC offset is taken to be UTC, as communications are stored.
+"""
+import argparse
+import csv
+import json
+import math
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .db_manager import DatabaseManager, connect
+from utils.exceptions import DatabaseError, ValidationError
+from utils.validation import validate_contact, validate_policy, validate_communication
+
+ProgressCallback = Callable[[int, int, int, float], None]
+
+def _text(row: Dict[str, str], column: str) -> Optional[str]:
+    value = (row.get(column) or '').strip()
+    return value or None
+
+def _number(row: Dict[str, str], column: str, convert: Callable[[str], Any]) -> Any:
+    value = _text(row, column)
+    if value is None:
+        raise ValidationError(f"{column} is required")
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValidationError(f"Invalid {column}: {value}")
+
+def _iso_date(row: Dict[str, str], column: str) -> str:
+    return _number(row, column, date.fromisoformat).isoformat()
+
+def _utc_timestamp(value: str) -> str:
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc).isoformat()
+
+def contact_from_csv(row: Dict[str, str]) -> Dict[str, Any]:
+    contact = {
+        'contact_type': _text(row, 'contact_type') or 'Individual',
+        'status': _text(row, 'status') or 'Active',
+        'company_name': _text(row, 'company_name'),
+        'first_name': _text(row, 'first_name'),
+        'last_name': _text(row, 'last_name'),
+        'title': _text(row, 'title'),
+        'email': _text(row, 'email'),
+        'phone': _text(row, 'phone'),
+        'mobile_phone': _text(row, 'mobile_phone'),
+        'address': _text(row, 'address'),
+        'notes': _text(row, 'notes'),
+    }
+    if contact['contact_type'] not in ('Individual', 'Company'):
+        raise ValidationError(f"Invalid contact_type: {contact['contact_type']}")
+    validate_contact(contact)
+    return contact
+
+def policy_from_csv(row: Dict[str, str]) -> Dict[str, Any]:
+    policy = {
+        'contact_id': _number(row, 'contact_id', int),
+        'policy_type': _text(row, 'policy_type') or 'Other',
+        'policy_number': _text(row, 'policy_number'),
+        'carrier': _text(row, 'carrier'),
+        'premium': _number(row, 'premium', float),
+        'start_date': _iso_date(row, 'start_date'),
+        'renewal_date': _iso_date(row, 'renewal_date'),
+        'notes': _text(row, 'notes'),
+        'status': _text(row, 'status') or 'Active',
+    }
+    # float() accepts nan and inf, which SQLite cannot store as a premium
+    if not math.isfinite(policy['premium']) or policy['premium'] < 0:
+        raise ValidationError(f"Invalid premium: {policy['premium']}")
+    validate_policy(policy)
+    return policy
+
+def communication_from_csv(row: Dict[str, str]) -> Dict[str, Any]:
+    communication = {
+        'contact_id': _number(row, 'contact_id', int),
+        'comm_type': _text(row, 'comm_type') or 'Unspecified',
+        'comm_date': _number(row, 'comm_date', _utc_timestamp),
+        'details': _text(row, 'details'),
+    }
+    validate_communication(communication)
+    return communication
+
+# Table -> (columns every file must have, row parser, DatabaseManager bulk insert)
+IMPORT_TABLES: Dict[str, Tuple[Tuple[str, ...], Callable, Callable]] = {
+    'contacts': (('first_name', 'last_name'), contact_from_csv,
+                 DatabaseManager.add_contacts_many),
+    'policies': (('contact_id', 'policy_number', 'carrier', 'premium',
+                  'start_date', 'renewal_date'), policy_from_csv,
+                 DatabaseManager.add_policies_many),
+    'communications': (('contact_id', 'comm_date', 'details'), communication_from_csv,
+                       DatabaseManager.add_communications_many),
+}
+
+def _existing(db: DatabaseManager, query: str, values: set) -> set:
+    """Members of values returned by query, which selects from json_each(?)"""
+    if not values:
+        return set()
+    db.cursor.execute(query, (json.dumps(list(values)),))
+    return {row[0] for row in db.cursor.fetchall()}
+
+def _check_references(db: DatabaseManager, table: str,
+                      batch: List[Tuple[int, Dict[str, str], Dict[str, Any]]]) -> List[Tuple[int, Dict[str, str], str]]:
+    """Drop rows from batch (in place) that the database would refuse and
+    return them as rejects"""
+    if table == 'contacts':
+        return []
+    contact_ids = _existing(db, """
+        SELECT id FROM contacts WHERE id IN (SELECT value FROM json_each(?))
+    """, {record['contact_id'] for _, _, record in batch})
+    taken = set()
+    if table == 'policies':
+        taken = _existing(db, """
+            SELECT policy_number FROM policies
+            WHERE policy_number IN (SELECT value FROM json_each(?))
+        """, {record['policy_number'] for _, _, record in batch})
+
+    accepted = []
+    rejects = []
+    for line, row, record in batch:
+        if record['contact_id'] not in contact_ids:
+            rejects.append((line, row, f"Unknown contact_id: {record['contact_id']}"))
+        elif table == 'policies' and record['policy_number'] in taken:
+            rejects.append((line, row, f"Duplicate policy_number: {record['policy_number']}"))
+        else:
+            if table == 'policies':
+                taken.add(record['policy_number'])
+            accepted.append((line, row, record))
+    batch[:] = accepted
+    return rejects
+
+class _RejectWriter:
+    """CSV of rejected rows, created on the first reject"""
+
+    def __init__(self, path: Path, fieldnames: List[str]):
+        self.path = path
+        self.fieldnames = ['line', 'error'] + fieldnames
+        self.file = None
+        self.writer = None
+
+    def write(self, line: int, row: Dict[str, str], error: str):
+        if self.writer is None:
+            self.file = open(self.path, 'w', newline='', encoding='utf-8')
+            self.writer = csv.DictWriter(self.file, self.fieldnames, extrasaction='ignore')
+            self.writer.writeheader()
+        self.writer.writerow(dict(row, line=line, error=error))
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+def import_csv(db: DatabaseManager, table: str, source: Path,
+               rejects_path: Optional[Path] = None, batch_size: int = 50000,
+               progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """Import source into table; returns the read/imported/rejected row
+    counts, the rejects file (None if nothing was rejected) and rows/s.
+
+    progress(read, imported, rejected, elapsed) is called after every batch.
+    Batches already written stay imported if a later one fails.
+    """
+    if table not in IMPORT_TABLES:
+        raise ValidationError(f"Cannot import into {table}")
+    required, parse, insert = IMPORT_TABLES[table]
+    source = Path(source)
+    rejects_path = Path(rejects_path) if rejects_path else source.with_name(source.name + '.rejects.csv')
+
+    read = imported = rejected = 0
+    started = time.perf_counter()
+    with open(source, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        missing = [column for column in required if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValidationError(f"{source.name} is missing columns: {', '.join(missing)}")
+        rejects = _RejectWriter(rejects_path, list(reader.fieldnames))
+        try:
+            batch: List[Tuple[int, Dict[str, str], Dict[str, Any]]] = []
+            while True:
+                row = next(reader, None)
+                if row is not None:
+                    read += 1
+                    try:
+                        batch.append((reader.line_num, row, parse(row)))
+                    except ValidationError as e:
+                        rejects.write(reader.line_num, row, e.message)
+                        rejected += 1
+                if batch and (len(batch) >= batch_size or row is None):
+                    first_line = batch[0][0]
+                    try:
+                        with db.bulk_load():
+                            for line, bad_row, error in _check_references(db, table, batch):
+                                rejects.write(line, bad_row, error)
+                                rejected += 1
+                            if batch:
+                                imported += insert(db, (record for _, _, record in batch))
+                    except (sqlite3.Error, DatabaseError) as e:
+                        # bulk inserts already wrap their sqlite3 errors
+                        raise DatabaseError(f"Import stopped at line {first_line} "
+                                            f"after {imported:,} rows: {str(e)}")
+                    batch = []
+                    if progress:
+                        progress(read, imported, rejected, time.perf_counter() - started)
+                if row is None:
+                    break
+        finally:
+            rejects.close()
+
+    elapsed = time.perf_counter() - started
+    return {
+        'read': read,
+        'imported': imported,
+        'rejected': rejected,
+        'rejects_path': rejects_path if rejected else None,
+        'rows_per_sec': read / max(elapsed, 1e-9),
+    }
+
+def _print_progress(read: int, imported: int, rejected: int, elapsed: float) -> None:
+    print(f"\r{read:,} rows read, {imported:,} imported, {rejected:,} rejected "
+          f"({read / max(elapsed, 1e-9):,.0f} rows/s)", end="", file=sys.stderr, flush=True)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Import contacts, policies or communications from CSV")
+    parser.add_argument("table", choices=sorted(IMPORT_TABLES))
+    parser.add_argument("source", type=Path)
+    parser.add_argument("--db", type=Path, help="database file (default: database.path from config.json)")
+    parser.add_argument("--rejects", type=Path, help="rejected rows file (default: <source>.rejects.csv)")
+    parser.add_argument("--batch-size", type=int, default=50000,
+                        help="rows per transaction")
+    args = parser.parse_args(argv)
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be positive")
+
+    conn = connect(args.db)
+    db = DatabaseManager(conn)
+    try:
+        db.create_tables()
+        result = import_csv(db, args.table, args.source, args.rejects,
+                            batch_size=args.batch_size, progress=_print_progress)
+    except (OSError, ValidationError, DatabaseError) as e:
+        print(f"\nError: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+        conn.close()
+    print(file=sys.stderr)
+    print(f"{result['imported']:,} of {result['read']:,} rows imported "
+          f"({result['rows_per_sec']:,.0f} rows/s)")
+    if result['rejects_path']:
+        print(f"{result['rejected']:,} rejected rows written to {result['rejects_path']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Check the query plans of everything DatabaseManager runs.
+
+    python -m database.index_advisor benchmarks/data/crm_50000_seed42_v2.db
+    python -m database.index_advisor crm.db --all --json plans.json
+
+Calls every DatabaseManager query method with arguments taken from the
+database (the busiest contact, one of its policies, and so on), writes
+included but rolled back, and records each statement SQLite runs. Each
+distinct statement shape is explained with EXPLAIN QUERY PLAN and flagged
+when SQLite reads a whole table ('scan') or sorts rows in a temporary
+B-tree ('temp b-tree'). Some cases read everything by design, such as
+exports and the summary checks, and list the flags they expect.
+
+Run it against a large generated database (python -m benchmarks.run
+builds them) since the planner chooses differently on tiny tables. Exits
+1 if any statement has a flag its case does not expect.
+"""
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional
+from .db_manager import CONTACT_SORT_KEYS, POLICY_SORT_KEYS, DatabaseManager, connect
+from .instrumentation import explain, statement_shape
+from utils.exceptions import DatabaseError
+
+SCAN = 'scan'
+TEMP_BTREE = 'temp b-tree'
+
+class Case(NamedTuple):
+    run: Callable[[DatabaseManager, Dict[str, Any]], Any]
+    # Flags this case is expected to produce
+    allow: FrozenSet[str] = frozenset()
+
+def plan_flags(plan: List[str], shadow_tables: FrozenSet[str] = frozenset()) -> List[str]:
+    """Flags for one EXPLAIN QUERY PLAN; scans of subquery results, virtual
+    tables (FTS, json_each) and their small shadow tables are not table scans"""
+    subqueries = {match.group(1) for line in plan
+                  for match in [re.match(r"(?:MATERIALIZE|CO-ROUTINE) (\S+)", line)] if match}
+    flags = []
+    for line in plan:
+        match = re.match(r"SCAN (\S+)(.*)", line)
+        if match:
+            name, rest = match.groups()
+            if ('VIRTUAL TABLE' in rest or 'INDEX' in rest or name in subqueries
+                    or name.startswith('(') or name == 'CONSTANT'
+                    or name.split('.')[-1] in shadow_tables):
+                continue
+            flags.append(f"{SCAN} {name}")
+        elif 'TEMP B-TREE' in line:
+            flags.append(TEMP_BTREE)
+    return flags
+
+def _kind(flag: str) -> str:
+    return SCAN if flag.startswith(SCAN + " ") else flag
+
+def _two_pages(fetch_page: Callable[..., Any], **kwargs) -> None:
+    # The second page adds the keyset comparison to the WHERE clause
+    page = fetch_page(limit=50, **kwargs)
+    if page.next_token is not None:
+        fetch_page(limit=50, page_token=page.next_token, **kwargs)
+
+class _Rollback(Exception):
+    pass
+
+def _writes(db: DatabaseManager, s: Dict[str, Any]) -> None:
+    try:
+        with db.transaction():
+            contact_id = db.add_contact({
+                'contact_type': 'Individual', 'first_name': 'Index', 'last_name': 'Advisor',
+                'phone': '(555) 010-0000'
+            })
+            db.update_contact(s['contact_id'], dict(s['contact'], notes='index advisor'))
+            policy_id = db.add_policy({
+                'contact_id': contact_id, 'policy_type': 'Auto', 'policy_number': 'INDEX-ADVISOR',
+                'carrier': s['carrier'], 'premium': 100.0,
+                'start_date': '2024-01-01', 'renewal_date': '2025-01-01'
+            })
+            db.update_policy(s['policy_id'], dict(s['policy'], premium=s['policy']['premium'] + 1))
+            db.delete_policy(policy_id)
+            db.add_communication({
+                'contact_id': s['contact_id'], 'comm_type': 'Email',
+                'comm_date': '2024-01-01T00:00:00', 'details': 'index advisor'
+            })
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+def _cases() -> Dict[str, Case]:
+    whole_table = frozenset({SCAN, TEMP_BTREE})
+    matches = frozenset({TEMP_BTREE})
+    cases = {
+        'get_contacts': Case(lambda db, s: db.get_contacts()),
+        'get_contacts_by_id': Case(lambda db, s: db.get_contacts(contact_id=s['contact_id'])),
+        # Search and phone matches are a few hundred rows at most, sorted
+        # in memory; walking a whole index in order to filter it is slower
+        'get_contacts_search': Case(
+            lambda db, s: db.get_contacts(search_term=s['last_name']), matches),
+        'get_contacts_search_ranked': Case(
+            lambda db, s: db.get_contacts(search_term=s['last_name'] + " " + s['first_name']),
+            matches),
+        'get_contacts_phone': Case(
+            lambda db, s: db.get_contacts(search_term=s['phone_digits'][-4:]), matches),
+        'find_contacts_by_phone': Case(
+            lambda db, s: db.find_contacts_by_phone(s['phone_digits']), matches),
+        'find_contacts_by_phone_prefix': Case(
+            lambda db, s: db.find_contacts_by_phone(s['phone_digits'][:6], match='prefix'),
+            matches),
+        # The outer ORDER BY sorts at most three `limit`-row branches
+        'find_contacts_by_prefix': Case(
+            lambda db, s: db.find_contacts_by_prefix(s['last_name'][:3] + " " + s['first_name'][:1]),
+            frozenset({TEMP_BTREE})),
+        'get_contacts_page_relevance': Case(
+            lambda db, s: _two_pages(db.get_contacts_page, search_term=s['last_name'],
+                                     sort_by='relevance'),
+            matches),
+        'get_contacts_page_search': Case(
+            lambda db, s: _two_pages(db.get_contacts_page, search_term=s['last_name']), matches),
+        'get_policies': Case(lambda db, s: db.get_policies()),
+        # ORDER BY over the single row
+        'get_policies_by_id': Case(
+            lambda db, s: db.get_policies(policy_id=s['policy_id']), frozenset({TEMP_BTREE})),
+        'get_policies_by_contact': Case(lambda db, s: db.get_policies(contact_id=s['contact_id'])),
+        'get_policies_page_filters': Case(
+            lambda db, s: _two_pages(db.get_policies_page, carrier=s['carrier'],
+                                     policy_type=s['policy_type'], status='Active')),
+        'get_policies_page_for_contact': Case(
+            lambda db, s: _two_pages(db.get_policies_page, contact_id=s['contact_id'])),
+        'get_policies_page_premium': Case(
+            lambda db, s: _two_pages(db.get_policies_page, min_premium=1000, max_premium=2000,
+                                     sort_by='premium')),
+        'get_policies_page_renewal': Case(
+            lambda db, s: _two_pages(db.get_policies_page, renewal_from='2025-01-01',
+                                     renewal_to='2025-03-31')),
+        'get_policies_page_contact_search': Case(
+            lambda db, s: _two_pages(db.get_policies_page, contact_search=s['last_name']),
+            matches),
+        'get_renewals': Case(lambda db, s: db.get_renewals(30)),
+        'get_renewals_carrier': Case(lambda db, s: db.get_renewals(90, carrier=s['carrier'])),
+        'get_renewals_contact': Case(lambda db, s: db.get_renewals(contact_id=s['contact_id'])),
+        'get_renewals_page': Case(lambda db, s: _two_pages(db.get_renewals_page, days=90)),
+        'get_renewal_summary': Case(lambda db, s: db.get_renewal_summary()),
+        'get_policy_carriers': Case(lambda db, s: db.get_policy_carriers()),
+        'get_policy_totals_carrier': Case(lambda db, s: db.get_policy_totals('carrier')),
+        'get_policy_totals_month': Case(
+            lambda db, s: db.get_policy_totals('renewal_month', key_from='2025-01', key_to='2025-12')),
+        'get_policy_totals_any_status': Case(
+            lambda db, s: db.get_policy_totals('policy_type', status=None),
+            frozenset({TEMP_BTREE})),
+        'get_top_contacts_by_policies': Case(lambda db, s: db.get_top_contacts_by_policies()),
+        'get_communications': Case(lambda db, s: db.get_communications(s['contact_id'])),
+        'get_communications_page': Case(
+            lambda db, s: _two_pages(db.get_communications_page, contact_id=s['contact_id'],
+                                     preview_chars=200)),
+        'get_communication': Case(lambda db, s: db.get_communication(s['comm_id'])),
+        'get_contact_profile': Case(lambda db, s: db.get_contact_profile(s['contact_id'])),
+        'check_summaries': Case(lambda db, s: db.check_summaries(), whole_table),
+        'writes': Case(_writes),
+    }
+    for sort_by in CONTACT_SORT_KEYS:
+        for descending in (False, True):
+            cases[f"get_contacts_page_{sort_by}{'_desc' if descending else ''}"] = Case(
+                lambda db, s, sort_by=sort_by, descending=descending: _two_pages(
+                    db.get_contacts_page, sort_by=sort_by, descending=descending))
+    for sort_by in POLICY_SORT_KEYS:
+        # By contact, each contact's few policies are put in id order
+        cases[f"get_policies_page_{sort_by}"] = Case(
+            lambda db, s, sort_by=sort_by: _two_pages(db.get_policies_page, sort_by=sort_by),
+            matches if sort_by == 'contact' else frozenset())
+    for table in ('contacts', 'policies', 'communications'):
+        # Exports read the whole table in id order
+        cases[f"export_{table}"] = Case(
+            lambda db, s, table=table: db.export_cursor(table).fetchmany(10), frozenset({SCAN}))
+    return cases
+
+def _samples(db: DatabaseManager) -> Dict[str, Any]:
+    """Arguments for the cases: the contact with the most active policies,
+    its first policy and its newest communication"""
+    top = db.get_top_contacts_by_policies(1)
+    if not top:
+        raise DatabaseError("The database has no active policies to sample")
+    contact_id = top[0]['id']
+    contact = db.get_contacts(contact_id=contact_id)[0]
+    policy = db.get_policies(contact_id=contact_id)[0]
+    comms = db.get_communications_page(contact_id, 1).rows
+    return {
+        'contact_id': contact_id,
+        'contact': contact,
+        'first_name': contact['first_name'],
+        'last_name': contact['last_name'],
+        'phone_digits': re.sub(r"\D", "", contact['mobile_phone'] or contact['phone'] or "5550100"),
+        'policy_id': policy['id'],
+        'policy': policy,
+        'carrier': policy['carrier'],
+        'policy_type': policy['policy_type'],
+        'comm_id': comms[0]['id'] if comms else 0,
+    }
+
+def analyze(db: DatabaseManager, cases: Optional[Dict[str, Case]] = None) -> List[Dict[str, Any]]:
+    """One entry per distinct statement shape: its plan, flags, the cases
+    that ran it and the flags none of them expect"""
+    cases = cases if cases is not None else _cases()
+    samples = _samples(db)
+    statements: Dict[str, Dict[str, Any]] = {}
+    for name, case in cases.items():
+        executed: List[str] = []
+        db.conn.set_trace_callback(executed.append)
+        try:
+            case.run(db, samples)
+        finally:
+            db.conn.set_trace_callback(None)
+        for sql in executed:
+            if not re.match(r"\s*(SELECT|WITH|UPDATE|DELETE|INSERT)\b", sql, re.IGNORECASE):
+                continue
+            shape = statement_shape(sql)
+            entry = statements.get(shape)
+            if entry is None:
+                entry = statements[shape] = {'shape': shape, 'sql': sql, 'cases': []}
+            if name not in entry['cases']:
+                entry['cases'].append(name)
+                entry.setdefault('allowed', []).append(case.allow)
+
+    # PRAGMA table_list needs SQLite 3.37; older versions return no rows
+    shadow_tables = frozenset(row[1] for row in db.conn.execute("PRAGMA table_list")
+                              if row[2] == 'shadow')
+    results = []
+    for entry in statements.values():
+        plan = explain(db.conn, entry['sql'])
+        flags = plan_flags(plan, shadow_tables)
+        unexpected = sorted({
+            flag for flag in flags
+            if not all(_kind(flag) in allow for allow in entry['allowed'])
+        })
+        results.append({
+            'shape': entry['shape'],
+            'cases': entry['cases'],
+            'plan': plan,
+            'flags': flags,
+            'unexpected': unexpected,
+        })
+    results.sort(key=lambda result: (not result['unexpected'], not result['flags'], result['cases'][0]))
+    return results
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Flag table scans and temp B-trees in CRM queries")
+    parser.add_argument("db", type=Path, help="database to plan against, ideally a large generated one")
+    parser.add_argument("--all", action="store_true", help="print every statement, not only flagged ones")
+    parser.add_argument("--json", type=Path, help="write the full report here")
+    args = parser.parse_args(argv)
+    if not args.db.exists():
+        parser.error(f"{args.db} does not exist")
+
+    conn = connect(args.db)
+    db = DatabaseManager(conn)
+    try:
+        db.create_tables()
+        results = analyze(db)
+    except (DatabaseError, sqlite3.Error) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+        conn.close()
+
+    for result in results:
+        if not result['flags'] and not args.all:
+            continue
+        marker = "UNEXPECTED" if result['unexpected'] else ("expected" if result['flags'] else "ok")
+        print(f"[{marker}] {', '.join(result['cases'])}")
+        print(f"  {result['shape'][:300]}")
+        for line in result['plan']:
+            print(f"    {line}")
+    unexpected = [result for result in results if result['unexpected']]
+    flagged = sum(1 for result in results if result['flags'])
+    print(f"\n{len(results)} statements, {flagged} flagged, {len(unexpected)} unexpected")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    sys.exit(1 if unexpected else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("crm.sql")
+
+# Timings kept per statement shape for the p95
+SAMPLES_PER_SHAPE = 500
+SLOW_QUERIES_KEPT = 50
+
+@lru_cache(maxsize=2048)
+def statement_shape(sql: str) -> str:
+    """SQL with literals replaced by ? and whitespace collapsed.
+
+    Statements differing only in inlined values or the length of an IN
+    list share a shape, so their timings are aggregated together.
+    """
+    shape = re.sub(r"--[^\n]*", " ", sql)
+    shape = re.sub(r"'(?:[^']|'')*'", "?", shape)
+    shape = re.sub(r"\b\d+(?:\.\d+)?\b", "?", shape)
+    shape = re.sub(r"\s+", " ", shape).strip()
+    return re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(?, ...)", shape)
+
+class _ShapeStats:
+    __slots__ = ('count', 'total', 'max', 'samples')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLES_PER_SHAPE)
+
+class QueryStats:
+    """Timings of every statement run through a CRM connection.
+
+    Disabled by default; while disabled the cursor hooks cost one attribute
+    check per call. Statements slower than `slow_ms` are logged on
+    "crm.sql" with their EXPLAIN QUERY PLAN and kept in `slow_queries`.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.slow_ms = 100.0
+        self._lock = threading.Lock()
+        self._shapes: Dict[str, _ShapeStats] = {}
+        self.slow_queries: Deque[Dict[str, Any]] = deque(maxlen=SLOW_QUERIES_KEPT)
+
+    def configure(self, enabled: bool, slow_ms: Optional[float] = None) -> None:
+        self.enabled = enabled
+        if slow_ms is not None:
+            self.slow_ms = float(slow_ms)
+
+    def record(self, sql: str, elapsed: float, conn: Optional[sqlite3.Connection] = None,
+               params: Optional[Sequence[Any]] = None) -> None:
+        shape = statement_shape(sql)
+        with self._lock:
+            stats = self._shapes.get(shape)
+            if stats is None:
+                stats = self._shapes[shape] = _ShapeStats()
+            stats.count += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+            stats.samples.append(elapsed)
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms >= self.slow_ms:
+            plan = explain(conn, sql, params) if conn is not None else []
+            with self._lock:
+                self.slow_queries.append({
+                    'shape': shape, 'elapsed_ms': round(elapsed_ms, 3),
+                    'at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'plan': plan
+                })
+            logger.warning("slow query (%.1f ms): %s\n  plan: %s", elapsed_ms, shape,
+                           "\n        ".join(plan) or "n/a")
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-shape statistics in milliseconds, most total time first"""
+        with self._lock:
+            rows = []
+            for shape, stats in self._shapes.items():
+                samples = sorted(stats.samples)
+                p95 = samples[max(0, -(-len(samples) * 95 // 100) - 1)]
+                rows.append({
+                    'shape': shape,
+                    'count': stats.count,
+                    'total_ms': round(stats.total * 1000, 3),
+                    'mean_ms': round(stats.total * 1000 / stats.count, 3),
+                    'p95_ms': round(p95 * 1000, 3),
+                    'max_ms': round(stats.max * 1000, 3),
+                })
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+            self.slow_queries.clear()
+
+    def dump(self, path: Path) -> None:
+        """Write the statistics and recent slow queries to a JSON file"""
+        with self._lock:
+            slow = list(self.slow_queries)
+        with open(path, 'w') as f:
+            json.dump({'statements': self.snapshot(), 'slow_queries': slow,
+                       'slow_ms': self.slow_ms}, f, indent=2)
+
+query_stats = QueryStats()
+
+def explain(conn: sqlite3.Connection, sql: str, params: Optional[Sequence[Any]] = None) -> List[str]:
+    """EXPLAIN QUERY PLAN lines for a statement, or [] if it cannot be explained"""
+    # A plain cursor, so explaining is not itself recorded
+    cursor = sqlite3.Cursor(conn)
+    try:
+        cursor.execute("EXPLAIN QUERY PLAN " + sql, params or ())
+        return [row[3] for row in cursor.fetchall()]
+    except (sqlite3.Error, ValueError):
+        return []
+    finally:
+        cursor.close()
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor reporting each statement's execute + fetch time to query_stats.
+
+    The time of fetchone/fetchmany/fetchall is added to the statement that
+    produced the rows. The statement is recorded after fetchone, once its
+    rows are exhausted, or when the cursor moves on to the next statement.
+    """
+
+    _pending = None
+
+    def execute(self, sql, parameters=()):
+        if not query_stats.enabled:
+            return super().execute(sql, parameters)
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._pending = [sql, parameters, time.perf_counter() - start]
+
+    def executemany(self, sql, seq_of_parameters):
+        if not query_stats.enabled:
+            return super().executemany(sql, seq_of_parameters)
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            query_stats.record(sql, time.perf_counter() - start)
+
+    def executescript(self, sql_script):
+        if not query_stats.enabled:
+            return super().executescript(sql_script)
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            query_stats.record(sql_script, time.perf_counter() - start)
+
+    def fetchone(self):
+        if self._pending is None:
+            return super().fetchone()
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._pending[2] += time.perf_counter() - start
+        # Almost always execute(...).fetchone() on a throwaway cursor
+        self._flush()
+        return row
+
+    def fetchmany(self, size=None):
+        if self._pending is None:
+            return super().fetchmany(size or self.arraysize)
+        start = time.perf_counter()
+        rows = super().fetchmany(size or self.arraysize)
+        self._pending[2] += time.perf_counter() - start
+        if len(rows) < (size or self.arraysize):
+            self._flush()
+        return rows
+
+    def fetchall(self):
+        if self._pending is None:
+            return super().fetchall()
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._pending[2] += time.perf_counter() - start
+        self._flush()
+        return rows
+
+    def close(self):
+        self._flush()
+        super().close()
+
+    def _flush(self):
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            sql, parameters, elapsed = pending
+            query_stats.record(sql, elapsed, self.connection, parameters)
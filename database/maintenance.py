@@ -0,0 +1,119 @@
+"""Database maintenance commands.
+
+    python -m database.maintenance check-summaries
+    python -m database.maintenance rebuild-summaries
+    python -m database.maintenance backup
+    python -m database.maintenance list-backups
+    python -m database.maintenance verify-backup backups/insurance_crm-20240101-020000.db
+    python -m database.maintenance restore backups/insurance_crm-20240101-020000.db
+
+check-summaries compares the trigger-maintained policy summaries with a
+recomputation from policies and exits 1 if they differ; rebuild-summaries
+recomputes them from scratch. backup takes a verified online backup into
+database.backup_dir; restore replaces the database with one, after saving
+the current database next to the backups. Close the CRM before restoring.
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+from .backup import create_backup, list_backups, restore_backup, verify_backup
+from .db_manager import DatabaseManager, connect, database_settings
+from utils.exceptions import DatabaseError
+
+def _open(args: argparse.Namespace) -> DatabaseManager:
+    db = DatabaseManager(connect(args.db))
+    db.create_tables()
+    return db
+
+def check_summaries(args: argparse.Namespace) -> int:
+    db = _open(args)
+    try:
+        differences = db.check_summaries()
+    finally:
+        db.close()
+        db.conn.close()
+    failed = False
+    for table, rows in differences.items():
+        if not rows:
+            print(f"{table}: ok")
+            continue
+        failed = True
+        print(f"{table}: {len(rows)} differing rows")
+        for row in rows[:20]:
+            print("  " + ", ".join(f"{key}={value}" for key, value in row.items()))
+        if len(rows) > 20:
+            print(f"  ... {len(rows) - 20} more")
+    if failed:
+        print("Run 'python -m database.maintenance rebuild-summaries' to repair them.")
+    return 1 if failed else 0
+
+def rebuild_summaries(args: argparse.Namespace) -> int:
+    db = _open(args)
+    try:
+        db.rebuild_summaries()
+    finally:
+        db.close()
+        db.conn.close()
+    print("Summaries rebuilt")
+    return 0
+
+def _print_progress(done: int, total: int) -> None:
+    print(f"\r{done:,} of {total:,} pages", end="", file=sys.stderr, flush=True)
+
+def backup(args: argparse.Namespace) -> int:
+    path = create_backup(args.db, progress=_print_progress)
+    print(file=sys.stderr)
+    print(f"Backed up to {path}")
+    return 0
+
+def show_backups(args: argparse.Namespace) -> int:
+    settings = database_settings()
+    db_path = Path(args.db or settings['path'])
+    for path in list_backups(Path(settings['backup_dir']), db_path):
+        print(f"{path}  {path.stat().st_size / 1e6:,.1f} MB")
+    return 0
+
+def verify(args: argparse.Namespace) -> int:
+    verify_backup(args.backup)
+    print(f"{args.backup}: ok")
+    return 0
+
+def restore(args: argparse.Namespace) -> int:
+    saved = restore_backup(args.backup, args.db, progress=_print_progress)
+    print(file=sys.stderr)
+    print(f"Restored {args.backup}")
+    if saved:
+        print(f"The previous database was saved as {saved}")
+    return 0
+
+COMMANDS = {
+    'check-summaries': check_summaries,
+    'rebuild-summaries': rebuild_summaries,
+    'backup': backup,
+    'list-backups': show_backups,
+    'verify-backup': verify,
+    'restore': restore,
+}
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="CRM database maintenance")
+    parser.add_argument("command", choices=list(COMMANDS))
+    parser.add_argument("backup", type=Path, nargs="?",
+                        help="backup file for verify-backup and restore")
+    parser.add_argument("--db", type=Path, help="database file (default: database.path from config.json)")
+    args = parser.parse_args(argv)
+    if args.command in ('verify-backup', 'restore') and args.backup is None:
+        parser.error(f"{args.command} needs a backup file")
+
+    try:
+        status = COMMANDS[args.command](args)
+    except DatabaseError as e:
+        print(f"\nError: {str(e)}", file=sys.stderr)
+        if e.details:
+            print(e.details, file=sys.stderr)
+        status = 1
+    sys.exit(status)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+from utils.exceptions import DatabaseError
+
+class Page(NamedTuple):
+    """One page of a keyset-paginated query.
+
+    `next_token` is None on the last page; otherwise pass it back as
+    `page_token` to continue where this page ended.
+    """
+    rows: List[Dict]
+    next_token: Optional[str]
+
+def encode_token(scope: str, key: Sequence[Any]) -> str:
+    """Pack the sort key of the last row into an opaque continuation token"""
+    payload = json.dumps({'s': scope, 'k': list(key)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+def decode_token(token: str, scope: str, key_length: int) -> List[Any]:
+    """Unpack a continuation token, checking it belongs to the same query shape"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+        token_scope, key = payload['s'], payload['k']
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise DatabaseError("Invalid page token")
+    if token_scope != scope or not isinstance(key, list) or len(key) != key_length:
+        raise DatabaseError("Page token does not match this query",
+                            f"token scope {token_scope!r}, expected {scope!r}")
+    return key
+
+def iter_pages(fetch_page: Callable[..., Page], page_size: int, **kwargs) -> Iterator[Dict]:
+    """Yield the rows of every page returned by a *_page method"""
+    page_token = None
+    while True:
+        page = fetch_page(limit=page_size, page_token=page_token, **kwargs)
+        yield from page.rows
+        page_token = page.next_token
+        if page_token is None:
+            return
@@ -0,0 +1,195 @@
+import re
+import sqlite3
+from typing import List, Optional
+
+# Characters people type inside phone numbers
+PHONE_PUNCTUATION = "()-. +/"
+
+_fts5_available: Optional[bool] = None
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    """Whether the SQLite library in this process was built with FTS5"""
+    global _fts5_available
+    if _fts5_available is None:
+        # Read-only probes, so this also works on the pool's query_only readers
+        try:
+            row = conn.execute("SELECT 1 FROM pragma_module_list WHERE name = 'fts5'").fetchone()
+        except sqlite3.OperationalError:
+            row = conn.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()
+            row = row if row[0] else None
+        _fts5_available = row is not None
+    return _fts5_available
+
+def digits_sql(expr: str) -> str:
+    """SQL expression stripping phone punctuation from `expr`"""
+    for char in PHONE_PUNCTUATION:
+        expr = f"REPLACE({expr}, '{char}', '')"
+    return f"COALESCE({expr}, '')"
+
+def build_match_query(search_term: str) -> Optional[str]:
+    """Translate what the user typed into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix query and all of them must match.
+    Input that looks like a phone number is collapsed to its digits so
+    "(555) 123" finds 5551234567. Returns None when nothing searchable
+    is left, in which case callers fall back to LIKE.
+    """
+    term = search_term.strip()
+    if re.fullmatch(r"[\d()\-. +/]+", term):
+        digits = re.sub(r"\D", "", term)
+        return f'"{digits}"*' if digits else None
+    tokens = re.findall(r"\w+", term)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+# Longest phone suffix that can be looked up through contact_phones
+PHONE_SUFFIX_DIGITS = 20
+
+def reversed_digits_sql(expr: str) -> str:
+    """SQL expression reversing the last PHONE_SUFFIX_DIGITS characters of `expr`"""
+    return " || ".join(f"substr({expr}, -{i}, 1)" for i in range(1, PHONE_SUFFIX_DIGITS + 1))
+
+def phone_digits(search_term: str) -> Optional[str]:
+    """Digits of a search term that looks like (part of) a phone number"""
+    term = search_term.strip()
+    if not re.fullmatch(r"[\d()\-. +/]+", term):
+        return None
+    digits = re.sub(r"\D", "", term)
+    return digits if len(digits) >= 3 else None
+
+def contact_phones_insert_sql(alias: str, source: str = "") -> str:
+    """INSERT filling contact_phones from the phone columns of `alias`.
+
+    Inside triggers `alias` is NEW; for a backfill pass e.g. alias "c" and
+    source "FROM contacts c".
+    """
+    return f"""
+        INSERT INTO contact_phones(contact_id, kind, digits, digits_reversed)
+        SELECT contact_id, kind, digits, {reversed_digits_sql("digits")}
+        FROM (
+            SELECT {alias}.id AS contact_id, 'phone' AS kind,
+                   {digits_sql(f"{alias}.phone")} AS digits {source}
+            UNION ALL
+            SELECT {alias}.id, 'mobile_phone',
+                   {digits_sql(f"{alias}.mobile_phone")} {source}
+            -- Keeps SQLite from flattening the subquery, which would repeat
+            -- the REPLACE chain for every character of digits_reversed
+            LIMIT -1
+        )
+        WHERE digits != ''
+    """
+
+CONTACT_PHONES_INSERT_TRIGGER = f"""
+    CREATE TRIGGER IF NOT EXISTS trg_contacts_phones_insert
+    AFTER INSERT ON contacts
+    BEGIN
+        {contact_phones_insert_sql('NEW')};
+    END
+"""
+
+CONTACT_PHONES_TRIGGERS = f"""
+    {CONTACT_PHONES_INSERT_TRIGGER};
+
+    CREATE TRIGGER IF NOT EXISTS trg_contacts_phones_update
+    AFTER UPDATE OF phone, mobile_phone ON contacts
+    BEGIN
+        DELETE FROM contact_phones WHERE contact_id = OLD.id;
+        {contact_phones_insert_sql('NEW')};
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_contacts_phones_delete
+    AFTER DELETE ON contacts
+    BEGIN
+        DELETE FROM contact_phones WHERE contact_id = OLD.id;
+    END;
+"""
+
+# Contacts having a phone number that starts or ends with the given digits.
+# Both branches are index range scans; ':' sorts right after '9'.
+CONTACT_PHONE_SEARCH = """c.id IN (
+    SELECT contact_id FROM contact_phones
+    WHERE digits >= ? AND digits < ?
+    UNION
+    SELECT contact_id FROM contact_phones
+    WHERE digits_reversed >= ? AND digits_reversed < ?
+)"""
+
+def phone_search_params(digits: str) -> List[str]:
+    reversed_digits = digits[::-1][:PHONE_SUFFIX_DIGITS]
+    return [digits, digits + ":", reversed_digits, reversed_digits + ":"]
+
+CONTACT_FTS_COLUMNS = "first_name, last_name, company_name, email, phone_digits, address, notes"
+
+def _contact_fts_values(alias: str) -> str:
+    phones = f"{digits_sql(f'{alias}.phone')} || ' ' || {digits_sql(f'{alias}.mobile_phone')}"
+    return (f"{alias}.first_name, {alias}.last_name, {alias}.company_name, "
+            f"{alias}.email, {phones}, {alias}.address, {alias}.notes")
+
+def contact_fts_insert_sql(source: str) -> str:
+    """INSERT filling contacts_fts from the contacts `c` selected by `source`"""
+    return f"""
+        INSERT INTO contacts_fts(rowid, {CONTACT_FTS_COLUMNS})
+        SELECT c.id, {_contact_fts_values('c')} {source}
+    """
+
+CONTACT_FTS_INSERT_TRIGGER = f"""
+    CREATE TRIGGER IF NOT EXISTS trg_contacts_fts_insert
+    AFTER INSERT ON contacts
+    BEGIN
+        INSERT INTO contacts_fts(rowid, {CONTACT_FTS_COLUMNS})
+        VALUES (NEW.id, {_contact_fts_values('NEW')});
+    END
+"""
+
+CONTACT_FTS_TRIGGERS = f"""
+    {CONTACT_FTS_INSERT_TRIGGER};
+
+    CREATE TRIGGER IF NOT EXISTS trg_contacts_fts_update
+    AFTER UPDATE OF first_name, last_name, company_name, email, phone,
+                    mobile_phone, address, notes ON contacts
+    BEGIN
+        DELETE FROM contacts_fts WHERE rowid = OLD.id;
+        INSERT INTO contacts_fts(rowid, {CONTACT_FTS_COLUMNS})
+        VALUES (NEW.id, {_contact_fts_values('NEW')});
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_contacts_fts_delete
+    AFTER DELETE ON contacts
+    BEGIN
+        DELETE FROM contacts_fts WHERE rowid = OLD.id;
+    END;
+"""
+
+def ensure_contact_search_index(cursor: sqlite3.Cursor) -> bool:
+    """Create the contacts_fts index and its sync triggers if FTS5 is available.
+
+    The index is rebuilt from scratch whenever it is new or its triggers are
+    missing, e.g. after the database was written by a build without FTS5.
+    Returns whether full-text search can be used on this connection.
+    """
+    if not fts5_available(cursor.connection):
+        # Drop the sync triggers so writes keep working without the module
+        cursor.executescript("""
+            DROP TRIGGER IF EXISTS trg_contacts_fts_insert;
+            DROP TRIGGER IF EXISTS trg_contacts_fts_update;
+            DROP TRIGGER IF EXISTS trg_contacts_fts_delete;
+        """)
+        return False
+
+    triggers = cursor.execute("""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE type = 'trigger' AND name LIKE 'trg_contacts_fts_%'
+    """).fetchone()[0]
+    cursor.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+            {CONTACT_FTS_COLUMNS},
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    """)
+    if triggers < 3:
+        cursor.execute("DELETE FROM contacts_fts")
+        cursor.execute(contact_fts_insert_sql("FROM contacts c"))
+        cursor.executescript(CONTACT_FTS_TRIGGERS)
+    return True
@@ -0,0 +1,174 @@
+"""Book-of-business totals kept current by triggers on policies.
+
+policy_summary holds policy count and premium per (dimension, key, status),
+where a dimension is one of POLICY_SUMMARY_DIMENSIONS. contact_policy_summary
+holds the number and premium of each contact's Active policies. Premiums
+are summed in integer cents so incremental updates never drift from a
+full recomputation.
+"""
+from typing import Tuple
+
+# Dimension name -> expression over a policies row alias
+POLICY_SUMMARY_DIMENSIONS = {
+    'carrier': "{row}.carrier",
+    'policy_type': "{row}.policy_type",
+    'renewal_month': "substr({row}.renewal_date, 1, 7)",
+}
+
+def premium_cents_sql(row: str) -> str:
+    return f"CAST(ROUND({row}.premium * 100) AS INTEGER)"
+
+SUMMARY_TABLES = """
+    CREATE TABLE IF NOT EXISTS policy_summary (
+        dimension TEXT NOT NULL,
+        key TEXT NOT NULL,
+        status TEXT NOT NULL,
+        policy_count INTEGER NOT NULL,
+        premium_cents INTEGER NOT NULL,
+        PRIMARY KEY (dimension, key, status)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS contact_policy_summary (
+        contact_id INTEGER PRIMARY KEY,
+        active_policies INTEGER NOT NULL,
+        active_premium_cents INTEGER NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_contact_policy_summary_count
+        ON contact_policy_summary(active_policies);
+"""
+
+def _apply_policy(row: str, sign: int) -> str:
+    """Statements adding (sign 1) or removing (sign -1) one policy's totals"""
+    statements = [
+        f"""
+        INSERT INTO policy_summary(dimension, key, status, policy_count, premium_cents)
+        VALUES ('{dimension}', {expr.format(row=row)}, {row}.status,
+                {sign}, {sign} * {premium_cents_sql(row)})
+        ON CONFLICT(dimension, key, status) DO UPDATE SET
+            policy_count = policy_count + excluded.policy_count,
+            premium_cents = premium_cents + excluded.premium_cents
+        """
+        for dimension, expr in POLICY_SUMMARY_DIMENSIONS.items()
+    ]
+    statements.append(f"""
+        INSERT INTO contact_policy_summary(contact_id, active_policies, active_premium_cents)
+        SELECT {row}.contact_id, {sign}, {sign} * {premium_cents_sql(row)}
+        WHERE {row}.status = 'Active'
+        ON CONFLICT(contact_id) DO UPDATE SET
+            active_policies = active_policies + excluded.active_policies,
+            active_premium_cents = active_premium_cents + excluded.active_premium_cents
+    """)
+    if sign < 0:
+        # Drop totals that are now empty, e.g. the contact's row once a
+        # contact delete has cascaded to all of its policies
+        statements.extend(
+            f"""
+            DELETE FROM policy_summary
+            WHERE dimension = '{dimension}' AND key = {expr.format(row=row)}
+              AND status = {row}.status AND policy_count = 0
+            """
+            for dimension, expr in POLICY_SUMMARY_DIMENSIONS.items()
+        )
+        statements.append(f"""
+            DELETE FROM contact_policy_summary
+            WHERE contact_id = {row}.contact_id AND active_policies = 0
+        """)
+    return ";\n".join(statements)
+
+POLICY_SUMMARY_INSERT_TRIGGER = f"""
+    CREATE TRIGGER IF NOT EXISTS trg_policy_summary_insert
+    AFTER INSERT ON policies
+    BEGIN
+        {_apply_policy('NEW', 1)};
+    END
+"""
+
+POLICY_SUMMARY_TRIGGERS = f"""
+    {POLICY_SUMMARY_INSERT_TRIGGER};
+
+    CREATE TRIGGER IF NOT EXISTS trg_policy_summary_update
+    AFTER UPDATE OF contact_id, carrier, policy_type, renewal_date, premium, status
+    ON policies
+    BEGIN
+        {_apply_policy('OLD', -1)};
+        {_apply_policy('NEW', 1)};
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_policy_summary_delete
+    AFTER DELETE ON policies
+    BEGIN
+        {_apply_policy('OLD', -1)};
+    END;
+"""
+
+def _computed_policy_summary(source: str) -> str:
+    """SELECT of policy_summary rows computed from the policies `p` in `source`"""
+    return "\nUNION ALL\n".join(
+        f"""
+        SELECT '{dimension}', {expr.format(row='p')}, p.status,
+               COUNT(*), SUM({premium_cents_sql('p')})
+        {source}
+        GROUP BY 2, 3
+        """
+        for dimension, expr in POLICY_SUMMARY_DIMENSIONS.items()
+    )
+
+def _computed_contact_summary(source: str) -> str:
+    return f"""
+        SELECT p.contact_id, COUNT(*), SUM({premium_cents_sql('p')})
+        {source} {'AND' if 'WHERE' in source else 'WHERE'} p.status = 'Active'
+        GROUP BY p.contact_id
+    """
+
+def add_policies_sql(source: str) -> Tuple[str, str]:
+    """Statements folding the policies `p` selected by `source` into the
+    summaries, e.g. "FROM policies p WHERE p.id >= ?1" after a bulk load"""
+    # "WHERE true" keeps the parser from reading ON CONFLICT as a join clause
+    return f"""
+        INSERT INTO policy_summary(dimension, key, status, policy_count, premium_cents)
+        SELECT * FROM ({_computed_policy_summary(source)}) WHERE true
+        ON CONFLICT(dimension, key, status) DO UPDATE SET
+            policy_count = policy_count + excluded.policy_count,
+            premium_cents = premium_cents + excluded.premium_cents
+    """, f"""
+        INSERT INTO contact_policy_summary(contact_id, active_policies, active_premium_cents)
+        SELECT * FROM ({_computed_contact_summary(source)}) WHERE true
+        ON CONFLICT(contact_id) DO UPDATE SET
+            active_policies = active_policies + excluded.active_policies,
+            active_premium_cents = active_premium_cents + excluded.active_premium_cents
+    """
+
+# Rows that differ between the stored summaries and a recomputation; empty
+# when they are consistent. Rows whose count has dropped to zero are
+# equivalent to missing ones.
+SUMMARY_DIFFERENCES = {
+    'policy_summary': f"""
+        SELECT 'stored' AS side, * FROM (
+            SELECT dimension, key, status, policy_count, premium_cents
+            FROM policy_summary WHERE policy_count != 0
+            EXCEPT SELECT * FROM ({_computed_policy_summary("FROM policies p")})
+        )
+        UNION ALL
+        SELECT 'computed', * FROM (
+            {_computed_policy_summary("FROM policies p")}
+            EXCEPT
+            SELECT dimension, key, status, policy_count, premium_cents
+            FROM policy_summary WHERE policy_count != 0
+        )
+    """,
+    'contact_policy_summary': f"""
+        SELECT 'stored' AS side, * FROM (
+            SELECT contact_id, active_policies, active_premium_cents
+            FROM contact_policy_summary WHERE active_policies != 0
+            EXCEPT SELECT * FROM ({_computed_contact_summary("FROM policies p")})
+        )
+        UNION ALL
+        SELECT 'computed', * FROM (
+            {_computed_contact_summary("FROM policies p")}
+            EXCEPT
+            SELECT contact_id, active_policies, active_premium_cents
+            FROM contact_policy_summary WHERE active_policies != 0
+        )
+    """,
+}
@@ -1,12 +1,21 @@
+from utils.startup_timing import startup_timer
+import logging
 import sys
 from PyQt6.QtWidgets import QApplication
 from ui.main_window import MainWindow
+from database.connection_pool import shutdown
+from ui.query_executor import shutdown_executor
 
 def main():
+    startup_timer.mark('imports')
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(shutdown_executor)
+    app.aboutToQuit.connect(shutdown)
     window = MainWindow()
+    app.aboutToQuit.connect(window.backup_scheduler.shutdown)
     window.show()
     sys.exit(app.exec())
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+from pathlib import Path
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.db_manager import DatabaseManager, connect
+
+@pytest.fixture
+def db():
+    """DatabaseManager on an empty in-memory database, without reading config.json"""
+    manager = DatabaseManager(connect(":memory:", settings={}))
+    manager.create_tables()
+    yield manager
+    manager.conn.close()
+
+def add_contact(db: DatabaseManager, first_name: str, last_name: str,
+                status: str = 'Active', **fields) -> int:
+    return db.add_contact(dict(fields, contact_type=fields.get('contact_type', 'Individual'),
+                               first_name=first_name, last_name=last_name, status=status))
+
+def add_policy(db: DatabaseManager, contact_id: int, number: str, premium: float = 1000.0,
+               status: str = 'Active', **fields) -> int:
+    policy = {'contact_id': contact_id, 'policy_type': 'Auto', 'policy_number': number,
+              'carrier': 'Acme', 'premium': premium, 'start_date': '2024-01-01',
+              'renewal_date': '2025-01-01', 'status': status}
+    policy.update(fields)
+    return db.add_policy(policy)
+
+def add_communication(db: DatabaseManager, contact_id: int, comm_date: str) -> int:
+    return db.add_communication({'contact_id': contact_id, 'comm_type': 'Call',
+                                 'comm_date': comm_date, 'details': "Called about renewal"})
+
+@pytest.fixture
+def qt_app(tmp_path, monkeypatch):
+    """QApplication with the process-wide pool on a fresh database; skipped
+    without PyQt6"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    from database.connection_pool import init_pool, shutdown
+    from ui.query_executor import shutdown_executor
+    # The pool reads config.json from the working directory
+    monkeypatch.chdir(tmp_path)
+    init_pool(tmp_path / "crm.db")
+    yield QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    shutdown_executor()
+    shutdown()
+
+def wait_until_idle(app, timeout: float = 10.0) -> None:
+    """Process events until no background query is outstanding"""
+    from ui.query_executor import get_executor
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if not get_executor().is_busy():
+            # Let views react to the last result (fetch-more timers etc.)
+            for _ in range(20):
+                app.processEvents()
+                time.sleep(0.01)
+            if not get_executor().is_busy():
+                return
+    raise AssertionError("background queries did not finish")
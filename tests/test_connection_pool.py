@@ -0,0 +1,23 @@
+import threading
+from database.connection_pool import ConnectionPool
+
+def test_reader_first_on_another_thread_leaves_writer_usable(tmp_path, monkeypatch):
+    # database_settings() reads config.json from the working directory
+    monkeypatch.chdir(tmp_path)
+    pool = ConnectionPool(tmp_path / "crm.db")
+    contacts = []
+
+    def read():
+        with pool.read_session() as db:
+            contacts.extend(db.get_contacts())
+
+    worker = threading.Thread(target=read)
+    worker.start()
+    worker.join()
+    try:
+        assert contacts == []
+        db = pool.session()
+        db.add_contact({'contact_type': 'Individual', 'first_name': "Ada", 'last_name': "Lovelace"})
+        assert [c['last_name'] for c in db.get_contacts()] == ["Lovelace"]
+    finally:
+        pool.close()
@@ -0,0 +1,44 @@
+import threading
+import pytest
+from conftest import wait_until_idle
+from database.db_manager import DatabaseManager
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+def test_set_contact_id_looks_up_off_the_gui_thread(qt_app, monkeypatch):
+    from database.connection_pool import get_session
+    from ui.contact_picker import ContactPicker
+    contact_id = get_session().add_contact({'contact_type': 'Individual', 'first_name': "Ada",
+                                            'last_name': "Lovelace"})
+    lookup_threads = []
+    original = DatabaseManager.get_contacts
+
+    def recording(self, *args, **kwargs):
+        lookup_threads.append(threading.current_thread())
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(DatabaseManager, 'get_contacts', recording)
+    picker = ContactPicker()
+    found = []
+    picker.set_contact_id(contact_id, found.append)
+    # The id is known straight away, the contact once the lookup returns
+    assert picker.contact_id() == contact_id
+    assert not picker.isEnabled()
+    wait_until_idle(qt_app)
+
+    assert found == [True]
+    assert picker.text() == "Ada Lovelace"
+    assert picker.isEnabled()
+    assert lookup_threads and threading.main_thread() not in lookup_threads
+
+    picker.set_contact_id(contact_id + 1, found.append)
+    wait_until_idle(qt_app)
+    assert found == [True, False]
+    assert picker.contact_id() is None
+
+def test_forget_contact_drops_stale_entry():
+    from ui.contact_picker import forget_contact, recent_contacts, remember_contact
+    remember_contact({'id': 1, 'first_name': "Ada", 'last_name': "Lovelace",
+                      'contact_type': 'Individual', 'company_name': None})
+    forget_contact(1)
+    assert all(contact['id'] != 1 for contact in recent_contacts())
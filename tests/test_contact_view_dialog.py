@@ -0,0 +1,32 @@
+import threading
+from conftest import wait_until_idle
+from database.db_manager import DatabaseManager
+
+def test_opening_contact_reads_history_once(qt_app, monkeypatch):
+    from database.connection_pool import get_session
+    from ui.dialogs.contact_view_dialog import ContactViewDialog
+    db = get_session()
+    contact_id = db.add_contact({'contact_type': 'Individual', 'first_name': "Ada",
+                                 'last_name': "Lovelace"})
+    for day in range(1, 4):
+        db.add_communication({'contact_id': contact_id, 'comm_type': 'Call',
+                              'comm_date': f"2024-05-0{day}T10:00:00+00:00", 'details': "Renewal"})
+
+    calls = []
+    lock = threading.Lock()
+    original = DatabaseManager.get_communications_page
+
+    def counting(self, *args, **kwargs):
+        with lock:
+            calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(DatabaseManager, 'get_communications_page', counting)
+    dialog = ContactViewDialog(contact_id=contact_id)
+    dialog.show()
+    wait_until_idle(qt_app)
+    try:
+        assert len(calls) == 1
+        assert dialog.comms_model.rowCount() == 3
+    finally:
+        dialog.close()
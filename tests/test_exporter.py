@@ -0,0 +1,17 @@
+from conftest import add_contact
+
+def exported(db, table, **filters):
+    cursor = db.export_cursor(table, **filters)
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+def test_deleted_contacts_are_only_exported_when_asked_for(db):
+    active_id = add_contact(db, "Ada", "Lovelace")
+    deleted_id = add_contact(db, "Charles", "Babbage", status='Deleted')
+    for contact_id in (active_id, deleted_id):
+        db.add_communication({'contact_id': contact_id, 'comm_type': 'Call',
+                              'comm_date': '2024-05-01T10:00:00+00:00', 'details': 'Renewal'})
+
+    assert [c['id'] for c in exported(db, 'contacts')] == [active_id]
+    assert [c['id'] for c in exported(db, 'contacts', status='Deleted')] == [deleted_id]
+    assert [m['contact_id'] for m in exported(db, 'communications')] == [active_id]
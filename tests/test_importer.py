@@ -0,0 +1,49 @@
+import csv
+import pytest
+from conftest import add_contact
+from database.importer import import_csv
+from utils.exceptions import DatabaseError
+
+POLICY_COLUMNS = ['contact_id', 'policy_number', 'carrier', 'premium', 'start_date', 'renewal_date']
+
+def write_policies(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(POLICY_COLUMNS)
+        writer.writerows(rows)
+
+def test_non_finite_premium_is_rejected(db, tmp_path):
+    contact_id = add_contact(db, "Ada", "Lovelace")
+    source = tmp_path / "policies.csv"
+    write_policies(source, [
+        [contact_id, "P-1", "Acme", "1200.50", "2024-01-01", "2025-01-01"],
+        [contact_id, "P-2", "Acme", "nan", "2024-01-01", "2025-01-01"],
+        [contact_id, "P-3", "Acme", "inf", "2024-01-01", "2025-01-01"],
+        [contact_id, "P-4", "Acme", "-5", "2024-01-01", "2025-01-01"],
+    ])
+
+    result = import_csv(db, 'policies', source)
+
+    assert (result['imported'], result['rejected']) == (1, 3)
+    assert [p['policy_number'] for p in db.get_policies()] == ["P-1"]
+    with open(result['rejects_path'], newline='') as f:
+        rejects = list(csv.DictReader(f))
+    assert [row['policy_number'] for row in rejects] == ["P-2", "P-3", "P-4"]
+    assert all(row['error'].startswith("Invalid premium") for row in rejects)
+
+def test_write_failure_reports_the_failing_line(db, tmp_path):
+    # Fails inside the bulk insert itself, after the row passed validation
+    db.conn.execute("""
+        CREATE TRIGGER refuse_babbage BEFORE INSERT ON contacts
+        WHEN NEW.last_name = 'Babbage'
+        BEGIN SELECT RAISE(ABORT, 'refused by trigger'); END
+    """)
+    source = tmp_path / "contacts.csv"
+    with open(source, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['first_name', 'last_name'])
+        writer.writerows([["Ada", "Lovelace"], ["Charles", "Babbage"]])
+
+    with pytest.raises(DatabaseError, match=r"Import stopped at line 3 after 1 rows: .*refused by trigger"):
+        import_csv(db, 'contacts', source, batch_size=1)
+    assert [c['last_name'] for c in db.get_contacts()] == ["Lovelace"]
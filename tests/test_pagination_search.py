@@ -0,0 +1,94 @@
+import pytest
+from conftest import add_communication, add_contact, add_policy
+from database.db_manager import CONTACT_SORT_KEYS, POLICY_SORT_KEYS
+from database.pagination import iter_pages
+from utils.exceptions import DatabaseError
+
+# Repeated names, companies and NULLs so the id tie-breaker is exercised
+PEOPLE = [
+    ("Ada", "Lovelace", "Analytical", "555-010-2030", "Active"),
+    ("Charles", "Babbage", "Analytical", None, "Active"),
+    ("Alan", "Turing", None, "(555) 010-9999", "Inactive"),
+    ("Grace", "Hopper", "Navy", "555.777.1234", "Active"),
+    ("Grace", "Hopper", None, None, "Prospect"),
+    ("Ada", "Byron", "Analytical", "555-010-2030", "Active"),
+    ("Kurt", "Godel", None, None, "Deleted"),
+]
+
+@pytest.fixture
+def people(db):
+    ids = []
+    for i, (first, last, company, phone, status) in enumerate(PEOPLE):
+        contact_id = add_contact(db, first, last, status, company_name=company, phone=phone,
+                                 email=f"{first.lower()}@example.com" if i % 2 else None)
+        ids.append(contact_id)
+        for n in range(i % 3 + 1):
+            add_policy(db, contact_id, f"P-{i}-{n}", premium=500.0 * (n % 2 + 1),
+                       carrier=("Acme", "Zenith")[n % 2], renewal_date=f"2025-0{n + 1}-01")
+        if i % 2 == 0:
+            add_communication(db, contact_id, f"2024-0{i % 3 + 1}-01T09:00:00+00:00")
+    return ids
+
+def all_rows(fetch_page, **kwargs):
+    return [row['id'] for row in iter_pages(fetch_page, 2, **kwargs)]
+
+def one_page(fetch_page, **kwargs):
+    page = fetch_page(limit=1000, **kwargs)
+    assert page.next_token is None
+    return [row['id'] for row in page.rows]
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("sort_by", sorted(CONTACT_SORT_KEYS))
+def test_contact_pages_cover_every_contact_once(db, people, sort_by, descending):
+    ids = all_rows(db.get_contacts_page, sort_by=sort_by, descending=descending)
+    assert ids == one_page(db.get_contacts_page, sort_by=sort_by, descending=descending)
+    assert sorted(ids) == sorted(people[:-1])
+
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("sort_by", sorted(POLICY_SORT_KEYS))
+def test_policy_pages_cover_every_policy_once(db, people, sort_by, descending):
+    ids = all_rows(db.get_policies_page, sort_by=sort_by, descending=descending)
+    assert ids == one_page(db.get_policies_page, sort_by=sort_by, descending=descending)
+    assert sorted(ids) == sorted(p['id'] for p in db.get_policies())
+
+def test_communication_pages_are_newest_first(db, people):
+    contact_id = people[0]
+    for day in ("2024-05-01", "2024-05-01", "2024-04-01", "2024-06-01"):
+        add_communication(db, contact_id, f"{day}T12:00:00+00:00")
+    ids = all_rows(db.get_communications_page, contact_id=contact_id)
+    assert sorted(ids) == sorted(c['id'] for c in db.get_communications(contact_id))
+    dates = [db.get_communication(i)['comm_date'] for i in ids]
+    assert dates == sorted(dates, reverse=True)
+    assert len(ids) == len(set(ids)) == 5
+
+@pytest.mark.parametrize("term", ["Analytical", "ada", "grace hopper", "555", "555-010-2030", "@example"])
+def test_paged_search_matches_get_contacts(db, people, term):
+    expected = sorted(c['id'] for c in db.get_contacts(search_term=term))
+    assert expected
+    assert sorted(all_rows(db.get_contacts_page, search_term=term)) == expected
+    assert sorted(all_rows(db.get_contacts_page, search_term=term, sort_by='relevance')) == expected
+
+def test_relevance_pages_follow_get_contacts(db, people):
+    assert (all_rows(db.get_contacts_page, search_term="Analytical", sort_by='relevance')
+            == [c['id'] for c in db.get_contacts(search_term="Analytical")])
+
+def test_page_token_is_tied_to_its_query(db, people):
+    page = db.get_contacts_page(limit=2, sort_by='name')
+    with pytest.raises(DatabaseError):
+        db.get_contacts_page(limit=2, page_token=page.next_token, sort_by='email')
+
+def test_phone_lookup_ignores_formatting(db, people):
+    lovelace, _, turing, hopper = people[:4]
+    byron = people[5]
+    assert {c['id'] for c in db.find_contacts_by_phone("5550102030", match='exact')} == {lovelace, byron}
+    assert {c['id'] for c in db.find_contacts_by_phone("(555) 010", match='prefix')} == {lovelace, turing, byron}
+    assert [c['id'] for c in db.find_contacts_by_phone("777-1234")] == [hopper]
+    assert db.find_contacts_by_phone("no digits") == []
+
+def test_phone_lookup_follows_updates(db, people):
+    hopper = people[3]
+    contact = db.get_contacts(contact_id=hopper)[0]
+    db.update_contact(hopper, dict(contact, phone=None, mobile_phone="+1 555 321 0000"))
+    assert db.find_contacts_by_phone("777-1234") == []
+    assert [c['id'] for c in db.find_contacts_by_phone("321-0000")] == [hopper]
+    assert [c['id'] for c in db.get_contacts(search_term="555-321-0000")] == [hopper]
@@ -0,0 +1,70 @@
+import pytest
+from conftest import add_communication, add_contact, add_policy
+
+BULK_LOAD_TRIGGERS = {'trg_contacts_phones_insert', 'trg_contacts_fts_insert',
+                      'trg_policy_summary_insert', 'trg_communications_insert'}
+
+def contact_names(db):
+    return [c['last_name'] for c in db.get_contacts()]
+
+def triggers(db):
+    rows = db.conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    return {row[0] for row in rows}
+
+def test_writes_inside_a_transaction_commit_together(db):
+    with db.transaction():
+        add_contact(db, "Ada", "Lovelace")
+        # Single writes leave the commit to the enclosing block
+        assert db.conn.in_transaction
+        add_contact(db, "Charles", "Babbage")
+    assert not db.conn.in_transaction
+    assert contact_names(db) == ["Babbage", "Lovelace"]
+
+def test_failed_savepoint_keeps_the_outer_writes(db):
+    with db.transaction():
+        add_contact(db, "Ada", "Lovelace")
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                add_contact(db, "Charles", "Babbage")
+                raise RuntimeError("inner failure")
+        add_contact(db, "Alan", "Turing")
+    assert db.conn.transaction_depth == 0
+    assert contact_names(db) == ["Lovelace", "Turing"]
+
+def test_outer_failure_rolls_back_committed_savepoints(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            add_contact(db, "Ada", "Lovelace")
+            with db.transaction():
+                add_contact(db, "Charles", "Babbage")
+            raise RuntimeError("outer failure")
+    assert db.conn.transaction_depth == 0
+    assert contact_names(db) == []
+
+def test_bulk_load_derives_the_trigger_data(db):
+    with db.bulk_load():
+        contact_id = add_contact(db, "Ada", "Lovelace", phone="(555) 010-2030")
+        add_policy(db, contact_id, "P-1", premium=1200.0)
+        add_communication(db, contact_id, "2024-03-01T10:00:00+00:00")
+        # Suspended while loading
+        assert not BULK_LOAD_TRIGGERS & triggers(db)
+    assert BULK_LOAD_TRIGGERS <= triggers(db)
+    assert [c['id'] for c in db.find_contacts_by_phone("555-010-2030", match='exact')] == [contact_id]
+    assert [c['id'] for c in db.get_contacts(search_term="Lovelace")] == [contact_id]
+    assert db.get_contacts(contact_id=contact_id)[0]['last_contacted_at'] == "2024-03-01T10:00:00+00:00"
+    assert not any(db.check_summaries().values())
+
+def test_bulk_load_restores_triggers_after_an_exception(db):
+    with pytest.raises(RuntimeError):
+        with db.bulk_load():
+            add_contact(db, "Charles", "Babbage", phone="555 999 0000")
+            raise RuntimeError("load failed")
+    assert BULK_LOAD_TRIGGERS <= triggers(db)
+    assert contact_names(db) == []
+
+    # The restored triggers keep new rows searchable
+    contact_id = add_contact(db, "Ada", "Lovelace", phone="(555) 010-2030")
+    add_policy(db, contact_id, "P-1")
+    assert [c['id'] for c in db.find_contacts_by_phone("0102030")] == [contact_id]
+    assert [c['id'] for c in db.get_contacts(search_term="Lovelace")] == [contact_id]
+    assert not any(db.check_summaries().values())
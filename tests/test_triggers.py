@@ -0,0 +1,93 @@
+from conftest import add_communication, add_contact, add_policy
+
+def last_contacted(db, contact_id):
+    return db.get_contacts(contact_id=contact_id)[0]['last_contacted_at']
+
+def expected_last_contacted(db, contact_id):
+    return db.conn.execute("SELECT MAX(comm_date) FROM communications WHERE contact_id = ?",
+                           (contact_id,)).fetchone()[0]
+
+def assert_summaries_consistent(db):
+    differences = db.check_summaries()
+    assert not any(differences.values()), differences
+
+def test_last_contacted_follows_every_communication_change(db):
+    ada = add_contact(db, "Ada", "Lovelace")
+    charles = add_contact(db, "Charles", "Babbage")
+    assert last_contacted(db, ada) is None
+
+    first = add_communication(db, ada, "2024-03-01T10:00:00+00:00")
+    latest = add_communication(db, ada, "2024-05-01T10:00:00+00:00")
+    add_communication(db, ada, "2024-04-01T10:00:00+00:00")
+    assert last_contacted(db, ada) == "2024-05-01T10:00:00+00:00"
+
+    db.conn.execute("UPDATE communications SET comm_date = ? WHERE id = ?",
+                    ("2024-01-01T10:00:00+00:00", latest))
+    assert last_contacted(db, ada) == expected_last_contacted(db, ada) == "2024-04-01T10:00:00+00:00"
+
+    # Moving a communication updates both contacts
+    db.conn.execute("UPDATE communications SET contact_id = ? WHERE comm_date LIKE '2024-04%'",
+                    (charles,))
+    assert last_contacted(db, ada) == expected_last_contacted(db, ada) == "2024-03-01T10:00:00+00:00"
+    assert last_contacted(db, charles) == "2024-04-01T10:00:00+00:00"
+
+    db.conn.execute("DELETE FROM communications WHERE id = ?", (first,))
+    assert last_contacted(db, ada) == expected_last_contacted(db, ada) == "2024-01-01T10:00:00+00:00"
+    db.conn.execute("DELETE FROM communications WHERE contact_id = ?", (ada,))
+    assert last_contacted(db, ada) is None
+
+def test_summaries_follow_policy_changes(db):
+    ada = add_contact(db, "Ada", "Lovelace")
+    charles = add_contact(db, "Charles", "Babbage")
+    auto = add_policy(db, ada, "P-1", premium=1200.50)
+    home = add_policy(db, ada, "P-2", premium=800.25, policy_type='Home', carrier='Zenith')
+    add_policy(db, charles, "P-3", premium=300.0)
+    assert_summaries_consistent(db)
+
+    policy = db.get_policies(policy_id=home)[0]
+    db.update_policy(home, dict(policy, premium=950.0, renewal_date='2025-06-01', carrier='Acme'))
+    assert_summaries_consistent(db)
+    db.update_policy(home, dict(policy, contact_id=charles))
+    assert_summaries_consistent(db)
+    db.update_policy(auto, dict(db.get_policies(policy_id=auto)[0], status='Lapsed'))
+    assert_summaries_consistent(db)
+
+    top = db.get_top_contacts_by_policies()
+    assert [(c['id'], c['active_policies']) for c in top] == [(charles, 2)]
+    assert top[0]['active_premium'] == 1100.25
+
+    db.delete_policy(home)
+    db.conn.execute("DELETE FROM policies WHERE contact_id = ?", (ada,))
+    db.conn.commit()
+    assert_summaries_consistent(db)
+    assert [(c['id'], c['active_policies']) for c in db.get_top_contacts_by_policies()] == [(charles, 1)]
+
+def test_summaries_after_bulk_inserts(db):
+    ada = add_contact(db, "Ada", "Lovelace")
+    add_policy(db, ada, "P-0")
+    policies = [{'contact_id': ada, 'policy_type': ('Auto', 'Home')[i % 2],
+                 'policy_number': f"P-{i + 1}", 'carrier': ('Acme', 'Zenith')[i % 3 == 0],
+                 'premium': 100.0 + i, 'start_date': '2024-01-01',
+                 'renewal_date': f"2025-{i % 12 + 1:02d}-01", 'status': 'Active'}
+                for i in range(20)]
+    assert db.add_policies_many(policies) == 20
+    assert_summaries_consistent(db)
+
+    with db.bulk_load():
+        charles = add_contact(db, "Charles", "Babbage")
+        db.add_policies_many(dict(p, contact_id=charles, policy_number=f"B-{i}")
+                             for i, p in enumerate(policies[:5]))
+        add_communication(db, charles, "2024-02-01T08:00:00+00:00")
+    assert_summaries_consistent(db)
+    assert last_contacted(db, charles) == "2024-02-01T08:00:00+00:00"
+    assert [(c['id'], c['active_policies']) for c in db.get_top_contacts_by_policies()] == [
+        (ada, 21), (charles, 5)]
+
+def test_rebuild_repairs_a_drifted_summary(db):
+    ada = add_contact(db, "Ada", "Lovelace")
+    add_policy(db, ada, "P-1")
+    db.conn.execute("UPDATE contact_policy_summary SET active_policies = 7")
+    db.conn.commit()
+    assert db.check_summaries()['contact_policy_summary']
+    db.rebuild_summaries()
+    assert_summaries_consistent(db)
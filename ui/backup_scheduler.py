@@ -0,0 +1,107 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from database.backup import backup_due, create_backup
+from database.connection_pool import ConnectionPool, get_pool
+from utils.exceptions import CRMError, DatabaseError
+
+logger = logging.getLogger("crm.backup")
+
+class _BackupSignals(QObject):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+class _BackupTask(QRunnable):
+    """Runs one backup on its own connection in a worker thread"""
+
+    def __init__(self, pool: ConnectionPool, signals: _BackupSignals):
+        super().__init__()
+        self.pool = pool
+        self.signals = signals
+        self.cancelled = threading.Event()
+
+    def on_progress(self, done: int, total: int):
+        if self.cancelled.is_set():
+            # Raising from the progress callback aborts the copy
+            raise DatabaseError("Backup cancelled")
+        self.signals.progress.emit(done, total)
+
+    def run(self):
+        try:
+            path = create_backup(self.pool.db_path, settings=self.pool.settings,
+                                 progress=self.on_progress)
+        except CRMError as e:
+            self.signals.failed.emit(e)
+            return
+        except Exception as e:
+            self.signals.failed.emit(CRMError(str(e)))
+            return
+        self.signals.finished.emit(path)
+
+class BackupScheduler(QObject):
+    """Takes a backup whenever the newest one is older than
+    database.backup_interval_hours, and on request.
+
+    Backups run on their own thread and connection, so neither the GUI nor
+    the query executor's readers wait for them.
+    """
+
+    CHECK_INTERVAL_MS = 10 * 60 * 1000
+    # Let startup queries go first
+    FIRST_CHECK_MS = 60 * 1000
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+    def __init__(self, pool: Optional[ConnectionPool] = None, parent=None):
+        super().__init__(parent)
+        self.pool = pool or get_pool()
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self._signals = _BackupSignals()
+        self._signals.progress.connect(self.progress)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._task: Optional[_BackupTask] = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+
+    def start(self):
+        QTimer.singleShot(self.FIRST_CHECK_MS, self.check)
+        self.timer.start(self.CHECK_INTERVAL_MS)
+
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    def check(self):
+        if not self.is_running() and backup_due(self.pool.settings):
+            self.backup_now()
+
+    def backup_now(self) -> bool:
+        """Start a backup; False if one is already running"""
+        if self.is_running():
+            return False
+        self._task = _BackupTask(self.pool, self._signals)
+        self._task.setAutoDelete(False)
+        self.thread_pool.start(self._task)
+        return True
+
+    def _on_finished(self, path: Path):
+        self._task = None
+        logger.info("Backed up to %s", path)
+        self.finished.emit(path)
+
+    def _on_failed(self, error: CRMError):
+        self._task = None
+        logger.warning("Backup failed: %s", error)
+        self.failed.emit(error)
+
+    def shutdown(self):
+        self.timer.stop()
+        if self._task is not None:
+            self._task.cancelled.set()
+        self.thread_pool.waitForDone()
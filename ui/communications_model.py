@@ -0,0 +1,46 @@
+from typing import Any, Dict, Optional
+from .paged_table_model import PagedTableModel
+from database.db_manager import COMMUNICATION_PREVIEW_CHARS, DatabaseManager
+from database.pagination import Page
+from utils.datetime_helpers import format_datetime
+
+class CommunicationsTableModel(PagedTableModel):
+    """One contact's communication history, newest first.
+
+    Rows carry only the first COMMUNICATION_PREVIEW_CHARS of details;
+    fetch the full text with DatabaseManager.get_communication.
+    """
+
+    HEADERS = ["Date & Time", "Type", "Details", "Created"]
+
+    def __init__(self, contact_id: int, page_size: int = 200,
+                 defer_first_fetch: bool = False, parent=None):
+        super().__init__(self.HEADERS, f'communications:{contact_id}', page_size=page_size,
+                         defer_first_fetch=defer_first_fetch, parent=parent)
+        self.contact_id = contact_id
+
+    def query_params(self) -> Dict[str, Any]:
+        return {'contact_id': self.contact_id, 'preview_chars': COMMUNICATION_PREVIEW_CHARS}
+
+    def fetch_page(self, db: DatabaseManager, params: Dict[str, Any],
+                   page_token: Optional[str], limit: int) -> Page:
+        return db.get_communications_page(limit=limit, page_token=page_token, **params)
+
+    def display_value(self, comm: Dict, column: int) -> Any:
+        if column == 0:
+            return format_datetime(comm['comm_date'])
+        if column == 1:
+            return comm['comm_type']
+        if column == 2:
+            return self.details_preview(comm)
+        if column == 3:
+            return format_datetime(comm['created_at'])
+        return None
+
+    @staticmethod
+    def details_preview(comm: Dict) -> str:
+        # One line per row; the full text is shown when the row is opened
+        preview = " ".join(comm['details'].split())
+        if comm['details_truncated']:
+            preview += "…"
+        return preview
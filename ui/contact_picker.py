@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+from PyQt6.QtWidgets import QCompleter, QLineEdit, QMessageBox
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
+from PyQt6.QtCore import QModelIndex, Qt, QTimer, pyqtSignal
+from utils.exceptions import CRMError
+from .query_executor import get_executor
+
+# Contacts most recently picked in any ContactPicker, newest last
+RECENT_CONTACTS = 10
+_recent_contacts: 'OrderedDict[int, Dict[str, Any]]' = OrderedDict()
+
+def contact_display_name(contact: Dict[str, Any]) -> str:
+    display_name = f"{contact['first_name']} {contact['last_name']}"
+    if contact['contact_type'] == 'Company':
+        display_name += f" ({contact['company_name']})"
+    return display_name
+
+def remember_contact(contact: Dict[str, Any]) -> None:
+    _recent_contacts[contact['id']] = contact
+    _recent_contacts.move_to_end(contact['id'])
+    while len(_recent_contacts) > RECENT_CONTACTS:
+        _recent_contacts.popitem(last=False)
+
+def forget_contact(contact_id: int) -> None:
+    """Drop a contact from the recent list, e.g. after it was edited or deleted"""
+    _recent_contacts.pop(contact_id, None)
+
+def recent_contacts() -> List[Dict[str, Any]]:
+    """Recently picked contacts, newest first"""
+    return list(reversed(_recent_contacts.values()))
+
+class ContactPicker(QLineEdit):
+    """Type-ahead contact selection.
+
+    Typing searches name prefixes in the background (a few indexed rows per
+    keystroke pause, never the whole contact list); an empty box offers the
+    recently picked contacts.
+    """
+
+    SEARCH_LIMIT = 20
+    SEARCH_DELAY_MS = 200
+
+    contact_changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.executor = get_executor()
+        self.channel = f"contact-picker:{id(self)}"
+        self._contact: Optional[Dict[str, Any]] = None
+        # Id being looked up by set_contact_id, until the lookup returns
+        self._pending_id: Optional[int] = None
+        self.setPlaceholderText("Type a name to search...")
+
+        self.results = QStandardItemModel(self)
+        # The results are already filtered, so the completer only shows them
+        self.completer = QCompleter(self.results, self)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.completer.setWidget(self)
+        self.completer.activated[QModelIndex].connect(self.on_activated)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.search)
+        self.textEdited.connect(self.on_text_edited)
+
+    def contact(self) -> Optional[Dict[str, Any]]:
+        return self._contact
+
+    def contact_id(self) -> Optional[int]:
+        if self._pending_id is not None:
+            return self._pending_id
+        return self._contact['id'] if self._contact else None
+
+    def set_contact(self, contact: Optional[Dict[str, Any]]):
+        self._cancel_lookup()
+        self._contact = contact
+        self.setText(contact_display_name(contact) if contact else "")
+        self.contact_changed.emit(self.contact_id())
+
+    def set_contact_id(self, contact_id: int,
+                       on_loaded: Optional[Callable[[bool], None]] = None):
+        """Select a contact by id, looking it up in the background unless it
+        was picked recently. on_loaded(found) is called once it is shown;
+        meanwhile the picker is disabled and contact_id() returns the id."""
+        contact = _recent_contacts.get(contact_id)
+        if contact is not None:
+            self.set_contact(contact)
+            if on_loaded:
+                on_loaded(True)
+            return
+
+        def loaded(contacts: List[Dict[str, Any]]):
+            self._pending_id = None
+            self.setEnabled(True)
+            self.set_contact(contacts[0] if contacts else None)
+            if on_loaded:
+                on_loaded(bool(contacts))
+
+        self.search_timer.stop()
+        self._pending_id = contact_id
+        self._contact = None
+        self.setText("Loading...")
+        self.setEnabled(False)
+        self.executor.submit(
+            f"{self.channel}:lookup",
+            lambda db: db.get_contacts(contact_id=contact_id),
+            loaded, self.on_lookup_failed
+        )
+
+    def _cancel_lookup(self):
+        if self._pending_id is not None:
+            self._pending_id = None
+            self.executor.cancel(f"{self.channel}:lookup")
+            self.setEnabled(True)
+
+    def on_text_edited(self, text: str):
+        if self._contact is not None:
+            self._contact = None
+            self.contact_changed.emit(None)
+        self.search_timer.start()
+
+    def search(self):
+        text = self.text().strip()
+        if not text:
+            self.executor.cancel(self.channel)
+            self.show_results(recent_contacts())
+            return
+        limit = self.SEARCH_LIMIT
+        self.executor.submit(
+            self.channel,
+            lambda db: db.find_contacts_by_prefix(text, limit),
+            self.show_results, self.on_search_failed
+        )
+
+    def show_results(self, contacts: List[Dict[str, Any]]):
+        self.results.clear()
+        for contact in contacts:
+            item = QStandardItem(contact_display_name(contact))
+            item.setData(contact, Qt.ItemDataRole.UserRole)
+            self.results.appendRow(item)
+        if contacts and self.hasFocus():
+            self.completer.complete()
+        else:
+            self.completer.popup().hide()
+
+    def on_activated(self, index: QModelIndex):
+        self.set_contact(index.data(Qt.ItemDataRole.UserRole))
+
+    def on_search_failed(self, error: CRMError):
+        QMessageBox.critical(self, "Database Error", str(error))
+
+    def on_lookup_failed(self, error: CRMError):
+        self._pending_id = None
+        self.setEnabled(True)
+        self.setText("")
+        self.on_search_failed(error)
+
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        if not self.text():
+            self.show_results(recent_contacts())
@@ -0,0 +1,73 @@
+from typing import Any, Dict, Optional
+from PyQt6.QtCore import Qt
+from .paged_table_model import PagedTableModel
+from database.db_manager import DatabaseManager
+from database.pagination import Page
+from utils.datetime_helpers import format_datetime
+
+class ContactsTableModel(PagedTableModel):
+    HEADERS = ["Name", "Company", "Phone", "Email", "Status", "Last Contacted"]
+    # Column -> DatabaseManager.get_contacts_page sort key
+    SORT_KEYS = ['name', 'company', 'phone', 'email', 'status', 'last_contacted']
+
+    def __init__(self, parent=None):
+        super().__init__(self.HEADERS, 'contacts', parent=parent)
+        self.search_term: Optional[str] = None
+        self.sort_by = 'name'
+        self.descending = False
+
+    def query_params(self) -> Dict[str, Any]:
+        return {'search_term': self.search_term, 'sort_by': self.sort_by,
+                'descending': self.descending}
+
+    def fetch_page(self, db: DatabaseManager, params: Dict[str, Any],
+                   page_token: Optional[str], limit: int) -> Page:
+        return db.get_contacts_page(limit, page_token=page_token, **params)
+
+    def display_value(self, contact: Dict, column: int) -> Any:
+        if column == 0:
+            return self.display_name(contact)
+        if column == 1:
+            return contact.get('company_name') or ''
+        if column == 2:
+            # Use mobile phone if available, otherwise use primary phone
+            return contact['mobile_phone'] or contact['phone'] or ''
+        if column == 3:
+            return contact['email'] or ''
+        if column == 4:
+            return contact['status']
+        if column == 5:
+            return format_datetime(contact['last_contacted_at']) if contact['last_contacted_at'] else ''
+        return None
+
+    @staticmethod
+    def display_name(contact: Dict) -> str:
+        name = f"{contact['first_name']} {contact['last_name']}"
+        if contact['title']:
+            name += f" ({contact['title']})"
+        return name
+
+    def set_search_term(self, search_term: Optional[str]):
+        # A new search starts out ranked by relevance; clicking a header
+        # re-sorts the matches by that column instead
+        if search_term and not self.search_term:
+            self.sort_by, self.descending = 'relevance', False
+        elif not search_term and self.sort_by == 'relevance':
+            self.sort_by, self.descending = 'name', False
+        self.search_term = search_term
+        self.reload()
+
+    def sort_column(self) -> int:
+        """Header column matching the current sort, or -1 for relevance"""
+        return self.SORT_KEYS.index(self.sort_by) if self.sort_by in self.SORT_KEYS else -1
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        if column < 0 or column >= len(self.SORT_KEYS):
+            return
+        sort_by = self.SORT_KEYS[column]
+        descending = order == Qt.SortOrder.DescendingOrder
+        if (sort_by, descending) == (self.sort_by, self.descending):
+            return
+        self.sort_by = sort_by
+        self.descending = descending
+        self.reload()
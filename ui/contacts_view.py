@@ -1,19 +1,21 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                           QPushButton, QTableWidget, QTableWidgetItem,
+                           QPushButton, QTableView,
                            QMessageBox, QLineEdit)
 from PyQt6.QtCore import Qt, QTimer
 from .dialogs.contact_dialog import ContactDialog
-from database.db_manager import DatabaseManager
+from database.connection_pool import get_session
 from utils.exceptions import DatabaseError
 from .dialogs.contact_communications import ContactCommunicationsDialog
-from utils.datetime_helpers import format_datetime
 from .dialogs.contact_view_dialog import ContactViewDialog
-from typing import Optional
+from .contacts_model import ContactsTableModel
+from .contact_picker import forget_contact
+from utils.startup_timing import startup_timer
+from typing import Optional, Dict, Any
 
 class ContactsView(QWidget):
     def __init__(self):
         super().__init__()
-        self.db = DatabaseManager()
+        self.db = get_session()
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.perform_search)
@@ -56,17 +58,19 @@ class ContactsView(QWidget):
         
         layout.addLayout(button_layout)
         
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Name", "Company", "Phone", "Email", "Status", "Last Contacted"
-        ])
+        # Table, backed by a model that pages contacts in as the user scrolls
+        self.model = ContactsTableModel(self)
+        self.model.loadFailed.connect(self.on_load_failed)
+        self.model.reloaded.connect(self.on_contacts_loaded)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.itemDoubleClicked.connect(self.view_contact)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSortIndicator(0, Qt.SortOrder.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        self.table.doubleClicked.connect(self.view_contact)
         
         # Make columns stretch to fill space
         header = self.table.horizontalHeader()
@@ -82,6 +86,8 @@ class ContactsView(QWidget):
         self.load_contacts()
     
     def on_search_text_changed(self, text: str):
+        # The user is still typing: drop any search already running
+        self.model.executor.cancel(self.model.channel)
         # Reset the timer
         self.search_timer.stop()
         # Start the timer with a 300ms delay
@@ -96,33 +102,29 @@ class ContactsView(QWidget):
         self.load_contacts()
     
     def load_contacts(self, search_term: Optional[str] = None):
-        try:
-            contacts = self.db.get_contacts(search_term=search_term)
-            self.table.setRowCount(len(contacts))
-            
-            for row, contact in enumerate(contacts):
-                name = f"{contact['first_name']} {contact['last_name']}"
-                if contact['title']:
-                    name += f" ({contact['title']})"
-                    
-                self.table.setItem(row, 0, QTableWidgetItem(name))
-                self.table.setItem(row, 1, QTableWidgetItem(contact.get('company_name', '')))
-                
-                # Use mobile phone if available, otherwise use primary phone
-                phone = contact['mobile_phone'] or contact['phone'] or ''
-                self.table.setItem(row, 2, QTableWidgetItem(phone))
-                self.table.setItem(row, 3, QTableWidgetItem(contact['email']))
-                self.table.setItem(row, 4, QTableWidgetItem(contact['status']))
-                
-                # Format the last contacted date
-                last_contacted = format_datetime(contact['last_contacted_at']) if contact['last_contacted_at'] else ''
-                self.table.setItem(row, 5, QTableWidgetItem(last_contacted))
-                
-                # Store the contact ID in the first column
-                self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, contact['id'])
-                
-        except DatabaseError as e:
-            QMessageBox.critical(self, "Database Error", str(e))
+        self.model.set_search_term(search_term)
+        # Keep the header's sort arrow in step without triggering another sort
+        header = self.table.horizontalHeader()
+        header.blockSignals(True)
+        header.setSortIndicator(
+            self.model.sort_column(),
+            Qt.SortOrder.DescendingOrder if self.model.descending else Qt.SortOrder.AscendingOrder
+        )
+        header.blockSignals(False)
+    
+    def on_contacts_loaded(self):
+        # The first contacts page is the application's first real data
+        startup_timer.mark('first_data')
+        startup_timer.log_report()
+    
+    def on_load_failed(self, message: str):
+        QMessageBox.critical(self, "Database Error", message)
+    
+    def selected_contact(self) -> Optional[Dict[str, Any]]:
+        current_row = self.table.currentIndex().row()
+        if current_row < 0:
+            return None
+        return self.model.row_data(current_row)
     
     def add_contact(self):
         dialog = ContactDialog(self)
@@ -135,12 +137,12 @@ class ContactsView(QWidget):
                 QMessageBox.critical(self, "Error", f"Could not add contact: {str(e)}")
     
     def edit_contact(self):
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        selected = self.selected_contact()
+        if selected is None:
             QMessageBox.warning(self, "Warning", "Please select a contact to edit")
             return
         
-        contact_id = self.table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
+        contact_id = selected['id']
         contact = self.db.get_contacts(contact_id)[0]
         
         dialog = ContactDialog(self, contact)
@@ -148,17 +150,18 @@ class ContactsView(QWidget):
             try:
                 contact_data = dialog.get_data()
                 self.db.update_contact(contact_id, contact_data)
+                forget_contact(contact_id)
                 self.load_contacts()
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not update contact: {str(e)}")
     
     def delete_contact(self):
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        selected = self.selected_contact()
+        if selected is None:
             QMessageBox.warning(self, "Warning", "Please select a contact to delete")
             return
         
-        contact_id = self.table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
+        contact_id = selected['id']
         
         reply = QMessageBox.question(
             self, "Confirm Deletion",
@@ -169,19 +172,20 @@ class ContactsView(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.db.update_contact(contact_id, {'status': 'Deleted'})
+                forget_contact(contact_id)
                 self.load_contacts()
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not delete contact: {str(e)}")
     
     def show_communications(self):
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        selected = self.selected_contact()
+        if selected is None:
             QMessageBox.warning(self, "Warning", 
                               "Please select a contact to view communications")
             return
         
-        contact_id = self.table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
-        contact_name = self.table.item(current_row, 0).text()
+        contact_id = selected['id']
+        contact_name = ContactsTableModel.display_name(selected)
         
         dialog = ContactCommunicationsDialog(self, contact_id, contact_name)
         dialog.exec()
@@ -190,11 +194,11 @@ class ContactsView(QWidget):
         self.load_contacts()
     
     def view_contact(self):
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        selected = self.selected_contact()
+        if selected is None:
             return
         
-        contact_id = self.table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
+        contact_id = selected['id']
         dialog = ContactViewDialog(self, contact_id)
         dialog.exec()
         
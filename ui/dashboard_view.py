@@ -0,0 +1,107 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+                           QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+                           QHeaderView, QMessageBox)
+from datetime import date
+from typing import Any, Dict, List
+from database.db_manager import DatabaseManager
+from .query_executor import get_executor
+
+class DashboardView(QWidget):
+    """Book-of-business totals, read only from the policy summary tables"""
+
+    RENEWAL_MONTHS = 12
+    TOP_CONTACTS = 20
+
+    def __init__(self):
+        super().__init__()
+        self.executor = get_executor()
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        header_layout = QHBoxLayout()
+        self.totals_label = QLabel()
+        header_layout.addWidget(self.totals_label)
+        header_layout.addStretch()
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.load_dashboard)
+        header_layout.addWidget(refresh_button)
+        layout.addLayout(header_layout)
+
+        grid = QGridLayout()
+        self.carrier_table = self.add_table(grid, 0, 0, "Active premium by carrier",
+                                            ["Carrier", "Policies", "Premium"])
+        self.type_table = self.add_table(grid, 0, 1, "Active premium by policy type",
+                                         ["Type", "Policies", "Premium"])
+        self.month_table = self.add_table(grid, 2, 0, "Active policies by renewal month",
+                                          ["Month", "Policies", "Premium"])
+        self.contacts_table = self.add_table(grid, 2, 1, "Contacts with the most active policies",
+                                             ["Contact", "Company", "Policies", "Premium"])
+        layout.addLayout(grid)
+
+    def add_table(self, grid: QGridLayout, row: int, column: int, title: str,
+                  headers: List[str]) -> QTableWidget:
+        grid.addWidget(QLabel(title), row, column)
+        table = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        grid.addWidget(table, row + 1, column)
+        return table
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Summary reads are cheap, so the tab is always current when shown
+        self.load_dashboard()
+
+    def load_dashboard(self):
+        self.executor.submit('dashboard', self.fetch_dashboard,
+                             self.populate, self.on_load_failed)
+
+    def fetch_dashboard(self, db: DatabaseManager) -> Dict[str, List[Dict]]:
+        # Runs on the executor's thread
+        today = date.today()
+        last = today.year * 12 + today.month - 1 + self.RENEWAL_MONTHS - 1
+        return {
+            'carrier': db.get_policy_totals('carrier'),
+            'policy_type': db.get_policy_totals('policy_type'),
+            'renewal_month': db.get_policy_totals(
+                'renewal_month', key_from=today.strftime("%Y-%m"),
+                key_to=f"{last // 12:04d}-{last % 12 + 1:02d}"
+            ),
+            'contacts': db.get_top_contacts_by_policies(self.TOP_CONTACTS),
+        }
+
+    def populate(self, dashboard: Dict[str, List[Dict]]):
+        count = sum(row['policy_count'] for row in dashboard['carrier'])
+        premium = sum(row['premium'] for row in dashboard['carrier'])
+        self.totals_label.setText(f"{count:,} active policies, ${premium:,.2f} annual premium")
+
+        self.fill_totals(self.carrier_table, dashboard['carrier'])
+        self.fill_totals(self.type_table, dashboard['policy_type'])
+        self.fill_totals(self.month_table, dashboard['renewal_month'])
+        contacts = dashboard['contacts']
+        self.contacts_table.setRowCount(len(contacts))
+        for row, contact in enumerate(contacts):
+            self.set_row(self.contacts_table, row, [
+                contact['contact_name'], contact['company_name'] or '',
+                f"{contact['active_policies']:,}", f"${contact['active_premium']:,.2f}"
+            ])
+
+    def fill_totals(self, table: QTableWidget, totals: List[Dict]):
+        table.setRowCount(len(totals))
+        for row, total in enumerate(totals):
+            self.set_row(table, row, [
+                total['key'], f"{total['policy_count']:,}", f"${total['premium']:,.2f}"
+            ])
+
+    def set_row(self, table: QTableWidget, row: int, values: List[Any]):
+        for column, value in enumerate(values):
+            table.setItem(row, column, QTableWidgetItem(str(value)))
+
+    def on_load_failed(self, error):
+        QMessageBox.critical(self, "Database Error", str(error))
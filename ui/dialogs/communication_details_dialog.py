@@ -0,0 +1,49 @@
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLabel,
+                           QTextEdit, QDialogButtonBox, QMessageBox)
+from typing import Any, Dict, Optional
+from utils.datetime_helpers import format_datetime
+from utils.exceptions import CRMError
+from ..query_executor import get_executor
+
+class CommunicationDetailsDialog(QDialog):
+    """Read-only view of one communication with its full details"""
+
+    def __init__(self, parent=None, communication: Dict[str, Any] = None):
+        super().__init__(parent)
+        self.communication = communication
+        self.init_ui()
+
+    def init_ui(self):
+        comm = self.communication
+        self.setWindowTitle(f"{comm['comm_type']} - {format_datetime(comm['comm_date'])}")
+        self.resize(600, 400)
+        layout = QVBoxLayout(self)
+
+        form = QFormLayout()
+        form.addRow("Type:", QLabel(comm['comm_type']))
+        form.addRow("Date & Time:", QLabel(format_datetime(comm['comm_date'])))
+        form.addRow("Created:", QLabel(format_datetime(comm['created_at'])))
+        layout.addLayout(form)
+
+        details = QTextEdit()
+        details.setPlainText(comm['details'])
+        details.setReadOnly(True)
+        layout.addWidget(details)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+def open_communication(parent, comm_id: int):
+    """Fetch a communication's full details in the background and show them"""
+    def show(comm: Optional[Dict[str, Any]]):
+        if comm is None:
+            QMessageBox.warning(parent, "Not Found", "This communication no longer exists.")
+            return
+        CommunicationDetailsDialog(parent, comm).exec()
+
+    def failed(error: CRMError):
+        QMessageBox.critical(parent, "Database Error", str(error))
+
+    get_executor().submit(f'communication:{comm_id}',
+                          lambda db: db.get_communication(comm_id), show, failed)
@@ -4,7 +4,9 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout,
 from PyQt6.QtCore import Qt, QDateTime
 from typing import Optional, Dict, Any
 import pytz
-from utils.config import ConfigManager
+from utils.datetime_helpers import local_timezone
+from utils.exceptions import ValidationError
+from utils.validation import validate_communication
 
 class CommunicationDialog(QDialog):
     COMM_TYPES = [
@@ -22,8 +24,7 @@ class CommunicationDialog(QDialog):
         super().__init__(parent)
         self.contact_id = contact_id
         self.contact_name = contact_name
-        self.config = ConfigManager()
-        self.local_tz = pytz.timezone(self.config.get('ui', 'timezone'))
+        self.local_tz = local_timezone()
         self.init_ui()
     
     def init_ui(self):
@@ -59,9 +60,10 @@ class CommunicationDialog(QDialog):
         layout.addWidget(buttons)
     
     def validate_and_accept(self):
-        if not self.details.toPlainText().strip():
-            QMessageBox.warning(self, "Validation Error", 
-                              "Please enter communication details")
+        try:
+            validate_communication(self.get_data())
+        except ValidationError as e:
+            QMessageBox.warning(self, "Validation Error", e.message)
             return
         
         self.accept()
@@ -1,11 +1,10 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
-                           QPushButton, QTableWidget, QTableWidgetItem,
-                           QMessageBox)
-from PyQt6.QtCore import Qt
+                           QPushButton, QTableView, QMessageBox)
 from .communication_dialog import CommunicationDialog
-from database.db_manager import DatabaseManager
+from .communication_details_dialog import open_communication
+from database.connection_pool import get_session
 from utils.exceptions import DatabaseError
-from utils.datetime_helpers import format_datetime
+from ..communications_model import CommunicationsTableModel
 
 class ContactCommunicationsDialog(QDialog):
     def __init__(self, parent=None, contact_id: int = None, 
@@ -13,7 +12,7 @@ class ContactCommunicationsDialog(QDialog):
         super().__init__(parent)
         self.contact_id = contact_id
         self.contact_name = contact_name
-        self.db = DatabaseManager()
+        self.db = get_session()
         self.init_ui()
     
     def init_ui(self):
@@ -31,16 +30,19 @@ class ContactCommunicationsDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels([
-            "Date & Time", "Type", "Details", "Created"
-        ])
-        
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Table, paged in newest first as the user scrolls
+        self.model = CommunicationsTableModel(self.contact_id, parent=self)
+        self.model.loadFailed.connect(self.on_load_failed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.setWordWrap(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(2, header.ResizeMode.Stretch)
+        # Double-click opens the full details
+        self.table.doubleClicked.connect(self.open_communication)
         
         layout.addWidget(self.table)
         
@@ -52,18 +54,15 @@ class ContactCommunicationsDialog(QDialog):
         self.load_communications()
     
     def load_communications(self):
-        try:
-            communications = self.db.get_communications(self.contact_id)
-            self.table.setRowCount(len(communications))
-            
-            for row, comm in enumerate(communications):
-                self.table.setItem(row, 0, QTableWidgetItem(format_datetime(comm['comm_date'])))
-                self.table.setItem(row, 1, QTableWidgetItem(comm['comm_type']))
-                self.table.setItem(row, 2, QTableWidgetItem(comm['details']))
-                self.table.setItem(row, 3, QTableWidgetItem(format_datetime(comm['created_at'])))
-                
-        except DatabaseError as e:
-            QMessageBox.critical(self, "Database Error", str(e))
+        self.model.reload()
+    
+    def on_load_failed(self, message: str):
+        QMessageBox.critical(self, "Database Error", message)
+    
+    def open_communication(self, index):
+        comm_id = self.model.row_id(index.row())
+        if comm_id is not None:
+            open_communication(self, comm_id)
     
     def add_communication(self):
         dialog = CommunicationDialog(self, self.contact_id, self.contact_name)
@@ -74,4 +73,4 @@ class ContactCommunicationsDialog(QDialog):
                 self.load_communications()
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", 
-                                   f"Could not add communication: {str(e)}") 
\ No newline at end of file
+                                   f"Could not add communication: {str(e)}")
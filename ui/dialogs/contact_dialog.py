@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout,
                            QWidget, QGridLayout, QLabel)
 from PyQt6.QtCore import Qt
 from typing import Optional, Dict, Any
+from utils.exceptions import ValidationError
+from utils.validation import validate_contact
 
 class ContactDialog(QDialog):
     def __init__(self, parent=None, contact_data: Optional[Dict[str, Any]] = None):
@@ -99,14 +101,10 @@ class ContactDialog(QDialog):
         self.notes.setText(self.contact_data.get('notes', ''))
     
     def validate_and_accept(self):
-        if self.contact_type.currentText() == 'Company' and not self.company_name.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Company name is required")
-            return
-        if not self.first_name.text().strip():
-            QMessageBox.warning(self, "Validation Error", "First name is required")
-            return
-        if not self.last_name.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Last name is required")
+        try:
+            validate_contact(self.get_data())
+        except ValidationError as e:
+            QMessageBox.warning(self, "Validation Error", e.message)
             return
         
         self.accept()
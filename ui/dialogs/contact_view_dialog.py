@@ -1,27 +1,34 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
-                           QPushButton, QTableWidget, QTableWidgetItem,
+                           QPushButton, QTableWidget, QTableWidgetItem, QTableView,
                            QLabel, QFrame, QMessageBox, QTabWidget, QWidget)
 from PyQt6.QtCore import Qt
-from datetime import datetime
 from .contact_dialog import ContactDialog
 from .communication_dialog import CommunicationDialog
-from database.db_manager import DatabaseManager
-from utils.exceptions import DatabaseError
-from utils.datetime_helpers import format_datetime, format_date
+from .communication_details_dialog import open_communication
+from database.connection_pool import get_session
+from database.db_manager import PROFILE_COMMUNICATIONS, PROFILE_PARTS
+from database.pagination import Page
+from utils.exceptions import DatabaseError, CRMError
+from utils.datetime_helpers import format_datetime, format_dates
+from ..communications_model import CommunicationsTableModel
+from ..contact_picker import forget_contact
+from ..query_executor import get_executor
+from typing import Any, Dict, List, Optional, Sequence
 from .policy_dialog import PolicyDialog
 
 class ContactViewDialog(QDialog):
     def __init__(self, parent=None, contact_id: int = None):
         super().__init__(parent)
         self.contact_id = contact_id
-        self.db = DatabaseManager()
+        self.db = get_session()
+        self.executor = get_executor()
         self.contact_data = None
         self.info_labels = {}  # Store references to labels
         self.init_ui()
-        self.load_contact_data()
+        self.load_profile()
         
     def init_ui(self):
-        self.setWindowTitle("Contact Details")  # Will be updated in load_contact_data
+        self.setWindowTitle("Contact Details")  # Will be updated in show_contact
         self.resize(1000, 600)
         layout = QVBoxLayout(self)
         
@@ -33,10 +40,12 @@ class ContactViewDialog(QDialog):
         add_comm_button.clicked.connect(self.add_communication)
         add_policy_button = QPushButton("Add Policy")
         add_policy_button.clicked.connect(self.add_policy)
+        # Enabled once the contact has loaded
+        self.contact_buttons = [edit_button, add_comm_button, add_policy_button]
         
-        button_layout.addWidget(edit_button)
-        button_layout.addWidget(add_comm_button)
-        button_layout.addWidget(add_policy_button)
+        for button in self.contact_buttons:
+            button.setEnabled(False)
+            button_layout.addWidget(button)
         button_layout.addStretch()
         
         close_button = QPushButton("Close")
@@ -52,7 +61,7 @@ class ContactViewDialog(QDialog):
         layout.addWidget(info_frame)
         
         # Tabs for Policies and Communications
-        tabs = QTabWidget()
+        self.tabs = tabs = QTabWidget()
         
         # Active Policies Tab
         policies_widget = QWidget()
@@ -74,21 +83,55 @@ class ContactViewDialog(QDialog):
         comms_widget = QWidget()
         comms_layout = QVBoxLayout(comms_widget)
         
-        self.comms_table = QTableWidget()
-        self.comms_table.setColumnCount(4)
-        self.comms_table.setHorizontalHeaderLabels([
-            "Date & Time", "Type", "Details", "Created"
-        ])
-        self.comms_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.comms_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # The profile brings the first page; older entries page in on scroll.
+        # Until it arrives the model must not fetch that page itself.
+        self.comms_model = CommunicationsTableModel(
+            self.contact_id, page_size=PROFILE_COMMUNICATIONS,
+            defer_first_fetch=True, parent=self)
+        self.comms_model.loadFailed.connect(self.on_page_failed)
+        self.comms_table = QTableView()
+        self.comms_table.setModel(self.comms_model)
+        self.comms_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.comms_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.comms_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.comms_table.setWordWrap(False)
+        header = self.comms_table.horizontalHeader()
+        header.setSectionResizeMode(2, header.ResizeMode.Stretch)
+        # Double-click opens the full details
+        self.comms_table.doubleClicked.connect(self.open_communication)
         
         comms_layout.addWidget(self.comms_table)
-        tabs.addTab(comms_widget, "Communications History")
+        self.comms_tab_index = tabs.addTab(comms_widget, "Communications History")
         
         layout.addWidget(tabs)
 
-    def load_contact_data(self):
-        self.contact_data = self.db.get_contacts(self.contact_id)[0]
+    def load_profile(self, parts: Sequence[str] = PROFILE_PARTS):
+        """Fetch the given parts of the profile and redisplay only those"""
+        contact_id = self.contact_id
+        parts = tuple(parts)
+        self.executor.submit(
+            f"contact-profile:{contact_id}:{','.join(parts)}",
+            lambda db: db.get_contact_profile(contact_id, parts),
+            self.apply_profile, self.on_load_failed
+        )
+    
+    def apply_profile(self, profile: Dict[str, Any]):
+        if 'contact' in profile:
+            if profile['contact'] is None:
+                QMessageBox.warning(self, "Contact Not Found",
+                                    "This contact no longer exists.")
+                self.reject()
+                return
+            self.show_contact(profile['contact'])
+        if 'policies' in profile:
+            self.populate_policies(profile['policies'])
+        if 'communications' in profile:
+            self.populate_communications(profile['communications'],
+                                         profile['communication_count'])
+            self.show_last_contacted(profile['last_contacted_at'])
+    
+    def show_contact(self, contact: Dict[str, Any]):
+        self.contact_data = contact
         self.setWindowTitle(f"Contact Details - {self.contact_data['first_name']} {self.contact_data['last_name']}")
         
         # Clear existing labels
@@ -134,9 +177,19 @@ class ContactViewDialog(QDialog):
             self.info_layout.addWidget(QLabel(self.contact_data['address']), row, 1, 1, 3)
             row += 1
         
-        # Refresh the tables
-        self.load_policies()
-        self.load_communications()
+        self.info_layout.addWidget(QLabel("Last Contacted:"), row, 0)
+        self.info_labels['last_contacted'] = QLabel()
+        self.info_layout.addWidget(self.info_labels['last_contacted'], row, 1)
+        self.show_last_contacted(self.contact_data['last_contacted_at'])
+        
+        for button in self.contact_buttons:
+            button.setEnabled(True)
+    
+    def show_last_contacted(self, last_contacted_at: Optional[str]):
+        if self.contact_data is None:
+            return
+        self.contact_data['last_contacted_at'] = last_contacted_at
+        self.info_labels['last_contacted'].setText(format_datetime(last_contacted_at) or "Never")
     
     def edit_contact(self):
         dialog = ContactDialog(self, self.contact_data)
@@ -144,45 +197,41 @@ class ContactViewDialog(QDialog):
             try:
                 contact_data = dialog.get_data()
                 self.db.update_contact(self.contact_id, contact_data)
-                self.load_contact_data()  # Refresh the display
+                forget_contact(self.contact_id)
+                self.load_profile(['contact'])  # Refresh the contact details only
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not update contact: {str(e)}")
     
-    def load_policies(self):
-        try:
-            policies = self.db.get_policies(self.contact_id)
-            # Filter for active policies
-            current_date = datetime.now().date()
-            active_policies = [p for p in policies 
-                             if datetime.strptime(p['renewal_date'], '%Y-%m-%d').date() >= current_date
-                             and p['status'] == 'Active']
-            
-            self.policies_table.setRowCount(len(active_policies))
-            
-            for row, policy in enumerate(active_policies):
-                self.policies_table.setItem(row, 0, QTableWidgetItem(policy['policy_number']))
-                self.policies_table.setItem(row, 1, QTableWidgetItem(policy['policy_type']))
-                self.policies_table.setItem(row, 2, QTableWidgetItem(policy['carrier']))
-                self.policies_table.setItem(row, 3, QTableWidgetItem(f"${policy['premium']:,.2f}"))
-                self.policies_table.setItem(row, 4, QTableWidgetItem(format_date(policy['start_date'])))
-                self.policies_table.setItem(row, 5, QTableWidgetItem(format_date(policy['renewal_date'])))
-                
-        except DatabaseError as e:
-            QMessageBox.critical(self, "Database Error", str(e))
+    def populate_policies(self, policies: List[Dict]):
+        self.policies_table.setRowCount(len(policies))
+        start_dates = format_dates(policy['start_date'] for policy in policies)
+        renewal_dates = format_dates(policy['renewal_date'] for policy in policies)
+        
+        for row, policy in enumerate(policies):
+            self.policies_table.setItem(row, 0, QTableWidgetItem(policy['policy_number']))
+            self.policies_table.setItem(row, 1, QTableWidgetItem(policy['policy_type']))
+            self.policies_table.setItem(row, 2, QTableWidgetItem(policy['carrier']))
+            self.policies_table.setItem(row, 3, QTableWidgetItem(f"${policy['premium']:,.2f}"))
+            self.policies_table.setItem(row, 4, QTableWidgetItem(start_dates[row]))
+            self.policies_table.setItem(row, 5, QTableWidgetItem(renewal_dates[row]))
     
-    def load_communications(self):
-        try:
-            communications = self.db.get_communications(self.contact_id)
-            self.comms_table.setRowCount(len(communications))
-            
-            for row, comm in enumerate(communications):
-                self.comms_table.setItem(row, 0, QTableWidgetItem(format_datetime(comm['comm_date'])))
-                self.comms_table.setItem(row, 1, QTableWidgetItem(comm['comm_type']))
-                self.comms_table.setItem(row, 2, QTableWidgetItem(comm['details']))
-                self.comms_table.setItem(row, 3, QTableWidgetItem(format_datetime(comm['created_at'])))
-                
-        except DatabaseError as e:
-            QMessageBox.critical(self, "Database Error", str(e))
+    def populate_communications(self, first_page: Page, total: int):
+        title = "Communications History"
+        if total:
+            title += f" ({total:,})"
+        self.tabs.setTabText(self.comms_tab_index, title)
+        self.comms_model.load_first_page(first_page)
+    
+    def open_communication(self, index):
+        comm_id = self.comms_model.row_id(index.row())
+        if comm_id is not None:
+            open_communication(self, comm_id)
+    
+    def on_load_failed(self, error: CRMError):
+        QMessageBox.critical(self, "Database Error", str(error))
+    
+    def on_page_failed(self, message: str):
+        QMessageBox.critical(self, "Database Error", message)
     
     def add_communication(self):
         name = f"{self.contact_data['first_name']} {self.contact_data['last_name']}"
@@ -191,7 +240,8 @@ class ContactViewDialog(QDialog):
             try:
                 comm_data = dialog.get_data()
                 self.db.add_communication(comm_data)
-                self.load_communications()
+                # Only the history and last-contacted date change
+                self.load_profile(['communications'])
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not add communication: {str(e)}")
     
@@ -201,6 +251,6 @@ class ContactViewDialog(QDialog):
             try:
                 policy_data = dialog.get_data()
                 self.db.add_policy(policy_data)
-                self.load_policies()  # Refresh the policies table
+                self.load_profile(['policies'])  # Refresh the policies table
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not add policy: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,136 @@
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                           QPushButton, QTableWidget, QTableWidgetItem,
+                           QCheckBox, QSpinBox, QFileDialog, QMessageBox,
+                           QHeaderView)
+from PyQt6.QtCore import QTimer
+from database.connection_pool import get_pool
+from database.instrumentation import query_stats
+
+class DiagnosticsDialog(QDialog):
+    """Per-statement query statistics and the recent slow-query log"""
+
+    REFRESH_MS = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle("Query Diagnostics")
+        self.resize(1000, 600)
+
+        layout = QVBoxLayout(self)
+
+        # Settings
+        settings_layout = QHBoxLayout()
+        self.enabled_check = QCheckBox("Record query statistics")
+        self.enabled_check.setChecked(query_stats.enabled)
+        self.enabled_check.toggled.connect(self.on_settings_changed)
+        settings_layout.addWidget(self.enabled_check)
+        settings_layout.addWidget(QLabel("Slow query threshold (ms):"))
+        self.slow_ms_input = QSpinBox()
+        self.slow_ms_input.setRange(1, 600000)
+        self.slow_ms_input.setValue(int(query_stats.slow_ms))
+        self.slow_ms_input.valueChanged.connect(self.on_settings_changed)
+        settings_layout.addWidget(self.slow_ms_input)
+        settings_layout.addStretch()
+        self.pool_label = QLabel()
+        settings_layout.addWidget(self.pool_label)
+        layout.addLayout(settings_layout)
+
+        # Statement statistics
+        self.stats_table = QTableWidget()
+        self.stats_table.setColumnCount(6)
+        self.stats_table.setHorizontalHeaderLabels([
+            "Statement", "Count", "Total (ms)", "Mean (ms)", "p95 (ms)", "Max (ms)"
+        ])
+        self.stats_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.stats_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.stats_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.stats_table, 2)
+
+        # Slow queries, newest first; the query plan is in the tooltip
+        layout.addWidget(QLabel("Slow queries"))
+        self.slow_table = QTableWidget()
+        self.slow_table.setColumnCount(4)
+        self.slow_table.setHorizontalHeaderLabels(["Time", "Elapsed (ms)", "Statement", "Plan"])
+        self.slow_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.slow_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.slow_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.slow_table, 1)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset)
+        save_button = QPushButton("Save to File...")
+        save_button.clicked.connect(self.save)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(refresh_button)
+        button_layout.addWidget(reset_button)
+        button_layout.addWidget(save_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+        self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_timer.start(self.REFRESH_MS)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def on_settings_changed(self):
+        query_stats.configure(self.enabled_check.isChecked(), self.slow_ms_input.value())
+
+    def refresh(self):
+        stats = get_pool().stats()
+        self.pool_label.setText(
+            f"Connections: {stats['readers_open']} readers "
+            f"({stats['readers_idle']} idle), {stats['opened']} opened"
+        )
+
+        statements = query_stats.snapshot()
+        self.stats_table.setRowCount(len(statements))
+        for row, stat in enumerate(statements):
+            item = QTableWidgetItem(stat['shape'])
+            item.setToolTip(stat['shape'])
+            self.stats_table.setItem(row, 0, item)
+            for column, key in enumerate(('count', 'total_ms', 'mean_ms', 'p95_ms', 'max_ms'), 1):
+                self.stats_table.setItem(row, column, QTableWidgetItem(f"{stat[key]:,}"))
+
+        slow = list(query_stats.slow_queries)[::-1]
+        self.slow_table.setRowCount(len(slow))
+        for row, query in enumerate(slow):
+            plan = "\n".join(query['plan'])
+            self.slow_table.setItem(row, 0, QTableWidgetItem(query['at']))
+            self.slow_table.setItem(row, 1, QTableWidgetItem(f"{query['elapsed_ms']:,}"))
+            item = QTableWidgetItem(query['shape'])
+            item.setToolTip(query['shape'])
+            self.slow_table.setItem(row, 2, item)
+            item = QTableWidgetItem(plan.replace("\n", "; "))
+            item.setToolTip(plan)
+            self.slow_table.setItem(row, 3, item)
+
+    def reset(self):
+        query_stats.reset()
+        self.refresh()
+
+    def save(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save Query Statistics", "query_stats.json", "JSON files (*.json)"
+        )
+        if not path:
+            return
+        try:
+            query_stats.dump(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Could not save statistics: {str(e)}")
@@ -0,0 +1,129 @@
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
+                           QComboBox, QLineEdit, QPushButton, QSpinBox,
+                           QDialogButtonBox, QFileDialog, QMessageBox)
+from pathlib import Path
+from typing import Any, Dict
+from database.exporter import EXPORT_TABLES, FORMATS, COMPRESSORS, guess_format
+
+class ExportDialog(QDialog):
+    """Choose what to export, with filters, and where to"""
+
+    STATUSES = {
+        'contacts': ['Active', 'Inactive', 'Lead'],
+        'policies': ['Active', 'Cancelled', 'Expired', 'Deleted'],
+        'communications': [],
+    }
+    FILE_FILTERS = {
+        'csv': "CSV files (*.csv *.csv.gz *.csv.bz2 *.csv.xz)",
+        'jsonl': "JSON Lines files (*.jsonl *.jsonl.gz *.jsonl.bz2 *.jsonl.xz)",
+        'parquet': "Parquet files (*.parquet)",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle("Export Data")
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.table_combo = QComboBox()
+        for table in EXPORT_TABLES:
+            self.table_combo.addItem(table.capitalize(), table)
+        self.table_combo.currentIndexChanged.connect(self.on_table_changed)
+        form.addRow("Export:", self.table_combo)
+
+        self.format_combo = QComboBox()
+        for fmt in FORMATS:
+            self.format_combo.addItem(fmt.upper() if fmt != 'jsonl' else 'JSON Lines', fmt)
+        self.format_combo.currentIndexChanged.connect(self.on_format_changed)
+        form.addRow("Format:", self.format_combo)
+
+        self.compression_combo = QComboBox()
+        form.addRow("Compression:", self.compression_combo)
+
+        # Filters
+        self.status_combo = QComboBox()
+        form.addRow("Status:", self.status_combo)
+        self.carrier = QLineEdit()
+        self.carrier.setPlaceholderText("Any carrier")
+        form.addRow("Carrier:", self.carrier)
+        self.renewal_days = QSpinBox()
+        self.renewal_days.setRange(0, 3650)
+        self.renewal_days.setSpecialValueText("Any")
+        self.renewal_days.setSuffix(" days")
+        form.addRow("Renewing within:", self.renewal_days)
+
+        path_layout = QHBoxLayout()
+        self.path = QLineEdit()
+        browse_button = QPushButton("Browse...")
+        browse_button.clicked.connect(self.browse)
+        path_layout.addWidget(self.path)
+        path_layout.addWidget(browse_button)
+        form.addRow("File:", path_layout)
+        layout.addLayout(form)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.validate_and_accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.on_table_changed()
+        self.on_format_changed()
+
+    def on_table_changed(self):
+        table = self.table_combo.currentData()
+        self.status_combo.clear()
+        self.status_combo.addItem("Any", None)
+        for status in self.STATUSES[table]:
+            self.status_combo.addItem(status, status)
+        self.status_combo.setEnabled(table != 'communications')
+        self.carrier.setEnabled(table == 'policies')
+        self.renewal_days.setEnabled(table == 'policies')
+
+    def on_format_changed(self):
+        self.compression_combo.clear()
+        self.compression_combo.addItem("None", None)
+        if self.format_combo.currentData() == 'parquet':
+            for codec in ('snappy', 'zstd', 'gzip'):
+                self.compression_combo.addItem(codec, codec)
+            self.compression_combo.setCurrentIndex(1)
+        else:
+            for codec in COMPRESSORS:
+                self.compression_combo.addItem(codec, codec)
+
+    def browse(self):
+        fmt = self.format_combo.currentData()
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export To", f"{self.table_combo.currentData()}.{fmt}", self.FILE_FILTERS[fmt]
+        )
+        if path:
+            self.path.setText(path)
+
+    def validate_and_accept(self):
+        if not self.path.text().strip():
+            QMessageBox.warning(self, "Validation Error", "Please choose a file to export to")
+            return
+        fmt = guess_format(Path(self.path.text().strip()))
+        if fmt is not None and fmt != self.format_combo.currentData():
+            QMessageBox.warning(self, "Validation Error",
+                                f"The file name is for {fmt.upper()}, not the chosen format")
+            return
+
+        self.accept()
+
+    def get_options(self) -> Dict[str, Any]:
+        """Keyword arguments for database.exporter.export_table"""
+        table = self.table_combo.currentData()
+        return {
+            'table': table,
+            'path': Path(self.path.text().strip()),
+            'fmt': self.format_combo.currentData(),
+            'compression': self.compression_combo.currentData(),
+            'status': self.status_combo.currentData(),
+            'carrier': (self.carrier.text().strip() or None) if table == 'policies' else None,
+            'renewal_days': (self.renewal_days.value() or None) if table == 'policies' else None,
+        }
@@ -4,7 +4,9 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout,
                            QDoubleSpinBox)
 from PyQt6.QtCore import Qt, QDate
 from typing import Optional, Dict, Any
-from database.db_manager import DatabaseManager
+from utils.exceptions import ValidationError
+from utils.validation import validate_policy
+from ..contact_picker import ContactPicker, remember_contact
 
 class PolicyDialog(QDialog):
     def __init__(self, parent=None, policy_data: Optional[Dict[str, Any]] = None,
@@ -12,7 +14,6 @@ class PolicyDialog(QDialog):
         super().__init__(parent)
         self.policy_data = policy_data
         self.preselected_contact_id = preselected_contact_id
-        self.db = DatabaseManager()
         self.init_ui()
         if policy_data:
             self.load_policy_data()
@@ -23,15 +24,13 @@ class PolicyDialog(QDialog):
         form = QFormLayout()
         
         # Contact selection
-        self.contact_combo = QComboBox()
-        self.load_contacts()
+        self.contact_picker = ContactPicker()
         if self.preselected_contact_id is not None:
-            # Find and set the preselected contact
-            index = self.contact_combo.findData(self.preselected_contact_id)
-            if index >= 0:
-                self.contact_combo.setCurrentIndex(index)
-                self.contact_combo.setEnabled(False)  # Lock the selection
-        form.addRow("Contact:", self.contact_combo)
+            # Lock the selection once the contact is found
+            self.contact_picker.set_contact_id(
+                self.preselected_contact_id,
+                lambda found: self.contact_picker.setEnabled(not found))
+        form.addRow("Contact:", self.contact_picker)
         
         # Policy type
         self.policy_type = QComboBox()
@@ -76,19 +75,8 @@ class PolicyDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
     
-    def load_contacts(self):
-        contacts = self.db.get_contacts()
-        for contact in contacts:
-            display_name = f"{contact['first_name']} {contact['last_name']}"
-            if contact['contact_type'] == 'Company':
-                display_name += f" ({contact['company_name']})"
-            self.contact_combo.addItem(display_name, contact['id'])
-    
     def load_policy_data(self):
-        # Find and set the correct contact
-        contact_index = self.contact_combo.findData(self.policy_data['contact_id'])
-        if contact_index >= 0:
-            self.contact_combo.setCurrentIndex(contact_index)
+        self.contact_picker.set_contact_id(self.policy_data['contact_id'])
         
         self.policy_type.setCurrentText(self.policy_data['policy_type'])
         self.policy_number.setText(self.policy_data['policy_number'])
@@ -104,21 +92,20 @@ class PolicyDialog(QDialog):
         self.notes.setText(self.policy_data.get('notes', ''))
     
     def validate_and_accept(self):
-        if not self.policy_number.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Policy number is required")
-            return
-        if not self.carrier.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Carrier is required")
-            return
-        if self.start_date.date() > self.renewal_date.date():
-            QMessageBox.warning(self, "Validation Error", "Start date must be before renewal date")
+        try:
+            validate_policy(self.get_data())
+        except ValidationError as e:
+            QMessageBox.warning(self, "Validation Error", e.message)
             return
         
+        # Still None if OK was pressed before the contact finished loading
+        if self.contact_picker.contact() is not None:
+            remember_contact(self.contact_picker.contact())
         self.accept()
     
     def get_data(self) -> Dict[str, Any]:
         return {
-            'contact_id': self.contact_combo.currentData(),
+            'contact_id': self.contact_picker.contact_id(),
             'policy_type': self.policy_type.currentText(),
             'policy_number': self.policy_number.text().strip(),
             'carrier': self.carrier.text().strip(),
@@ -1,7 +1,34 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
-                           QTabWidget, QPushButton, QStatusBar)
+                           QTabWidget, QPushButton, QStatusBar, QProgressBar,
+                           QMessageBox, QLabel)
+from PyQt6.QtCore import QTimer
+from typing import Callable, Optional
 from .contacts_view import ContactsView
 from .policies_view import PoliciesView
+from .renewals_view import RenewalsView
+from .dashboard_view import DashboardView
+from .query_executor import get_executor
+from .backup_scheduler import BackupScheduler
+from .dialogs.diagnostics_dialog import DiagnosticsDialog
+from .dialogs.export_dialog import ExportDialog
+from database.exporter import export_table
+from utils.startup_timing import startup_timer
+
+class LazyTab(QWidget):
+    """Tab page that builds its real content the first time it is needed"""
+
+    def __init__(self, factory: Callable[[], QWidget]):
+        super().__init__()
+        self.factory = factory
+        self.content: Optional[QWidget] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def ensure_loaded(self) -> QWidget:
+        if self.content is None:
+            self.content = self.factory()
+            self.layout().addWidget(self.content)
+        return self.content
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -14,12 +41,121 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(main_widget)
         layout = QVBoxLayout(main_widget)
         
-        # Create tab widget
-        tabs = QTabWidget()
-        tabs.addTab(ContactsView(), "Contacts")
-        tabs.addTab(PoliciesView(), "Policies")
-        layout.addWidget(tabs)
+        # Create tab widget; views (and their queries) are only built once
+        # their tab is shown, and never before the window has painted
+        self._first_shown = False
+        self.tabs = QTabWidget()
+        self.tabs.addTab(LazyTab(ContactsView), "Contacts")
+        self.tabs.addTab(LazyTab(PoliciesView), "Policies")
+        self.tabs.addTab(LazyTab(RenewalsView), "Renewals")
+        self.tabs.addTab(LazyTab(DashboardView), "Dashboard")
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        layout.addWidget(self.tabs)
+
+        # Tools menu
+        self.diagnostics_dialog: Optional[DiagnosticsDialog] = None
+        tools_menu = self.menuBar().addMenu("&Tools")
+        diagnostics_action = tools_menu.addAction("Query &Diagnostics...")
+        diagnostics_action.triggered.connect(self.show_diagnostics)
+        self.export_action = tools_menu.addAction("&Export Data...")
+        self.export_action.triggered.connect(self.export_data)
+        backup_action = tools_menu.addAction("&Back Up Now")
+        backup_action.triggered.connect(self.backup_now)
         
         # Add status bar
         self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar) 
\ No newline at end of file
+        self.setStatusBar(self.status_bar)
+
+        # Busy indicator while background queries are running
+        self.busy_indicator = QProgressBar()
+        self.busy_indicator.setRange(0, 0)
+        self.busy_indicator.setMaximumWidth(120)
+        self.busy_indicator.setTextVisible(False)
+        self.busy_indicator.hide()
+        self.status_bar.addPermanentWidget(self.busy_indicator)
+        self.backup_label = QLabel()
+        self.backup_label.hide()
+        self.status_bar.addPermanentWidget(self.backup_label)
+        executor = get_executor()
+        executor.busyChanged.connect(self.on_busy_changed)
+        # Pick up any query started before the signal was connected
+        self.on_busy_changed(executor.is_busy())
+
+        # Scheduled backups, run in the background
+        self.backup_scheduler = BackupScheduler(parent=self)
+        self.backup_scheduler.progress.connect(self.on_backup_progress)
+        self.backup_scheduler.finished.connect(self.on_backup_finished)
+        self.backup_scheduler.failed.connect(self.on_backup_failed)
+        self.backup_scheduler.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._first_shown:
+            self._first_shown = True
+            # Runs once the event loop has handled the initial expose/paint
+            QTimer.singleShot(0, self.on_first_paint)
+
+    def on_first_paint(self):
+        startup_timer.mark('first_paint')
+        self.on_tab_changed(self.tabs.currentIndex())
+
+    def on_tab_changed(self, index: int):
+        if not self._first_shown or index < 0:
+            return
+        self.tabs.widget(index).ensure_loaded()
+
+    def show_diagnostics(self):
+        # Non-modal and kept around, so it can stay open while working
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = DiagnosticsDialog(self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+
+    def export_data(self):
+        dialog = ExportDialog(self)
+        if not dialog.exec():
+            return
+        options = dialog.get_options()
+        # Streams on a reader connection, so the window stays responsive.
+        # A second export on the channel would cancel this one, so the
+        # action stays disabled until it finishes.
+        self.export_action.setEnabled(False)
+        get_executor().submit(
+            'export', lambda db: export_table(db, **options),
+            lambda result: self.on_export_finished(options['path'], result),
+            self.on_export_failed
+        )
+
+    def on_export_finished(self, path, result):
+        self.export_action.setEnabled(True)
+        self.status_bar.showMessage(
+            f"Exported {result['rows']:,} rows to {path.name} "
+            f"({result['rows_per_sec']:,.0f} rows/s)", 10000
+        )
+
+    def on_export_failed(self, error):
+        self.export_action.setEnabled(True)
+        QMessageBox.critical(self, "Export Failed", str(error))
+
+    def backup_now(self):
+        if not self.backup_scheduler.backup_now():
+            self.status_bar.showMessage("A backup is already running", 5000)
+
+    def on_backup_progress(self, done: int, total: int):
+        self.backup_label.setText(f"Backing up... {done * 100 // max(total, 1)}%")
+        self.backup_label.show()
+
+    def on_backup_finished(self, path):
+        self.backup_label.hide()
+        self.status_bar.showMessage(f"Backed up to {path}", 10000)
+
+    def on_backup_failed(self, error):
+        self.backup_label.hide()
+        QMessageBox.warning(self, "Backup Failed", str(error))
+
+    def on_busy_changed(self, busy: bool):
+        self.busy_indicator.setVisible(busy)
+        if busy:
+            self.status_bar.showMessage("Loading...")
+        else:
+            self.status_bar.clearMessage()
@@ -0,0 +1,220 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from database.db_manager import DatabaseManager
+from database.pagination import Page
+from utils.exceptions import CRMError
+from .query_executor import QueryExecutor, get_executor
+
+class PagedTableModel(QAbstractTableModel):
+    """Read-only table model that pulls rows from the database page by page.
+
+    Pages are fetched by keyset as the view scrolls (canFetchMore/fetchMore).
+    Only the most recently used `max_cached_pages` pages keep their rows in
+    memory; the page token that starts every page is remembered so an
+    evicted page can be fetched again when it scrolls back into view.
+
+    All fetching goes through the QueryExecutor, so the GUI thread never
+    waits on SQLite. Rows of a page that is still loading read as empty
+    until it arrives.
+
+    Subclasses implement query_params(), fetch_page() and display_value().
+    query_params() is read on the GUI thread when a reload starts and the
+    snapshot is what every fetch_page() of that reload gets; fetch_page
+    runs in a worker thread and must not read the model's own state.
+
+    With defer_first_fetch the model does not fetch its first page itself
+    and waits for reload() or load_first_page().
+    """
+
+    loadFailed = pyqtSignal(str)
+    # Emitted once the first page of a reload() is in
+    reloaded = pyqtSignal()
+
+    def __init__(self, headers: List[str], channel: str, page_size: int = 200,
+                 max_cached_pages: int = 10, executor: Optional[QueryExecutor] = None,
+                 defer_first_fetch: bool = False, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.channel = channel
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self.executor = executor or get_executor()
+        self.last_error: Optional[CRMError] = None
+        self._generation = 0
+        self._clear()
+        # Looks like a fetch in flight, so views do not start one
+        self._loading = defer_first_fetch
+
+    def _clear(self):
+        self._row_count = 0
+        self._page_starts: List[Optional[str]] = [None]
+        self._pages: "OrderedDict[int, List[Dict]]" = OrderedDict()
+        self._refetching: Set[int] = set()
+        self._exhausted = False
+        self._loading = False
+        self._params: Optional[Dict[str, Any]] = None
+
+    # Subclass hooks
+    def query_params(self) -> Dict[str, Any]:
+        """The filters and sort order fetch_page needs"""
+        return {}
+
+    def fetch_page(self, db: DatabaseManager, params: Dict[str, Any],
+                   page_token: Optional[str], limit: int) -> Page:
+        raise NotImplementedError
+
+    def display_value(self, row: Dict, column: int) -> Any:
+        raise NotImplementedError
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.row_data(index.row())
+        if row is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_value(row, index.column())
+        if role == Qt.ItemDataRole.UserRole:
+            return row['id']
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self._loading:
+            return
+        self._loading = True
+        page_index = len(self._page_starts) - 1
+        page_token = self._page_starts[page_index]
+        params = self._query_snapshot()
+        limit = self.page_size
+        generation = self._generation
+        self.executor.submit(
+            self.channel,
+            lambda db: self.fetch_page(db, params, page_token, limit),
+            lambda page: self._append_page(generation, page_index, page),
+            lambda error: self._load_failed(generation, error)
+        )
+
+    def _query_snapshot(self) -> Dict[str, Any]:
+        # Taken on the GUI thread; later pages and refetches of the same
+        # reload reuse it so they continue the same ordering
+        if self._params is None:
+            self._params = dict(self.query_params())
+        return self._params
+
+    def _append_page(self, generation: int, page_index: int, page: Page):
+        if generation != self._generation:
+            return
+        self._loading = False
+        rows, next_token = page
+        if next_token is None:
+            self._exhausted = True
+        else:
+            self._page_starts.append(next_token)
+        if rows:
+            self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + len(rows) - 1)
+            self._cache_page(page_index, rows)
+            self._row_count += len(rows)
+            self.endInsertRows()
+        if page_index == 0:
+            self.reloaded.emit()
+
+    def _load_failed(self, generation: int, error: CRMError):
+        if generation != self._generation:
+            return
+        # Stop paging rather than retrying on every scroll event
+        self._loading = False
+        self._exhausted = True
+        self.last_error = error
+        self.loadFailed.emit(str(error))
+
+    # Row access
+    def row_data(self, row: int) -> Optional[Dict]:
+        """Return the database row behind a table row, or None while it loads"""
+        if row < 0 or row >= self._row_count:
+            return None
+        page_index, offset = divmod(row, self.page_size)
+        rows = self._pages.get(page_index)
+        if rows is None:
+            self._refetch_page(page_index)
+            return None
+        self._pages.move_to_end(page_index)
+        return rows[offset] if offset < len(rows) else None
+
+    def row_id(self, row: int) -> Optional[int]:
+        data = self.row_data(row)
+        return data['id'] if data else None
+
+    def _refetch_page(self, page_index: int):
+        """Bring an evicted page back in the background"""
+        if page_index in self._refetching:
+            return
+        self._refetching.add(page_index)
+        page_token = self._page_starts[page_index]
+        params = self._query_snapshot()
+        limit = self.page_size
+        generation = self._generation
+        self.executor.submit(
+            f"{self.channel}:page{page_index}",
+            lambda db: self.fetch_page(db, params, page_token, limit),
+            lambda page: self._page_refetched(generation, page_index, page),
+            lambda error: self._refetch_failed(generation, page_index, error)
+        )
+
+    def _page_refetched(self, generation: int, page_index: int, page: Page):
+        if generation != self._generation:
+            return
+        self._refetching.discard(page_index)
+        self._cache_page(page_index, page.rows)
+        first = page_index * self.page_size
+        last = min(first + self.page_size, self._row_count) - 1
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.headers) - 1))
+
+    def _refetch_failed(self, generation: int, page_index: int, error: CRMError):
+        if generation != self._generation:
+            return
+        # The page is fetched again when next shown; paging forward goes on
+        self._refetching.discard(page_index)
+        self.last_error = error
+        self.loadFailed.emit(str(error))
+
+    def _cache_page(self, page_index: int, rows: List[Dict]):
+        self._pages[page_index] = rows
+        self._pages.move_to_end(page_index)
+        while len(self._pages) > self.max_cached_pages:
+            self._pages.popitem(last=False)
+
+    def reload(self):
+        """Drop every cached row and start again from the first page"""
+        self._reset()
+        self.fetchMore()
+
+    def load_first_page(self, page: Page):
+        """Like reload(), but with a first page the caller already fetched
+        (with this model's page size and query_params); later pages are
+        fetched as usual"""
+        self._reset()
+        self._query_snapshot()
+        self._append_page(self._generation, 0, page)
+
+    def _reset(self):
+        self._generation += 1
+        self.beginResetModel()
+        self._clear()
+        self.last_error = None
+        self.endResetModel()
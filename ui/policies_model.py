@@ -0,0 +1,65 @@
+from typing import Any, Dict, Optional
+from PyQt6.QtCore import Qt
+from .paged_table_model import PagedTableModel
+from database.db_manager import DatabaseManager
+from database.pagination import Page
+from utils.datetime_helpers import format_date
+
+class PoliciesTableModel(PagedTableModel):
+    HEADERS = ["Contact", "Policy Number", "Type", "Carrier",
+               "Premium", "Start Date", "Renewal Date"]
+    # Column -> DatabaseManager.get_policies_page sort key
+    SORT_KEYS = ['contact', 'policy_number', 'policy_type', 'carrier',
+                 'premium', 'start_date', 'renewal_date']
+
+    def __init__(self, parent=None):
+        super().__init__(self.HEADERS, 'policies', parent=parent)
+        # Keyword arguments for get_policies_page
+        self.filters: Dict[str, Any] = {}
+        self.sort_by = 'renewal_date'
+        self.descending = False
+
+    def query_params(self) -> Dict[str, Any]:
+        return dict(self.filters, sort_by=self.sort_by, descending=self.descending)
+
+    def fetch_page(self, db: DatabaseManager, params: Dict[str, Any],
+                   page_token: Optional[str], limit: int) -> Page:
+        return db.get_policies_page(limit, page_token=page_token, **params)
+
+    def display_value(self, policy: Dict, column: int) -> Any:
+        if column == 0:
+            return policy['contact_name']
+        if column == 1:
+            return policy['policy_number']
+        if column == 2:
+            return policy['policy_type']
+        if column == 3:
+            return policy['carrier']
+        if column == 4:
+            return f"${policy['premium']:,.2f}"
+        if column == 5:
+            return format_date(policy['start_date'])
+        if column == 6:
+            return format_date(policy['renewal_date'])
+        return None
+
+    def set_filters(self, filters: Dict[str, Any]):
+        filters = {key: value for key, value in filters.items() if value is not None}
+        if filters == self.filters:
+            return
+        self.filters = filters
+        self.reload()
+
+    def sort_column(self) -> int:
+        return self.SORT_KEYS.index(self.sort_by)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        if column < 0 or column >= len(self.SORT_KEYS):
+            return
+        sort_by = self.SORT_KEYS[column]
+        descending = order == Qt.SortOrder.DescendingOrder
+        if (sort_by, descending) == (self.sort_by, self.descending):
+            return
+        self.sort_by = sort_by
+        self.descending = descending
+        self.reload()
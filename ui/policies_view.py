@@ -1,16 +1,28 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                           QPushButton, QTableWidget, QTableWidgetItem,
-                           QMessageBox)
-from PyQt6.QtCore import Qt
+                           QPushButton, QTableView, QMessageBox, QLineEdit,
+                           QComboBox, QDoubleSpinBox, QDateEdit, QCheckBox,
+                           QLabel)
+from PyQt6.QtCore import Qt, QTimer, QDate
 from .dialogs.policy_dialog import PolicyDialog
-from database.db_manager import DatabaseManager
+from database.connection_pool import get_session
 from utils.exceptions import DatabaseError
-from utils.datetime_helpers import format_date
+from .query_executor import get_executor
+from .policies_model import PoliciesTableModel
+from typing import Any, Dict, List, Optional
 
 class PoliciesView(QWidget):
+    POLICY_TYPES = ['Auto', 'Home', 'Life', 'Health', 'Business', 'Umbrella',
+                    'Liability', 'Workers Comp', 'Property', 'Other']
+    STATUSES = ['Active', 'Cancelled', 'Expired']
+
     def __init__(self):
         super().__init__()
-        self.db = DatabaseManager()
+        self.db = get_session()
+        self.executor = get_executor()
+        # Debounce typing in the free-text filter like the contacts search
+        self.filter_timer = QTimer()
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.timeout.connect(self.apply_filters)
         self.init_ui()
         
     def init_ui(self):
@@ -31,43 +43,145 @@ class PoliciesView(QWidget):
         button_layout.addStretch()
         
         layout.addLayout(button_layout)
+
+        # Filters, all applied in SQL
+        filter_layout = QHBoxLayout()
+        self.contact_filter = QLineEdit()
+        self.contact_filter.setPlaceholderText("Contact...")
+        self.contact_filter.textChanged.connect(lambda: self.filter_timer.start(300))
+        filter_layout.addWidget(self.contact_filter)
+
+        self.carrier_filter = QComboBox()
+        self.carrier_filter.addItem("All carriers", None)
+        filter_layout.addWidget(self.carrier_filter)
+
+        self.type_filter = QComboBox()
+        self.type_filter.addItem("All types", None)
+        for policy_type in self.POLICY_TYPES:
+            self.type_filter.addItem(policy_type, policy_type)
+        filter_layout.addWidget(self.type_filter)
+
+        self.status_filter = QComboBox()
+        self.status_filter.addItem("Any status", None)
+        for status in self.STATUSES:
+            self.status_filter.addItem(status, status)
+        filter_layout.addWidget(self.status_filter)
+
+        # 0 shows as "Any" and means no bound
+        self.min_premium = QDoubleSpinBox()
+        self.max_premium = QDoubleSpinBox()
+        for spin, label in ((self.min_premium, "Min premium: Any"), (self.max_premium, "Max premium: Any")):
+            spin.setMaximum(1000000.00)
+            spin.setPrefix("$")
+            spin.setSpecialValueText(label)
+            spin.valueChanged.connect(lambda: self.filter_timer.start(300))
+            filter_layout.addWidget(spin)
+
+        self.renewal_check = QCheckBox("Renewal between")
+        self.renewal_from = QDateEdit()
+        self.renewal_to = QDateEdit()
+        self.renewal_from.setDate(QDate.currentDate())
+        self.renewal_to.setDate(QDate.currentDate().addDays(90))
+        filter_layout.addWidget(self.renewal_check)
+        for date_edit in (self.renewal_from, self.renewal_to):
+            date_edit.setCalendarPopup(True)
+            date_edit.setEnabled(False)
+            date_edit.dateChanged.connect(self.apply_filters)
+            filter_layout.addWidget(date_edit)
+        self.renewal_check.toggled.connect(self.renewal_from.setEnabled)
+        self.renewal_check.toggled.connect(self.renewal_to.setEnabled)
+        self.renewal_check.toggled.connect(self.apply_filters)
+
+        for combo in (self.carrier_filter, self.type_filter, self.status_filter):
+            combo.currentIndexChanged.connect(self.apply_filters)
+
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear_filters)
+        filter_layout.addWidget(clear_button)
+        layout.addLayout(filter_layout)
         
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Contact", "Policy Number", "Type", "Carrier", 
-            "Premium", "Start Date", "Renewal Date"
-        ])
+        # Table, backed by a model that pages policies in as the user
+        # scrolls; clicking a header re-sorts in SQL
+        self.model = PoliciesTableModel(self)
+        self.model.loadFailed.connect(self.on_load_failed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.itemDoubleClicked.connect(self.edit_policy)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSortIndicator(
+            self.model.sort_column(), Qt.SortOrder.AscendingOrder
+        )
+        self.table.setSortingEnabled(True)
+        self.table.doubleClicked.connect(self.edit_policy)
         
         layout.addWidget(self.table)
         
+        self.load_carriers()
         self.load_policies()
     
     def load_policies(self):
-        try:
-            policies = self.db.get_policies()
-            self.table.setRowCount(len(policies))
-            
-            for row, policy in enumerate(policies):
-                self.table.setItem(row, 0, QTableWidgetItem(policy['contact_name']))
-                self.table.setItem(row, 1, QTableWidgetItem(policy['policy_number']))
-                self.table.setItem(row, 2, QTableWidgetItem(policy['policy_type']))
-                self.table.setItem(row, 3, QTableWidgetItem(policy['carrier']))
-                self.table.setItem(row, 4, QTableWidgetItem(f"${policy['premium']:,.2f}"))
-                self.table.setItem(row, 5, QTableWidgetItem(format_date(policy['start_date'])))
-                self.table.setItem(row, 6, QTableWidgetItem(format_date(policy['renewal_date'])))
-                
-                # Store the policy ID in the first column
-                self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, policy['id'])
-                
-        except DatabaseError as e:
-            QMessageBox.critical(self, "Database Error", str(e))
+        self.model.reload()
+
+    def load_carriers(self):
+        self.executor.submit(
+            'policies:carriers', lambda db: db.get_policy_carriers(),
+            self.populate_carriers, self.on_load_failed
+        )
+
+    def populate_carriers(self, carriers: List[str]):
+        current = self.carrier_filter.currentData()
+        self.carrier_filter.blockSignals(True)
+        self.carrier_filter.clear()
+        self.carrier_filter.addItem("All carriers", None)
+        for carrier in carriers:
+            self.carrier_filter.addItem(carrier, carrier)
+        self.carrier_filter.setCurrentIndex(max(self.carrier_filter.findData(current), 0))
+        self.carrier_filter.blockSignals(False)
+
+    def current_filters(self) -> Dict[str, Any]:
+        """Keyword arguments for DatabaseManager.get_policies_page"""
+        filters = {
+            'contact_search': self.contact_filter.text().strip() or None,
+            'carrier': self.carrier_filter.currentData(),
+            'policy_type': self.type_filter.currentData(),
+            'status': self.status_filter.currentData(),
+            'min_premium': self.min_premium.value() or None,
+            'max_premium': self.max_premium.value() or None,
+        }
+        if self.renewal_check.isChecked():
+            filters['renewal_from'] = self.renewal_from.date().toString("yyyy-MM-dd")
+            filters['renewal_to'] = self.renewal_to.date().toString("yyyy-MM-dd")
+        return filters
+
+    def apply_filters(self):
+        self.filter_timer.stop()
+        self.model.set_filters(self.current_filters())
+
+    def clear_filters(self):
+        widgets = (self.contact_filter, self.carrier_filter, self.type_filter,
+                   self.status_filter, self.min_premium, self.max_premium, self.renewal_check)
+        for widget in widgets:
+            widget.blockSignals(True)
+        self.contact_filter.clear()
+        for combo in (self.carrier_filter, self.type_filter, self.status_filter):
+            combo.setCurrentIndex(0)
+        self.min_premium.setValue(0)
+        self.max_premium.setValue(0)
+        self.renewal_check.setChecked(False)
+        self.renewal_from.setEnabled(False)
+        self.renewal_to.setEnabled(False)
+        for widget in widgets:
+            widget.blockSignals(False)
+        self.apply_filters()
+    
+    def on_load_failed(self, message):
+        QMessageBox.critical(self, "Database Error", str(message))
+
+    def selected_policy_id(self) -> Optional[int]:
+        index = self.table.currentIndex()
+        return self.model.row_id(index.row()) if index.isValid() else None
     
     def add_policy(self):
         dialog = PolicyDialog(self)
@@ -76,16 +190,17 @@ class PoliciesView(QWidget):
                 policy_data = dialog.get_data()
                 self.db.add_policy(policy_data)
                 self.load_policies()
+                # The carrier may be new; populate_carriers keeps the selection
+                self.load_carriers()
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not add policy: {str(e)}")
     
     def edit_policy(self):
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        policy_id = self.selected_policy_id()
+        if policy_id is None:
             QMessageBox.warning(self, "Warning", "Please select a policy to edit")
             return
         
-        policy_id = self.table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
         policy = self.db.get_policies(policy_id)[0]
         
         dialog = PolicyDialog(self, policy)
@@ -94,17 +209,17 @@ class PoliciesView(QWidget):
                 policy_data = dialog.get_data()
                 self.db.update_policy(policy_id, policy_data)
                 self.load_policies()
+                # The carrier may be new; populate_carriers keeps the selection
+                self.load_carriers()
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not update policy: {str(e)}")
     
     def delete_policy(self):
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        policy_id = self.selected_policy_id()
+        if policy_id is None:
             QMessageBox.warning(self, "Warning", "Please select a policy to delete")
             return
         
-        policy_id = self.table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
-        
         reply = QMessageBox.question(
             self, "Confirm Deletion",
             "Are you sure you want to delete this policy?",
@@ -113,7 +228,7 @@ class PoliciesView(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                self.db.update_policy(policy_id, {'status': 'Deleted'})
+                self.db.delete_policy(policy_id)
                 self.load_policies()
             except DatabaseError as e:
                 QMessageBox.critical(self, "Error", f"Could not delete policy: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,177 @@
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from database.connection_pool import ConnectionPool, get_pool
+from database.db_manager import DatabaseManager
+from utils.exceptions import CRMError, DatabaseError
+
+class _TaskSignals(QObject):
+    # channel, generation, result or exception
+    finished = pyqtSignal(str, int, object)
+    failed = pyqtSignal(str, int, object)
+
+class _QueryTask(QRunnable):
+    """Runs one read on a pooled reader connection in a worker thread"""
+
+    def __init__(self, pool: ConnectionPool, channel: str, generation: int,
+                 fn: Callable[[DatabaseManager], Any], signals: _TaskSignals):
+        super().__init__()
+        self.pool = pool
+        self.channel = channel
+        self.generation = generation
+        self.fn = fn
+        self.signals = signals
+        self.cancelled = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            # Abort the statement in flight; the lock guarantees the
+            # connection has not been handed back to the pool yet
+            if self._conn is not None:
+                self._conn.interrupt()
+
+    def run(self):
+        # Always report back, even when cancelled, so the executor can
+        # release its bookkeeping for this task
+        result = None
+        try:
+            if not self.cancelled:
+                result = self._run_query()
+        except sqlite3.Error as e:
+            if not self.cancelled:
+                self.signals.failed.emit(self.channel, self.generation, DatabaseError(str(e)))
+                return
+        except CRMError as e:
+            self.signals.failed.emit(self.channel, self.generation, e)
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.channel, self.generation, CRMError(str(e)))
+            return
+        self.signals.finished.emit(self.channel, self.generation, result)
+
+    def _run_query(self) -> Any:
+        conn = self.pool.acquire_reader()
+        with self._lock:
+            self._conn = conn
+        try:
+            db = DatabaseManager(conn)
+            try:
+                return self.fn(db)
+            finally:
+                db.close()
+        finally:
+            with self._lock:
+                self._conn = None
+            self.pool.release_reader(conn)
+
+class QueryExecutor(QObject):
+    """Runs DatabaseManager reads off the GUI thread.
+
+    Every request is submitted on a named channel. Submitting again on the
+    same channel cancels the previous request (interrupting its SQL if it
+    is already running) and its result is never delivered, so a burst of
+    searches only ever shows the latest one. Callbacks run on the GUI thread.
+    """
+
+    busyChanged = pyqtSignal(bool)
+
+    def __init__(self, pool: Optional[ConnectionPool] = None, parent=None):
+        super().__init__(parent)
+        self.pool = pool or get_pool()
+        self.thread_pool = QThreadPool(self)
+        # Never start more workers than there are reader connections
+        self.thread_pool.setMaxThreadCount(self.pool.max_readers)
+        self._signals = _TaskSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._busy = False
+        self._generations: Dict[str, int] = {}
+        # Latest task per channel, and every task not yet reported back
+        # (kept referenced so Python does not free a running QRunnable)
+        self._current: Dict[str, _QueryTask] = {}
+        self._outstanding: Dict[Tuple[str, int], _QueryTask] = {}
+        self._callbacks: Dict[Tuple[str, int], Tuple[Callable, Optional[Callable]]] = {}
+
+    def submit(self, channel: str, fn: Callable[[DatabaseManager], Any],
+               on_result: Callable[[Any], None],
+               on_error: Optional[Callable[[CRMError], None]] = None) -> int:
+        """Run fn(db) in the background and pass its return value to on_result"""
+        self.cancel(channel)
+        generation = self._generations.get(channel, 0) + 1
+        self._generations[channel] = generation
+        task = _QueryTask(self.pool, channel, generation, fn, self._signals)
+        task.setAutoDelete(False)
+        self._current[channel] = task
+        self._outstanding[(channel, generation)] = task
+        self._callbacks[(channel, generation)] = (on_result, on_error)
+        self._update_busy()
+        self.thread_pool.start(task)
+        return generation
+
+    def cancel(self, channel: str):
+        """Cancel the outstanding request on a channel; its callbacks never run"""
+        task = self._current.pop(channel, None)
+        if task is None:
+            return
+        key = (channel, task.generation)
+        self._callbacks.pop(key, None)
+        task.cancel()
+        if self.thread_pool.tryTake(task):
+            # Never started, so it will never report back
+            self._outstanding.pop(key, None)
+        self._update_busy()
+
+    def is_busy(self) -> bool:
+        return bool(self._callbacks)
+
+    def _finish(self, channel: str, generation: int) -> Optional[Tuple[Callable, Optional[Callable]]]:
+        key = (channel, generation)
+        self._outstanding.pop(key, None)
+        task = self._current.get(channel)
+        if task is not None and task.generation == generation:
+            del self._current[channel]
+        callbacks = self._callbacks.pop(key, None)
+        self._update_busy()
+        return callbacks
+
+    def _on_finished(self, channel: str, generation: int, result: Any):
+        callbacks = self._finish(channel, generation)
+        if callbacks is not None:
+            callbacks[0](result)
+
+    def _on_failed(self, channel: str, generation: int, error: CRMError):
+        callbacks = self._finish(channel, generation)
+        if callbacks is not None and callbacks[1] is not None:
+            callbacks[1](error)
+
+    def _update_busy(self):
+        # Busy while any request still has someone waiting for its result
+        busy = self.is_busy()
+        if busy != self._busy:
+            self._busy = busy
+            self.busyChanged.emit(busy)
+
+    def shutdown(self):
+        for channel in list(self._current):
+            self.cancel(channel)
+        self.thread_pool.waitForDone()
+
+_executor: Optional[QueryExecutor] = None
+
+def get_executor() -> QueryExecutor:
+    """The process-wide executor shared by every view and dialog"""
+    global _executor
+    if _executor is None:
+        _executor = QueryExecutor()
+    return _executor
+
+def shutdown_executor():
+    """Cancel outstanding reads and wait for workers before the pool closes"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+from .paged_table_model import PagedTableModel
+from database.db_manager import DatabaseManager
+from database.pagination import Page
+from utils.datetime_helpers import format_date
+
+class RenewalsTableModel(PagedTableModel):
+    HEADERS = ["Renewal Date", "Contact", "Company", "Policy Number",
+               "Type", "Carrier", "Premium", "Status"]
+
+    def __init__(self, parent=None):
+        super().__init__(self.HEADERS, 'renewals', parent=parent)
+        self.days: Optional[int] = 30
+        self.carrier: Optional[str] = None
+        self.policy_type: Optional[str] = None
+        self.status: Optional[str] = 'Active'
+
+    def query_params(self) -> Dict[str, Any]:
+        return {'days': self.days, 'carrier': self.carrier,
+                'policy_type': self.policy_type, 'status': self.status}
+
+    def fetch_page(self, db: DatabaseManager, params: Dict[str, Any],
+                   page_token: Optional[str], limit: int) -> Page:
+        return db.get_renewals_page(limit=limit, page_token=page_token, **params)
+
+    def display_value(self, policy: Dict, column: int) -> Any:
+        if column == 0:
+            return format_date(policy['renewal_date'])
+        if column == 1:
+            return policy['contact_name']
+        if column == 2:
+            return policy['company_name'] or ''
+        if column == 3:
+            return policy['policy_number']
+        if column == 4:
+            return policy['policy_type']
+        if column == 5:
+            return policy['carrier']
+        if column == 6:
+            return f"${policy['premium']:,.2f}"
+        if column == 7:
+            return policy['status']
+        return None
+
+    def set_filters(self, days: Optional[int], carrier: Optional[str],
+                    policy_type: Optional[str], status: Optional[str]):
+        self.days = days
+        self.carrier = carrier
+        self.policy_type = policy_type
+        self.status = status
+        self.reload()
@@ -0,0 +1,132 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                           QPushButton, QTableView, QComboBox, QMessageBox)
+from .dialogs.policy_dialog import PolicyDialog
+from database.connection_pool import get_session
+from database.db_manager import RENEWAL_WINDOWS
+from utils.exceptions import DatabaseError
+from .query_executor import get_executor
+from .renewals_model import RenewalsTableModel
+from typing import Dict, List
+
+class RenewalsView(QWidget):
+    """Renewal pipeline: policies renewing in the next 30/60/90 days"""
+
+    WINDOWS = [(f"Next {days} days", days) for days in RENEWAL_WINDOWS] + [
+        ("Next 180 days", 180), ("Next 365 days", 365)
+    ]
+    POLICY_TYPES = ['Auto', 'Home', 'Life', 'Health', 'Business', 'Umbrella',
+                    'Liability', 'Workers Comp', 'Property', 'Other']
+    STATUSES = ['Active', 'Cancelled', 'Expired']
+
+    def __init__(self):
+        super().__init__()
+        self.db = get_session()
+        self.executor = get_executor()
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Filters
+        filter_layout = QHBoxLayout()
+        self.window_combo = QComboBox()
+        for label, days in self.WINDOWS:
+            self.window_combo.addItem(label, days)
+        self.carrier_combo = QComboBox()
+        self.carrier_combo.addItem("All carriers", None)
+        self.type_combo = QComboBox()
+        self.type_combo.addItem("All types", None)
+        for policy_type in self.POLICY_TYPES:
+            self.type_combo.addItem(policy_type, policy_type)
+        self.status_combo = QComboBox()
+        for status in self.STATUSES:
+            self.status_combo.addItem(status, status)
+        self.status_combo.addItem("Any status", None)
+
+        for combo in (self.window_combo, self.carrier_combo, self.type_combo, self.status_combo):
+            combo.currentIndexChanged.connect(self.apply_filters)
+            filter_layout.addWidget(combo)
+
+        edit_button = QPushButton("Edit Policy")
+        edit_button.clicked.connect(self.edit_policy)
+        filter_layout.addStretch()
+        filter_layout.addWidget(edit_button)
+        layout.addLayout(filter_layout)
+
+        # 30/60/90-day totals for the current filters
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        # Table, paged in as the user scrolls
+        self.model = RenewalsTableModel(self)
+        self.model.loadFailed.connect(self.on_load_failed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table.doubleClicked.connect(self.edit_policy)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(1, header.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, header.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        self.load_carriers()
+        self.apply_filters()
+
+    def load_carriers(self):
+        self.executor.submit(
+            'renewals:carriers', lambda db: db.get_policy_carriers(),
+            self.populate_carriers, self.on_load_failed
+        )
+
+    def populate_carriers(self, carriers: List[str]):
+        current = self.carrier_combo.currentData()
+        self.carrier_combo.blockSignals(True)
+        self.carrier_combo.clear()
+        self.carrier_combo.addItem("All carriers", None)
+        for carrier in carriers:
+            self.carrier_combo.addItem(carrier, carrier)
+        index = self.carrier_combo.findData(current)
+        self.carrier_combo.setCurrentIndex(max(index, 0))
+        self.carrier_combo.blockSignals(False)
+
+    def apply_filters(self):
+        days = self.window_combo.currentData()
+        carrier = self.carrier_combo.currentData()
+        policy_type = self.type_combo.currentData()
+        status = self.status_combo.currentData()
+        self.model.set_filters(days, carrier, policy_type, status)
+        self.summary_label.setText("Loading totals...")
+        self.executor.submit(
+            'renewals:summary',
+            lambda db: db.get_renewal_summary(carrier=carrier, policy_type=policy_type,
+                                              status=status),
+            self.populate_summary, self.on_load_failed
+        )
+
+    def populate_summary(self, summary: List[Dict]):
+        self.summary_label.setText("     ".join(
+            f"{window['days']} days: {window['count']:,} policies, ${window['premium']:,.2f}"
+            for window in summary
+        ))
+
+    def on_load_failed(self, error):
+        QMessageBox.critical(self, "Database Error", str(error))
+
+    def edit_policy(self):
+        index = self.table.currentIndex()
+        policy_id = self.model.row_id(index.row()) if index.isValid() else None
+        if policy_id is None:
+            QMessageBox.warning(self, "Warning", "Please select a policy to edit")
+            return
+
+        policy = self.db.get_policies(policy_id)[0]
+        dialog = PolicyDialog(self, policy)
+        if dialog.exec():
+            try:
+                policy_data = dialog.get_data()
+                self.db.update_policy(policy_id, policy_data)
+                self.apply_filters()
+            except DatabaseError as e:
+                QMessageBox.critical(self, "Error", f"Could not update policy: {str(e)}")
@@ -1,11 +1,26 @@
+import copy
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 DEFAULT_CONFIG = {
     "database": {
         "path": "insurance_crm.db",
-        "backup_dir": "backups"
+        "backup_dir": "backups",
+        "backup_interval_hours": 24,
+        "backup_keep": 7,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -20000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "query_stats": False,
+        "slow_query_ms": 100
     },
     "ui": {
         "theme": "default",
@@ -20,10 +35,52 @@ DEFAULT_CONFIG = {
     }
 }
 
+Snapshot = Mapping[str, Mapping[str, Any]]
+Listener = Callable[[Dict[str, Dict[str, Any]]], None]
+
+def _freeze(config: Dict[str, Any]) -> Snapshot:
+    return MappingProxyType({
+        section: MappingProxyType(dict(values)) if isinstance(values, dict) else values
+        for section, values in config.items()
+    })
+
+def _thaw(snapshot: Snapshot) -> Dict[str, Any]:
+    return {
+        section: dict(values) if isinstance(values, Mapping) else values
+        for section, values in snapshot.items()
+    }
+
+def _diff(old: Snapshot, new: Snapshot) -> Dict[str, Dict[str, Any]]:
+    """{section: {key: new value}} for every key that differs; removed keys map to None"""
+    changed: Dict[str, Dict[str, Any]] = {}
+    for section in set(old) | set(new):
+        before = old.get(section)
+        after = new.get(section)
+        before = before if isinstance(before, Mapping) else {}
+        after = after if isinstance(after, Mapping) else {}
+        for key in set(before) | set(after):
+            if before.get(key) != after.get(key):
+                changed.setdefault(section, {})[key] = after.get(key)
+    return changed
+
 class ConfigManager:
-    def __init__(self):
-        self.config_path = Path("config.json")
-        self.config = self._load_config()
+    """config.json, read once into an immutable snapshot.
+
+    Changes go through update(), which writes the file atomically and
+    then tells subscribers which keys changed. Use get_config() for the
+    process-wide instance rather than constructing one per caller.
+    """
+
+    def __init__(self, config_path: Path = Path("config.json")):
+        self.config_path = Path(config_path)
+        self._lock = threading.Lock()
+        self._listeners: List[Listener] = []
+        self._snapshot = _freeze(self._load_config())
+    
+    @property
+    def config(self) -> Snapshot:
+        """The current settings; replaced, never modified, by update()"""
+        return self._snapshot
     
     def _load_config(self) -> Dict[str, Any]:
         if self.config_path.exists():
@@ -32,20 +89,82 @@ class ConfigManager:
                     return json.load(f)
             except json.JSONDecodeError:
                 print("Warning: Invalid config file, using defaults")
-                return DEFAULT_CONFIG
+                return copy.deepcopy(DEFAULT_CONFIG)
         else:
             self._save_config(DEFAULT_CONFIG)
-            return DEFAULT_CONFIG
+            return copy.deepcopy(DEFAULT_CONFIG)
     
     def _save_config(self, config: Dict[str, Any]) -> None:
-        with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Write a temporary file next to config.json and rename it over the
+        # original, so a crash never leaves a half-written config
+        fd, temp_path = tempfile.mkstemp(prefix=self.config_path.name + ".",
+                                         suffix=".tmp", dir=self.config_path.parent)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(config, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
     
     def get(self, section: str, key: str) -> Any:
-        return self.config.get(section, {}).get(key)
+        value = self._snapshot.get(section, {}).get(key)
+        if value is None:
+            # Config files written by older versions lack newer keys
+            value = DEFAULT_CONFIG.get(section, {}).get(key)
+        return value
     
     def set(self, section: str, key: str, value: Any) -> None:
-        if section not in self.config:
-            self.config[section] = {}
-        self.config[section][key] = value
-        self._save_config(self.config) 
\ No newline at end of file
+        self.update({section: {key: value}})
+    
+    def update(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """Apply {section: {key: value}} changes with a single write"""
+        with self._lock:
+            config = _thaw(self._snapshot)
+            for section, values in changes.items():
+                config.setdefault(section, {}).update(values)
+            snapshot = _freeze(config)
+            changed = _diff(self._snapshot, snapshot)
+            if changed:
+                self._save_config(config)
+                self._snapshot = snapshot
+        self._notify(changed)
+    
+    def reload(self) -> None:
+        """Re-read config.json, e.g. after editing it by hand"""
+        with self._lock:
+            snapshot = _freeze(self._load_config())
+            changed = _diff(self._snapshot, snapshot)
+            self._snapshot = snapshot
+        self._notify(changed)
+    
+    def _notify(self, changed: Dict[str, Dict[str, Any]]) -> None:
+        if not changed:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(changed)
+    
+    def subscribe(self, listener: Listener) -> None:
+        """Call listener({section: {key: new value}}) after each change"""
+        with self._lock:
+            self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Listener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+_config: Optional[ConfigManager] = None
+_config_lock = threading.Lock()
+
+def get_config() -> ConfigManager:
+    """The process-wide ConfigManager, loaded on first use"""
+    global _config
+    with _config_lock:
+        if _config is None:
+            _config = ConfigManager()
+        return _config
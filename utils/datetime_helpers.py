@@ -1,38 +1,130 @@
-from datetime import datetime
+"""Display formatting of stored dates and timestamps.
+
+The timezone and format strings are read from config once. format_datetime
+and format_date sit on bounded LRU caches, so repainting a table costs a
+dictionary lookup per cell; format_datetimes and format_dates convert a
+whole column in one pass. Timestamps are converted with the zone's UTC
+offset for their day, looked up once per day rather than per value.
+Changes to the "ui" config section reset the settings and caches.
+"""
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 import pytz
-from utils.config import ConfigManager
+from utils.config import ConfigManager, get_config
 
-config = ConfigManager()
-local_tz = pytz.timezone(config.get('ui', 'timezone'))
+# Distinct values kept per cache; a screenful of rows is a few hundred
+CACHE_SIZE = 8192
+_LAST_IN_DAY = timedelta(days=1, microseconds=-1)
 
-def format_datetime(dt_str: str) -> str:
-    """Convert ISO datetime string to local formatted datetime string"""
-    if not dt_str:
-        return ""
-    
+class _FormatSettings:
+    def __init__(self, config: ConfigManager):
+        self.local_tz = pytz.timezone(config.get('ui', 'timezone'))
+        self.datetime_format = config.get('ui', 'datetime_format')
+        self.date_format = config.get('ui', 'date_format')
+        # Naive local datetimes print the same as aware ones unless the
+        # format shows the zone
+        self.naive_local = '%z' not in self.datetime_format and '%Z' not in self.datetime_format
+
+_settings: Optional[_FormatSettings] = None
+_subscribed = False
+
+def _current_settings() -> _FormatSettings:
+    global _settings, _subscribed
+    if _settings is None:
+        config = get_config()
+        if not _subscribed:
+            config.subscribe(_on_config_changed)
+            _subscribed = True
+        _settings = _FormatSettings(config)
+    return _settings
+
+def _on_config_changed(changed: Dict[str, Dict[str, Any]]) -> None:
+    if 'ui' in changed:
+        reload_settings()
+
+def local_timezone() -> pytz.BaseTzInfo:
+    """The configured display timezone"""
+    return _current_settings().local_tz
+
+def reload_settings() -> None:
+    """Drop the timezone, formats and every cached result"""
+    global _settings
+    _settings = None
+    _utc_offset.cache_clear()
+    _format_datetime.cache_clear()
+    _format_date.cache_clear()
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _utc_offset(day: date) -> Optional[timedelta]:
+    """Local UTC offset throughout the UTC day, or None if it changes that day"""
+    local_tz = _current_settings().local_tz
+    midnight = pytz.UTC.localize(datetime.combine(day, time()))
+    start = midnight.astimezone(local_tz).utcoffset()
+    end = (midnight + _LAST_IN_DAY).astimezone(local_tz).utcoffset()
+    return start if start == end else None
+
+def _convert_datetime(dt_str: str, settings: _FormatSettings) -> str:
     # Parse ISO format datetime
     try:
         dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
     except ValueError:
         return dt_str
-    
+
     # If the datetime is naive, assume it's in UTC
     if dt.tzinfo is None:
+        if settings.naive_local:
+            offset = _utc_offset(dt.date())
+            if offset is not None:
+                return (dt + offset).strftime(settings.datetime_format)
         dt = pytz.UTC.localize(dt)
-    
-    # Convert to local timezone
-    local_dt = dt.astimezone(local_tz)
-    
-    # Format according to config
-    return local_dt.strftime(config.get('ui', 'datetime_format'))
+
+    return dt.astimezone(settings.local_tz).strftime(settings.datetime_format)
+
+def _convert_date(date_str: str, settings: _FormatSettings) -> str:
+    try:
+        dt = datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        return date_str
+    return dt.strftime(settings.date_format)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_datetime(dt_str: str) -> str:
+    return _convert_datetime(dt_str, _current_settings())
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_date(date_str: str) -> str:
+    return _convert_date(date_str, _current_settings())
+
+def format_datetime(dt_str: str) -> str:
+    """Convert ISO datetime string to local formatted datetime string"""
+    if not dt_str:
+        return ""
+    return _format_datetime(dt_str)
 
 def format_date(date_str: str) -> str:
     """Convert ISO date string to local formatted date string"""
     if not date_str:
         return ""
-    
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d')
-        return dt.strftime(config.get('ui', 'date_format'))
-    except ValueError:
-        return date_str 
\ No newline at end of file
+    return _format_date(date_str)
+
+def _format_column(values: Iterable[Optional[str]], convert) -> List[str]:
+    # Columns are often larger than the LRU and mostly distinct, so they
+    # skip it and only share work between repeats within the column
+    settings = _current_settings()
+    seen = {None: "", "": ""}
+    result = []
+    for value in values:
+        formatted = seen.get(value)
+        if formatted is None:
+            formatted = seen[value] = convert(value, settings)
+        result.append(formatted)
+    return result
+
+def format_datetimes(values: Iterable[Optional[str]]) -> List[str]:
+    """format_datetime over a whole column"""
+    return _format_column(values, _convert_datetime)
+
+def format_dates(values: Iterable[Optional[str]]) -> List[str]:
+    """format_date over a whole column"""
+    return _format_column(values, _convert_date)
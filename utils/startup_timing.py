@@ -0,0 +1,41 @@
+import json
+import logging
+import time
+from typing import Dict
+
+logger = logging.getLogger("crm.startup")
+
+class StartupTimer:
+    """Milestones of application start-up, relative to when this module loaded.
+
+    main.py imports this module before anything else, so the clock starts
+    as close to interpreter start as we can get without platform APIs.
+    """
+
+    MILESTONES = ('imports', 'first_paint', 'first_data')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+        self._reported = False
+
+    def mark(self, name: str) -> None:
+        """Record a milestone; only the first occurrence counts"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter()
+
+    def report(self) -> Dict[str, float]:
+        """Milliseconds from start to each milestone reached so far"""
+        return {
+            f"{name}_ms": round((self.marks[name] - self.start) * 1000, 1)
+            for name in self.MILESTONES if name in self.marks
+        }
+
+    def log_report(self) -> None:
+        """Log the report once, as a single JSON line easy to grep and diff"""
+        if self._reported:
+            return
+        self._reported = True
+        logger.info("startup %s", json.dumps(self.report()))
+
+startup_timer = StartupTimer()
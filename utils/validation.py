@@ -0,0 +1,28 @@
+"""Rules a record must pass before it is saved, shared by the entry dialogs
+and the CSV importer. Each validator raises ValidationError with the
+message to show the user."""
+from typing import Any, Dict
+from .exceptions import ValidationError
+
+def validate_contact(contact: Dict[str, Any]) -> None:
+    if contact.get('contact_type') == 'Company' and not contact.get('company_name'):
+        raise ValidationError("Company name is required")
+    if not contact.get('first_name'):
+        raise ValidationError("First name is required")
+    if not contact.get('last_name'):
+        raise ValidationError("Last name is required")
+
+def validate_policy(policy: Dict[str, Any]) -> None:
+    if not policy.get('contact_id'):
+        raise ValidationError("Contact is required")
+    if not policy.get('policy_number'):
+        raise ValidationError("Policy number is required")
+    if not policy.get('carrier'):
+        raise ValidationError("Carrier is required")
+    # ISO dates compare correctly as strings
+    if policy['start_date'] > policy['renewal_date']:
+        raise ValidationError("Start date must be before renewal date")
+
+def validate_communication(communication: Dict[str, Any]) -> None:
+    if not communication.get('details'):
+        raise ValidationError("Please enter communication details")